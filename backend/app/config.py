@@ -22,6 +22,15 @@ class Settings(BaseSettings):
     S3_ACCESS_KEY: str
     S3_SECRET_KEY: str
     S3_BUCKET_NAME: str
+    # Shared, pooled client + TransferManager tuning (see app/services/object_storage.py)
+    S3_MAX_POOL_CONNECTIONS: int = 32
+    S3_MULTIPART_THRESHOLD_MB: int = 8
+    S3_MULTIPART_CHUNK_MB: int = 8
+    S3_TRANSFER_MAX_CONCURRENCY: int = 4
+
+    # Async Celery runtime (app/worker/async_runtime.py): per-worker asyncpg pool
+    CELERY_ASYNC_DB_POOL_SIZE: int = 10
+    CELERY_ASYNC_DB_MAX_OVERFLOW: int = 5
 
     GOOGLE_SEARCH_API_KEY: str
     GOOGLE_SEARCH_CX: str
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Body
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Body, Query
 from sqlalchemy import text, select, desc, update
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import uuid
 
 from app.database import SessionLocal 
@@ -48,16 +48,49 @@ def list_artifacts(db: Session = Depends(get_sync_db)):
         for a in artifacts
     ]
 
-def run_ingestion_task(exam_code: str = "GLOBAL"):
+def _serialize_run(run: IngestionRun):
+    return {
+        "run_id": str(run.run_id),
+        "artifact_id": str(run.artifact_id),
+        "exam_code": run.exam_code,
+        "status": run.status,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+        "completed_at": run.completed_at.isoformat() if run.completed_at else None,
+        "stats": run.stats or {},
+    }
+
+@router.get("/runs")
+def list_ingestion_runs(
+    exam_code: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_sync_db),
+):
+    """Recent runs with their flight-recorder stats (stage timings, throughput, cache hit rates)."""
+    stmt = select(IngestionRun).order_by(desc(IngestionRun.started_at)).limit(limit)
+    if exam_code:
+        stmt = stmt.where(IngestionRun.exam_code == exam_code)
+    return [_serialize_run(run) for run in db.execute(stmt).scalars().all()]
+
+@router.get("/runs/{run_id}")
+def get_ingestion_run(run_id: uuid.UUID, db: Session = Depends(get_sync_db)):
+    run = db.get(IngestionRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Ingestion run not found")
+    return _serialize_run(run)
+
+def run_ingestion_task(exam_code: str = "GLOBAL", parallel: bool = False, profile: bool = False):
     db = SessionLocal()
     lock_key = f"INGESTION:{exam_code}"
     locked = False 
     try:
         if LockService.acquire_lock(db, lock_key):
             locked = True
-            processor = ArtifactProcessor(db)
+            processor = ArtifactProcessor(db, profile=profile)
             target_exam = exam_code if exam_code != "GLOBAL" else None
-            processor.process_approved_artifacts(specific_exam=target_exam)
+            if parallel:
+                processor.process_approved_artifacts_parallel(specific_exam=target_exam)
+            else:
+                processor.process_approved_artifacts(specific_exam=target_exam)
         else:
             print(f"🔒 Ingestion Locked for {exam_code}. Skipping run.")
             return
@@ -71,6 +104,8 @@ def run_ingestion_task(exam_code: str = "GLOBAL"):
 def approve_batch_artifacts(
     background_tasks: BackgroundTasks, 
     artifact_ids: List[uuid.UUID] = Body(..., embed=True),
+    parallel: bool = False,
+    profile: bool = False,
     db: Session = Depends(get_sync_db),
     _ = Depends(require_role(AdminRole.EDITOR)) # <--- Guard
 ):
@@ -97,13 +132,15 @@ def approve_batch_artifacts(
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
     
-    background_tasks.add_task(run_ingestion_task, "GLOBAL")
+    background_tasks.add_task(run_ingestion_task, "GLOBAL", parallel, profile)
     return {"status": "success", "message": f"Queued {count} artifacts for immediate ingestion."}
 
 # [SECURE] Write Action -> Requires EDITOR
 @router.post("/apply-dirty")
 def trigger_dirty_update(
     background_tasks: BackgroundTasks, 
+    parallel: bool = False,
+    profile: bool = False,
     db: Session = Depends(get_sync_db),
     _ = Depends(require_role(AdminRole.EDITOR)) # <--- Guard
 ):
@@ -116,5 +153,5 @@ def trigger_dirty_update(
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
     
-    background_tasks.add_task(run_ingestion_task, "GLOBAL")
+    background_tasks.add_task(run_ingestion_task, "GLOBAL", parallel, profile)
     return {"status": "Job Queued", "message": "Ingestion triggered for dirty artifacts."}
\ No newline at end of file
@@ -50,6 +50,8 @@ class LocationBulkDispatchRequest(BaseModel):
         description="Max 200 items per batch to prevent Celery queue saturation."
     )
     force: bool = False
+    # Set-based dispatch + batch tasks paced by the global provider token bucket.
+    batch: bool = True
 
 @router.get("/colleges")
 def get_location_colleges(
@@ -115,7 +117,8 @@ def dispatch_bulk_location_ingestion(
         college_ids=req.college_ids,
         admin_id=current_admin.id,
         admin_username=current_admin.username,
-        force=req.force
+        force=req.force,
+        batch=req.batch
     )
 
 @router.get("/status")
@@ -13,7 +13,8 @@ from app.models import (
     College, CollegeLocation, CollegeLocationCandidate, 
     LocationStatusEnum, LocationDispatchLock, LocationIngestionTracker, AdminAuditTrail
 )
-from ingestion.location_pipeline.tasks import ingest_college_location_task
+from ingestion.common.config import LOCATION_BATCH_SIZE
+from ingestion.location_pipeline.tasks import ingest_college_location_task, ingest_college_location_batch_task
 from app.domains.student_portal.college_filter_tool.services.college_filter_rebuild_dispatcher import (
     CollegeFilterRebuildMode,
     CollegeFilterRebuildRequest,
@@ -84,11 +85,15 @@ class LocationGovernanceService:
         ingest_college_location_task.delay(
             college_id=str(college_id), 
             canonical_name=college.canonical_name,
-            state_code=college.state_code or ""
+            state_code=college.state_code or "",
+            force=force
         )
         return {"message": "Location Ingestion Dispatched"}
 
-    def dispatch_bulk_ingestion(self, db: Session, college_ids: List[UUID], admin_id: UUID, admin_username: str, force: bool = False):
+    def dispatch_bulk_ingestion(self, db: Session, college_ids: List[UUID], admin_id: UUID, admin_username: str, force: bool = False, batch: bool = False):
+        if batch:
+            return self._dispatch_bulk_batched(db, college_ids, admin_id, admin_username, force)
+
         summary = {"queued": 0, "skipped_locked": 0, "skipped_exhausted": 0, "errors": 0}
         for cid in college_ids:
             try:
@@ -109,6 +114,94 @@ class LocationGovernanceService:
             )
         return summary
 
+    def _dispatch_bulk_batched(self, db: Session, college_ids: List[UUID], admin_id: UUID, admin_username: str, force: bool):
+        """
+        Set-based bulk dispatch: locks, tracker checks and audit rows for the whole
+        selection in one transaction, then one batch task per LOCATION_BATCH_SIZE colleges.
+        """
+        summary = {"queued": 0, "skipped_locked": 0, "skipped_exhausted": 0, "errors": 0, "batches": 0}
+        requested = list(dict.fromkeys(college_ids))
+
+        try:
+            colleges = {
+                row.college_id: row
+                for row in db.execute(
+                    select(College.college_id, College.canonical_name, College.state_code)
+                    .where(College.college_id.in_(requested))
+                )
+            }
+            summary["errors"] += len(requested) - len(colleges)
+
+            exhausted = set()
+            if not force:
+                exhausted = set(db.scalars(
+                    select(LocationIngestionTracker.college_id).where(
+                        LocationIngestionTracker.college_id.in_(list(colleges)),
+                        LocationIngestionTracker.is_exhausted == True
+                    )
+                ))
+                summary["skipped_exhausted"] = len(exhausted)
+
+            candidates = [cid for cid in colleges if cid not in exhausted]
+            locked = set()
+            if candidates:
+                locked_by = f"admin:{admin_username}"
+                lock_stmt = insert(LocationDispatchLock).values([
+                    {"college_id": cid, "locked_by": locked_by, "expires_at": func.now() + text("interval '15 minutes'")}
+                    for cid in candidates
+                ])
+                update_dict = {'locked_by': lock_stmt.excluded.locked_by, 'expires_at': lock_stmt.excluded.expires_at}
+                if force:
+                    lock_stmt = lock_stmt.on_conflict_do_update(index_elements=['college_id'], set_=update_dict)
+                else:
+                    lock_stmt = lock_stmt.on_conflict_do_update(
+                        index_elements=['college_id'], set_=update_dict,
+                        where=(LocationDispatchLock.expires_at < func.now())
+                    )
+                locked = set(db.scalars(lock_stmt.returning(LocationDispatchLock.college_id)))
+                summary["skipped_locked"] = len(candidates) - len(locked)
+
+            if locked and force:
+                db.execute(
+                    insert(LocationIngestionTracker)
+                    .values([{"college_id": cid, "attempt_count": 0, "is_exhausted": False} for cid in locked])
+                    .on_conflict_do_update(index_elements=['college_id'], set_={'attempt_count': 0, 'is_exhausted': False})
+                )
+
+            db.add_all([
+                AdminAuditTrail(
+                    admin_id=admin_id, action="FORCE_DISPATCH_LOCATION" if force else "DISPATCH_LOCATION",
+                    target_resource=str(cid), details={"force": force, "batch": True}
+                )
+                for cid in locked
+            ])
+            db.commit()
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Batched location dispatch transaction failed: {str(e)}")
+            raise HTTPException(status_code=500, detail="Database transaction failed.")
+
+        payload = [
+            {
+                "college_id": str(cid),
+                "canonical_name": colleges[cid].canonical_name,
+                "state_code": colleges[cid].state_code or "",
+            }
+            for cid in requested if cid in locked
+        ]
+        for start in range(0, len(payload), LOCATION_BATCH_SIZE):
+            ingest_college_location_batch_task.delay(colleges=payload[start:start + LOCATION_BATCH_SIZE], force=force)
+            summary["batches"] += 1
+        summary["queued"] = len(payload)
+
+        if summary["queued"] == 0 and len(requested) > 0:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"No tasks queued. Locked: {summary['skipped_locked']}, Exhausted: {summary['skipped_exhausted']}, Errors: {summary['errors']}."
+            )
+        return summary
+
     def triage_location(self, db: Session, college_id: UUID, candidate_id: UUID, action: str, admin_id: UUID, overrides: dict = None):
         action = action.upper()
         try:
@@ -117,7 +117,7 @@ class MediaGovernanceService:
 
         ingest_college_media_task.delay(
             college_id=str(college_id), canonical_name=college.canonical_name,
-            city=college.city or "India", media_type_str=media_type.value
+            city=college.city or "India", media_type_str=media_type.value, force=force
         )
         return {"message": "Ingestion Dispatched", "media_type": media_type.value}
 
@@ -7,6 +7,7 @@ import httpx
 from authlib.jose import JsonWebKey, jwt as authlib_jwt
 from fastapi import HTTPException, status
 
+from app.services.http_clients import HttpClientProfile, http_client_registry
 from app.domains.student_auth.config.student_auth_config import student_auth_settings
 from app.domains.student_auth.schemas.student_auth_schemas import (
     StudentAuthProviderDTO,
@@ -14,6 +15,21 @@ from app.domains.student_auth.schemas.student_auth_schemas import (
 )
 
 
+GOOGLE_HTTP_CLIENT_PROFILE = "google_oauth"
+FACEBOOK_HTTP_CLIENT_PROFILE = "facebook_oauth"
+
+for _profile_name in (GOOGLE_HTTP_CLIENT_PROFILE, FACEBOOK_HTTP_CLIENT_PROFILE):
+    http_client_registry.register(
+        HttpClientProfile(
+            name=_profile_name,
+            timeout=httpx.Timeout(15.0),
+            max_connections=20,
+            max_keepalive_connections=10,
+            http2=True,
+        )
+    )
+
+
 class OAuthProviderAdapter(Protocol):
     provider: StudentAuthProviderEnum
     display_label: str
@@ -85,14 +101,14 @@ class GoogleOAuthProvider:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
-                    student_auth_settings.GOOGLE_TOKEN_ENDPOINT,
-                    data=payload,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-                response.raise_for_status()
-                return response.json()
+            client = http_client_registry.get(GOOGLE_HTTP_CLIENT_PROFILE)
+            response = await client.post(
+                student_auth_settings.GOOGLE_TOKEN_ENDPOINT,
+                data=payload,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as exc:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
@@ -110,13 +126,13 @@ class GoogleOAuthProvider:
         access_token: str,
     ) -> dict[str, Any]:
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    student_auth_settings.GOOGLE_USERINFO_ENDPOINT,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                )
-                response.raise_for_status()
-                return response.json()
+            client = http_client_registry.get(GOOGLE_HTTP_CLIENT_PROFILE)
+            response = await client.get(
+                student_auth_settings.GOOGLE_USERINFO_ENDPOINT,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as exc:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
@@ -135,10 +151,10 @@ class GoogleOAuthProvider:
         expected_nonce: str,
     ) -> dict[str, Any]:
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(student_auth_settings.GOOGLE_JWKS_URI)
-                response.raise_for_status()
-                jwks = response.json()
+            client = http_client_registry.get(GOOGLE_HTTP_CLIENT_PROFILE)
+            response = await client.get(student_auth_settings.GOOGLE_JWKS_URI)
+            response.raise_for_status()
+            jwks = response.json()
         except httpx.HTTPStatusError as exc:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
@@ -229,14 +245,14 @@ class FacebookOAuthProvider:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
-                    student_auth_settings.FACEBOOK_TOKEN_ENDPOINT,
-                    data=payload,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-                response.raise_for_status()
-                return response.json()
+            client = http_client_registry.get(FACEBOOK_HTTP_CLIENT_PROFILE)
+            response = await client.post(
+                student_auth_settings.FACEBOOK_TOKEN_ENDPOINT,
+                data=payload,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as exc:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
@@ -254,13 +270,13 @@ class FacebookOAuthProvider:
         access_token: str,
     ) -> dict[str, Any]:
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    student_auth_settings.FACEBOOK_USERINFO_ENDPOINT,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                )
-                response.raise_for_status()
-                return response.json()
+            client = http_client_registry.get(FACEBOOK_HTTP_CLIENT_PROFILE)
+            response = await client.get(
+                student_auth_settings.FACEBOOK_USERINFO_ENDPOINT,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as exc:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import io
 
-import boto3
-from botocore.client import Config
 from fastapi import HTTPException, UploadFile, status
 from fastapi.concurrency import run_in_threadpool
 from PIL import Image, ImageOps
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import StudentUser
+from app.services.object_storage import ObjectStorage, get_s3_client
 from app.domains.student_auth.config.student_auth_config import student_auth_settings
 
 
@@ -31,14 +30,16 @@ class StudentProfileImageService:
     """
 
     CANONICAL_OBJECT_NAME = "avatar.webp"
+    UPLOAD_READ_CHUNK_BYTES = 64 * 1024
 
     def __init__(self) -> None:
-        self._s3_client = boto3.client(
-            "s3",
-            endpoint_url=student_auth_settings.S3_ENDPOINT_URL,
-            aws_access_key_id=student_auth_settings.S3_ACCESS_KEY,
-            aws_secret_access_key=student_auth_settings.S3_SECRET_KEY,
-            config=Config(signature_version="s3v4"),
+        self._storage = ObjectStorage(
+            student_auth_settings.S3_BUCKET_NAME,
+            get_s3_client(
+                student_auth_settings.S3_ENDPOINT_URL,
+                student_auth_settings.S3_ACCESS_KEY,
+                student_auth_settings.S3_SECRET_KEY,
+            ),
         )
 
     def build_storage_key(
@@ -82,19 +83,13 @@ class StudentProfileImageService:
                 detail="Unsupported profile image type. Allowed types: jpeg, png, webp.",
             )
 
-        raw_bytes = await upload_file.read()
+        raw_bytes = await self._read_capped(upload_file)
         if not raw_bytes:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Uploaded profile image is empty.",
             )
 
-        if len(raw_bytes) > student_auth_settings.STUDENT_PROFILE_IMAGE_MAX_BYTES:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Profile image exceeds maximum allowed size of 5 MB.",
-            )
-
         final_webp_bytes = await run_in_threadpool(
             self._normalize_to_webp,
             raw_bytes=raw_bytes,
@@ -103,10 +98,11 @@ class StudentProfileImageService:
         storage_key = self.build_storage_key(student_user_id=str(student.id))
 
         try:
-            await run_in_threadpool(
-                self._put_object,
-                storage_key=storage_key,
-                body=final_webp_bytes,
+            await self._storage.aupload_fileobj(
+                io.BytesIO(final_webp_bytes),
+                storage_key,
+                "image/webp",
+                cache_control="no-cache",
             )
         except Exception as exc:
             raise HTTPException(
@@ -132,19 +128,23 @@ class StudentProfileImageService:
             cache_buster=str(student.profile_image_version),
         )
 
-    def _put_object(
+    async def _read_capped(
         self,
-        *,
-        storage_key: str,
-        body: bytes,
-    ) -> None:
-        self._s3_client.put_object(
-            Bucket=student_auth_settings.S3_BUCKET_NAME,
-            Key=storage_key,
-            Body=body,
-            ContentType="image/webp",
-            CacheControl="no-cache",
-        )
+        upload_file: UploadFile,
+    ) -> bytes:
+        max_bytes = student_auth_settings.STUDENT_PROFILE_IMAGE_MAX_BYTES
+        buffer = bytearray()
+
+        # Chunked read: an oversized body is rejected at the limit, not after buffering it whole.
+        while chunk := await upload_file.read(self.UPLOAD_READ_CHUNK_BYTES):
+            buffer.extend(chunk)
+            if len(buffer) > max_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Profile image exceeds maximum allowed size of 5 MB.",
+                )
+
+        return bytes(buffer)
 
     def resolve_active_profile_image_url(
         self,
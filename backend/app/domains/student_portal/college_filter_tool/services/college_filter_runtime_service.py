@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_UP
 from time import perf_counter
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -260,6 +260,9 @@ class CollegeFilterRuntimeService:
         self.band_classifier = BandClassifier()
         self.best_fit_sort_service = BestFitSortService()
         self.band_pagination_service = BandPaginationService()
+        # Stage timings + cache status of the most recent search() call on this
+        # instance. Mirrors the structured log lines; read by the search benchmark.
+        self.last_search_timings: Dict[str, Any] = {}
 
     async def search(
         self,
@@ -268,6 +271,7 @@ class CollegeFilterRuntimeService:
     ) -> CollegeFilterSearchResponse:
         total_started_at = perf_counter()
         cache_status = "miss"
+        self.last_search_timings = {}
 
         fingerprint = college_filter_search_snapshot_cache_service.build_fingerprint(
             path_id=str(request.path_id),
@@ -351,6 +355,12 @@ class CollegeFilterRuntimeService:
             total_search_ms,
         )
 
+        self.last_search_timings.update(
+            cache_status=cache_status,
+            pagination_ms=pagination_ms,
+            total_search_ms=total_search_ms,
+        )
+
         return response
 
     # ======================================================
@@ -467,6 +477,15 @@ class CollegeFilterRuntimeService:
             len(snapshot.suggested_sorted),
         )
 
+        self.last_search_timings.update(
+            path_validation_ms=path_validation_ms,
+            primary_query_ms=primary_query_ms,
+            primary_scoring_ms=primary_scoring_ms,
+            suggested_query_ms=suggested_query_ms,
+            suggested_scoring_ms=suggested_scoring_ms,
+            sorting_ms=sorting_ms,
+        )
+
         return snapshot
 
     # ======================================================
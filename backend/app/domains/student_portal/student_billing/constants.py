@@ -36,6 +36,8 @@ BILLING_RECONCILIATION_SWEEP_TASK = (
 BILLING_RECONCILIATION_SWEEP_LIMIT = 100
 BILLING_RECONCILIATION_STALE_ORDER_MINUTES = 30
 BILLING_RECONCILIATION_BEAT_MINUTES = 10
+# Candidates reconciled at once per sweep, each on its own session (<= async pool size)
+BILLING_RECONCILIATION_CONCURRENCY = 8
 
 
 # --- College Filter search credit consumption constants ---
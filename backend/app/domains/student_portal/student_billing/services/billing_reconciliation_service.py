@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Awaitable, Callable
 from uuid import UUID
 
 from sqlalchemy import and_, outerjoin, select
@@ -21,6 +22,7 @@ from app.models import (
 )
 from app.domains.student_portal.student_billing.constants import (
     BILLING_CREATED_BY_RECONCILIATION,
+    BILLING_RECONCILIATION_CONCURRENCY,
     BILLING_REFERENCE_TYPE_PAYMENT_ORDER,
 )
 from app.domains.student_portal.student_billing.exceptions import (
@@ -41,6 +43,9 @@ logger = logging.getLogger(__name__)
 
 RECONCILIATION_GATEWAY_EVENT_TYPE = "reconciliation.order.paid"
 
+# Outcome when a skip_locked claim finds the row held by another sweep / webhook.
+CLAIMED_ELSEWHERE = "skipped_claimed_elsewhere"
+
 
 class BillingReconciliationService:
     """
@@ -127,81 +132,125 @@ class BillingReconciliationService:
     async def run_reconciliation_sweep(
         self,
         *,
-        db: AsyncSession,
+        session_factory: Callable[[], AsyncSession],
         older_than_minutes: int = 30,
         limit: int = 100,
+        concurrency: int = BILLING_RECONCILIATION_CONCURRENCY,
     ) -> dict[str, int]:
-        stale_orders = await self.find_stale_non_final_orders(
-            db=db,
-            older_than_minutes=older_than_minutes,
-            limit=limit,
-        )
-        failed_verified_webhooks = await self.find_failed_verified_webhook_events(
-            db=db,
-            limit=limit,
-        )
-        settled_missing_ledger = await self.find_settled_orders_missing_ledger_grant(
-            db=db,
-            limit=limit,
-        )
+        """
+        Bounded-concurrency sweep.
+
+        Candidates are discovered on one short-lived session; each one is then
+        reconciled on its own session, at most `concurrency` at a time. Rows are
+        claimed with FOR UPDATE SKIP LOCKED, so overlapping sweeps (several billing
+        workers, or a sweep outliving its beat interval) split the backlog instead
+        of queueing behind each other's locks.
+        """
+        async with session_factory() as db:
+            stale_order_ids = [
+                order.id
+                for order in await self.find_stale_non_final_orders(
+                    db=db,
+                    older_than_minutes=older_than_minutes,
+                    limit=limit,
+                )
+            ]
+            failed_webhook_ids = [
+                event.id
+                for event in await self.find_failed_verified_webhook_events(
+                    db=db,
+                    limit=limit,
+                )
+            ]
+            missing_ledger_order_ids = [
+                order.id
+                for order in await self.find_settled_orders_missing_ledger_grant(
+                    db=db,
+                    limit=limit,
+                )
+            ]
 
         summary = {
-            "stale_orders_seen": len(stale_orders),
-            "failed_verified_webhooks_seen": len(failed_verified_webhooks),
-            "missing_ledger_grants_seen": len(settled_missing_ledger),
+            "stale_orders_seen": len(stale_order_ids),
+            "failed_verified_webhooks_seen": len(failed_webhook_ids),
+            "missing_ledger_grants_seen": len(missing_ledger_order_ids),
             "stale_orders_repaired": 0,
             "failed_verified_webhooks_repaired": 0,
             "missing_ledger_grants_repaired": 0,
+            "claimed_elsewhere": 0,
             "failures": 0,
         }
 
-        for order in stale_orders:
-            try:
-                outcome = await self.reconcile_stale_non_final_order(
-                    db=db,
-                    payment_order_id=order.id,
-                )
-                if outcome.startswith("repaired") or outcome.startswith("settled") or outcome.startswith("marked_expired"):
-                    summary["stale_orders_repaired"] += 1
-            except Exception:
-                summary["failures"] += 1
-                logger.exception(
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_isolated(
+            handler: Callable[..., Awaitable[str]],
+            id_kwarg: str,
+            item_id: UUID,
+            failure_message: str,
+        ) -> str | None:
+            async with semaphore:
+                async with session_factory() as item_db:
+                    try:
+                        return await handler(db=item_db, skip_locked=True, **{id_kwarg: item_id})
+                    except Exception:
+                        logger.exception(failure_message, item_id)
+                        await item_db.rollback()
+                        return None
+
+        stale_outcomes, webhook_outcomes, ledger_outcomes = await asyncio.gather(
+            asyncio.gather(*(
+                run_isolated(
+                    self.reconcile_stale_non_final_order,
+                    "payment_order_id",
+                    order_id,
                     "Billing reconciliation failed for stale payment order %s.",
-                    order.id,
-                )
-                await db.rollback()
-
-        for webhook_event in failed_verified_webhooks:
-            try:
-                outcome = await self.retry_failed_verified_webhook_event(
-                    db=db,
-                    webhook_event_id=webhook_event.id,
                 )
-                if outcome == "repaired_failed_verified_webhook":
-                    summary["failed_verified_webhooks_repaired"] += 1
-            except Exception:
-                summary["failures"] += 1
-                logger.exception(
+                for order_id in stale_order_ids
+            )),
+            asyncio.gather(*(
+                run_isolated(
+                    self.retry_failed_verified_webhook_event,
+                    "webhook_event_id",
+                    event_id,
                     "Billing reconciliation failed for verified webhook event %s.",
-                    webhook_event.id,
-                )
-                await db.rollback()
-
-        for order in settled_missing_ledger:
-            try:
-                outcome = await self.repair_settled_order_missing_ledger_grant(
-                    db=db,
-                    payment_order_id=order.id,
                 )
-                if outcome.startswith("repaired") or outcome == "already_consistent":
-                    summary["missing_ledger_grants_repaired"] += 1
-            except Exception:
-                summary["failures"] += 1
-                logger.exception(
+                for event_id in failed_webhook_ids
+            )),
+            asyncio.gather(*(
+                run_isolated(
+                    self.repair_settled_order_missing_ledger_grant,
+                    "payment_order_id",
+                    order_id,
                     "Billing reconciliation failed for settled order missing ledger grant %s.",
-                    order.id,
                 )
-                await db.rollback()
+                for order_id in missing_ledger_order_ids
+            )),
+        )
+
+        for outcome in stale_outcomes:
+            if outcome is None:
+                summary["failures"] += 1
+            elif outcome == CLAIMED_ELSEWHERE:
+                summary["claimed_elsewhere"] += 1
+            elif outcome.startswith("repaired") or outcome.startswith("settled") or outcome.startswith("marked_expired"):
+                summary["stale_orders_repaired"] += 1
+
+        for outcome in webhook_outcomes:
+            if outcome is None:
+                summary["failures"] += 1
+            elif outcome == CLAIMED_ELSEWHERE:
+                summary["claimed_elsewhere"] += 1
+            elif outcome == "repaired_failed_verified_webhook":
+                summary["failed_verified_webhooks_repaired"] += 1
+
+        for outcome in ledger_outcomes:
+            if outcome is None:
+                summary["failures"] += 1
+            elif outcome == CLAIMED_ELSEWHERE:
+                summary["claimed_elsewhere"] += 1
+            elif outcome.startswith("repaired") or outcome == "already_consistent":
+                summary["missing_ledger_grants_repaired"] += 1
 
         return summary
 
@@ -210,12 +259,16 @@ class BillingReconciliationService:
         *,
         db: AsyncSession,
         payment_order_id: UUID,
+        skip_locked: bool = False,
     ) -> str:
         try:
             payment_order = await self._load_order_for_update(
                 db=db,
                 payment_order_id=payment_order_id,
+                skip_locked=skip_locked,
             )
+            if payment_order is None:
+                return CLAIMED_ELSEWHERE
 
             if payment_order.status == PaymentOrderStatus.SETTLED:
                 return "already_terminal_settled"
@@ -274,14 +327,17 @@ class BillingReconciliationService:
         *,
         db: AsyncSession,
         webhook_event_id: UUID,
+        skip_locked: bool = False,
     ) -> str:
-        result = await db.execute(
-            select(PaymentWebhookEvent).where(PaymentWebhookEvent.id == webhook_event_id)
-        )
+        statement = select(PaymentWebhookEvent).where(PaymentWebhookEvent.id == webhook_event_id)
+        if skip_locked:
+            statement = statement.with_for_update(skip_locked=True)
+
+        result = await db.execute(statement)
         webhook_event = result.scalar_one_or_none()
 
         if webhook_event is None:
-            return "missing_webhook_event"
+            return CLAIMED_ELSEWHERE if skip_locked else "missing_webhook_event"
 
         if not webhook_event.signature_verified:
             return "skipped_unverified_webhook"
@@ -300,13 +356,17 @@ class BillingReconciliationService:
         *,
         db: AsyncSession,
         payment_order_id: UUID,
+        skip_locked: bool = False,
     ) -> str:
         try:
             payment_order = await self._load_order_for_update(
                 db=db,
                 payment_order_id=payment_order_id,
                 include_transactions=True,
+                skip_locked=skip_locked,
             )
+            if payment_order is None:
+                return CLAIMED_ELSEWHERE
 
             if payment_order.status != PaymentOrderStatus.SETTLED:
                 return "skipped_order_not_settled"
@@ -359,7 +419,12 @@ class BillingReconciliationService:
         db: AsyncSession,
         payment_order_id: UUID,
         include_transactions: bool = False,
-    ) -> PaymentOrder:
+        skip_locked: bool = False,
+    ) -> PaymentOrder | None:
+        """
+        Row-locks the order. With skip_locked=True a row held by another transaction
+        returns None instead of blocking (the caller reports it as claimed elsewhere).
+        """
         options = [selectinload(PaymentOrder.credit_package)]
         if include_transactions:
             options.append(selectinload(PaymentOrder.payment_transactions))
@@ -368,10 +433,12 @@ class BillingReconciliationService:
             select(PaymentOrder)
             .options(*options)
             .where(PaymentOrder.id == payment_order_id)
-            .with_for_update()
+            .with_for_update(skip_locked=skip_locked)
         )
         payment_order = result.scalar_one_or_none()
         if payment_order is None:
+            if skip_locked:
+                return None
             raise StudentBillingError(
                 "Payment order could not be reloaded for reconciliation."
             )
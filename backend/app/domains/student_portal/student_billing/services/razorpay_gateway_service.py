@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
@@ -7,6 +8,7 @@ from typing import Any
 
 import httpx
 
+from app.services.http_clients import HttpClientProfile, http_client_registry
 from app.domains.student_portal.student_billing.config.student_billing_config import (
     student_billing_settings,
 )
@@ -30,8 +32,24 @@ class RazorpayGatewayService:
     - only external gateway communication + payload normalization
     """
 
+    HTTP_CLIENT_PROFILE = "razorpay"
+
     def __init__(self) -> None:
         self._settings = student_billing_settings
+        http_client_registry.register(
+            HttpClientProfile(
+                name=self.HTTP_CLIENT_PROFILE,
+                base_url=self._settings.razorpay_api_base_url_normalized,
+                headers={
+                    "Authorization": self._auth_header,
+                    "Content-Type": "application/json",
+                },
+                timeout=httpx.Timeout(15.0, connect=10.0),
+                max_connections=20,
+                max_keepalive_connections=10,
+                http2=True,
+            )
+        )
 
     @property
     def _auth_header(self) -> str:
@@ -49,27 +67,19 @@ class RazorpayGatewayService:
         json_payload: dict[str, Any] | None = None,
         query_params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        timeout = httpx.Timeout(15.0, connect=10.0)
-
-        async with httpx.AsyncClient(
-            base_url=self._settings.razorpay_api_base_url_normalized,
-            timeout=timeout,
-            headers={
-                "Authorization": self._auth_header,
-                "Content-Type": "application/json",
-            },
-        ) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=path,
-                    json=json_payload,
-                    params=query_params,
-                )
-            except httpx.HTTPError as exc:
-                raise StudentBillingError(
-                    f"Razorpay request failed for {method.upper()} {path}."
-                ) from exc
+        client = http_client_registry.get(self.HTTP_CLIENT_PROFILE)
+
+        try:
+            response = await client.request(
+                method=method,
+                url=path,
+                json=json_payload,
+                params=query_params,
+            )
+        except httpx.HTTPError as exc:
+            raise StudentBillingError(
+                f"Razorpay request failed for {method.upper()} {path}."
+            ) from exc
 
         if response.status_code >= 400:
             raise StudentBillingError(
@@ -176,8 +186,10 @@ class RazorpayGatewayService:
         *,
         gateway_order_id: str,
     ) -> dict[str, Any]:
-        order = await self.fetch_order(gateway_order_id=gateway_order_id)
-        payments = await self.fetch_payments_for_order(gateway_order_id=gateway_order_id)
+        order, payments = await asyncio.gather(
+            self.fetch_order(gateway_order_id=gateway_order_id),
+            self.fetch_payments_for_order(gateway_order_id=gateway_order_id),
+        )
 
         return {
             "order": order,
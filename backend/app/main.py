@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 from app.database import async_engine as engine
 from app.config import settings
+from app.services.http_clients import http_client_registry
 
 # --- CHANGED IMPORTS ---
 from app.domains.admin_portal.routers import (
@@ -63,6 +64,14 @@ app.include_router(student_account_router.router)
 app.include_router(student_billing_router)
 app.include_router(student_billing_webhook_router)
 
+@app.on_event("startup")
+async def open_http_clients():
+    await http_client_registry.startup()
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    await http_client_registry.aclose()
+
 @app.get("/")
 async def root():
     return {"message": "Derived Campus API is Online"}
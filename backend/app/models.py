@@ -434,6 +434,36 @@ class ExamConfiguration(Base):
     )
 
 
+
+class SeedPageValidator(Base):
+    """
+    Conditional-fetch state for scanner seed pages (one row per exam, year and seed URL).
+    Written only after a clean scan, so an unchanged page never hides a failed one.
+    """
+    __tablename__ = "seed_page_validators"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    exam_code = Column(String(32), nullable=False)
+    year = Column(Integer, nullable=False)
+    seed_url = Column(Text, nullable=False)
+
+    # HTTP validators echoed back as If-None-Match / If-Modified-Since
+    etag = Column(String(255), nullable=True)
+    last_modified = Column(String(64), nullable=True)
+    # sha256 of the body, for servers that ignore conditional requests
+    body_hash = Column(String(64), nullable=False)
+
+    last_full_scan_at = Column(DateTime(timezone=True), nullable=False)
+    last_checked_at = Column(DateTime(timezone=True), nullable=False)
+    unchanged_skip_count = Column(Integer, default=0, server_default=text('0'), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("exam_code", "year", "seed_url", name="uq_seed_page_validator_identity"),
+    )
+
 class IngestionRun(Base):
     """
     The Flight Recorder.
@@ -0,0 +1,101 @@
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]); profiles asking for it
+# silently fall back to HTTP/1.1 keep-alive when it is not installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+TransportFactory = Callable[["HttpClientProfile"], httpx.AsyncBaseTransport]
+
+
+@dataclass(frozen=True)
+class HttpClientProfile:
+    """Connection policy for one upstream provider."""
+    name: str
+    base_url: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    timeout: httpx.Timeout = field(default_factory=lambda: httpx.Timeout(15.0, connect=10.0))
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+
+class HttpClientRegistry:
+    """
+    Application-scoped pool of httpx.AsyncClient instances, one per provider profile.
+
+    Clients are keyed by (profile, running event loop): the API's loop and a Celery
+    worker's AsyncWorkerRuntime loop each get their own pooled connections, since an
+    AsyncClient's sockets cannot cross loops. FastAPI warms the clients at startup
+    and closes them at shutdown; anything else creates them lazily on first get().
+
+    Tests call use_transport(lambda profile: httpx.MockTransport(handler)) to route
+    every provider through a local mock without touching call sites.
+    """
+    def __init__(self):
+        self._profiles: Dict[str, HttpClientProfile] = {}
+        self._clients: Dict[Tuple[str, asyncio.AbstractEventLoop], httpx.AsyncClient] = {}
+        self._transport_factory: Optional[TransportFactory] = None
+
+    def register(self, profile: HttpClientProfile):
+        """Registers (or replaces) a profile. Existing clients keep their old policy until closed."""
+        self._profiles[profile.name] = profile
+
+    def use_transport(self, factory: Optional[TransportFactory]):
+        """Overrides the transport of clients created from now on (None restores the network)."""
+        self._transport_factory = factory
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get((name, loop))
+        if client is None or client.is_closed:
+            self._forget_closed_loops()
+            client = self._build(self._profiles[name])
+            self._clients[(name, loop)] = client
+        return client
+
+    def _forget_closed_loops(self):
+        # One-shot loops (asyncio.run in scripts) leave their clients behind otherwise.
+        for key in [key for key in self._clients if key[1].is_closed()]:
+            del self._clients[key]
+
+    def _build(self, profile: HttpClientProfile) -> httpx.AsyncClient:
+        transport = self._transport_factory(profile) if self._transport_factory else None
+        return httpx.AsyncClient(
+            base_url=profile.base_url,
+            headers=profile.headers,
+            timeout=profile.timeout,
+            limits=httpx.Limits(
+                max_connections=profile.max_connections,
+                max_keepalive_connections=profile.max_keepalive_connections,
+                keepalive_expiry=profile.keepalive_expiry,
+            ),
+            http2=profile.http2 and HTTP2_AVAILABLE,
+            transport=transport,
+        )
+
+    async def startup(self):
+        for name in self._profiles:
+            self.get(name)
+        logger.info(f"[HttpClients] Ready: {sorted(self._profiles)} (http2={'on' if HTTP2_AVAILABLE else 'off'})")
+
+    async def aclose(self):
+        """Closes the clients that belong to the current event loop."""
+        loop = asyncio.get_running_loop()
+        for key in [key for key in self._clients if key[1] is loop]:
+            client = self._clients.pop(key)
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"[HttpClients] Failed to close '{key[0]}': {type(e).__name__}: {e}")
+
+
+http_client_registry = HttpClientRegistry()
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import threading
+from typing import IO, Dict, Optional, Tuple
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.client import BaseClient
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+MISSING_OBJECT_CODES = ("404", "NoSuchKey", "NotFound")
+
+_clients: Dict[Tuple[str, str], BaseClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_s3_client(endpoint_url: str, access_key: str, secret_key: str) -> BaseClient:
+    """
+    Process-wide S3 client per (endpoint, access key).
+
+    botocore clients are thread-safe and own a urllib3 pool, so every caller in the
+    process (media ingestion, governance, profile images) shares sockets instead of
+    building a client + TLS handshake per service instance / Celery task.
+    """
+    cache_key = (endpoint_url, access_key)
+    client = _clients.get(cache_key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            # boto3.client() goes through the shared default Session, which is not thread-safe.
+            client = boto3.session.Session().client(
+                "s3",
+                endpoint_url=endpoint_url,
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                config=Config(
+                    # Enforce strict AWS Signature v4 for perfect MinIO compatibility
+                    signature_version="s3v4",
+                    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                    tcp_keepalive=True,
+                ),
+            )
+            _clients[cache_key] = client
+    return client
+
+
+class ObjectStorage:
+    """
+    Bucket-scoped upload layer over the shared client.
+
+    Uploads stream through the boto3 TransferManager: bodies above the multipart
+    threshold go up as parallel multipart parts, nothing is buffered whole.
+    Content-addressed keys can pass skip_if_exists=True to dedupe on a HEAD
+    instead of re-sending bytes the bucket already holds.
+    """
+    def __init__(self, bucket_name: str, client: BaseClient):
+        self.bucket_name = bucket_name
+        self.client = client
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD_MB * 1024 * 1024,
+            multipart_chunksize=settings.S3_MULTIPART_CHUNK_MB * 1024 * 1024,
+            max_concurrency=settings.S3_TRANSFER_MAX_CONCURRENCY,
+            use_threads=True,
+        )
+
+    def object_exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") in MISSING_OBJECT_CODES:
+                return False
+            raise
+
+    def upload_fileobj(
+        self,
+        fileobj: IO[bytes],
+        key: str,
+        content_type: str,
+        cache_control: Optional[str] = None,
+        skip_if_exists: bool = False,
+    ) -> bool:
+        """Streams fileobj to key. Returns False when skipped because the object already exists."""
+        if skip_if_exists and self.object_exists(key):
+            logger.info(f"[Storage] Object {key} already exists. Skipping upload.")
+            return False
+
+        extra_args = {"ContentType": content_type}
+        if cache_control:
+            extra_args["CacheControl"] = cache_control
+
+        self.client.upload_fileobj(
+            fileobj, self.bucket_name, key, ExtraArgs=extra_args, Config=self.transfer_config
+        )
+        return True
+
+    def upload_file(self, file_path: str, key: str, content_type: str, **kwargs) -> bool:
+        with open(file_path, "rb") as f:
+            return self.upload_fileobj(f, key, content_type, **kwargs)
+
+    def delete_object(self, key: str):
+        self.client.delete_object(Bucket=self.bucket_name, Key=key)
+
+    # --- Async API path: blocking transfers are offloaded to a worker thread ---
+    async def aupload_fileobj(self, fileobj: IO[bytes], key: str, content_type: str, **kwargs) -> bool:
+        return await asyncio.to_thread(self.upload_fileobj, fileobj, key, content_type, **kwargs)
@@ -1,7 +1,8 @@
 import uuid
 import re
 import logging
-from typing import Optional, Literal
+from functools import lru_cache
+from typing import Optional, Literal, Dict, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -28,16 +29,31 @@ class ResolutionResult:
 class RegistryService:
     """
     The Identity Authority.
+
+    Ingestion runs call load_alias_index() once per artifact: identity resolution
+    then becomes a dict lookup instead of one alias query per parsed row.
+    Without a loaded index, resolve_identity falls back to the per-call query.
     """
     JOSAA_SOURCE_TYPES = {"josaa_html", "josaa_pdf", "josaa"}
 
+    def __init__(self):
+        # normalized_alias -> (college_id, confidence)
+        self._alias_index: Optional[Dict[str, Tuple[uuid.UUID, float]]] = None
+        self._reported_misses: set = set()
+        self.index_lookups = 0
+        self.index_hits = 0
+
     @staticmethod
     def normalize_name(name: str, source_type: Optional[str] = None) -> str:
         if not name:
             return ""
+        return RegistryService._normalize_name_cached(str(name), str(source_type or ""))
 
-        raw = str(name).strip().lower()
-        source = str(source_type or "").strip().lower()
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _normalize_name_cached(name: str, source_type: str) -> str:
+        raw = name.strip().lower()
+        source = source_type.strip().lower()
 
         # JoSAA-specific normalization:
         # preserve the full institute identity; do not truncate at commas/brackets.
@@ -67,6 +83,35 @@ class RegistryService:
         return " ".join(normalized.split())
 
 
+    # --- INGESTION-TIME ALIAS INDEX ---
+    def load_alias_index(self, db: Session) -> int:
+        """Snapshots every approved alias with a single query. Returns the index size."""
+        rows = db.execute(
+            select(
+                CollegeAlias.alias_name,
+                CollegeAlias.college_id,
+                CollegeAlias.confidence_score,
+            ).where(CollegeAlias.is_approved == True)
+        ).all()
+
+        self._alias_index = {
+            alias_name: (college_id, float(confidence or 1.0))
+            for alias_name, college_id, confidence in rows
+        }
+        self._reported_misses = set()
+        self.index_lookups = 0
+        self.index_hits = 0
+        logger.info(f"Alias index loaded: {len(self._alias_index)} approved aliases.")
+        return len(self._alias_index)
+
+    @property
+    def alias_index_loaded(self) -> bool:
+        return self._alias_index is not None
+
+    def clear_alias_index(self):
+        self._alias_index = None
+        self._reported_misses = set()
+
     def resolve_identity(
         self, 
         db: Session, 
@@ -80,6 +125,9 @@ class RegistryService:
              logger.warning(f"[Run: {ingestion_run_id}] Identity Resolution Failed: Empty Name")
              return ResolutionResult(None, "QUARANTINED", 0.0, "Empty/Invalid Name")
 
+        if self._alias_index is not None:
+            return self._resolve_from_index(normalized, raw_name, ingestion_run_id)
+
         existing_alias = db.execute(
             select(CollegeAlias).where(
                 and_(
@@ -100,6 +148,25 @@ class RegistryService:
         logger.info(f"[Run: {ingestion_run_id}] Identity QUARANTINED: {raw_name} (Norm: {normalized})")
         return ResolutionResult(None, "QUARANTINED", 0.0, f"Unknown identity: {raw_name}")
 
+    def _resolve_from_index(self, normalized: str, raw_name: str, ingestion_run_id: uuid.UUID) -> ResolutionResult:
+        hit = self._alias_index.get(normalized)
+        self.index_lookups += 1
+        if hit:
+            self.index_hits += 1
+            college_id, confidence = hit
+            return ResolutionResult(
+                college_id=college_id,
+                outcome="MATCHED",
+                confidence=confidence,
+                reason=f"Alias Match: {normalized}"
+            )
+
+        # Misses repeat for every row of an unknown college; log each name once per run.
+        if normalized not in self._reported_misses:
+            self._reported_misses.add(normalized)
+            logger.info(f"[Run: {ingestion_run_id}] Identity QUARANTINED: {raw_name} (Norm: {normalized})")
+        return ResolutionResult(None, "QUARANTINED", 0.0, f"Unknown identity: {raw_name}")
+
 
     # --- ADMIN ACTIONS ---
     # UPDATED: Removed state_code argument
@@ -0,0 +1,148 @@
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Optional
+
+from celery.signals import worker_process_shutdown, worker_shutdown
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.services.http_clients import http_client_registry
+from app.worker.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWorkerRuntime:
+    """
+    One persistent event loop + asyncpg engine per Celery worker process.
+
+    The loop runs on a daemon thread. Celery task bodies (prefork child, or each
+    thread of a `-P threads` worker) submit coroutines to it and block on the result,
+    so every async task in the process shares one loop and one connection pool, and
+    concurrent tasks interleave their I/O instead of running one at a time.
+
+    The runtime starts lazily on the first submit()/session() in a process, so
+    workers that merely autodiscover async task modules (ingestion, bootstrap)
+    never spawn the loop thread or the engine. The engine is therefore always
+    created after fork and is disposed on the loop it was used on at shutdown.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[sessionmaker] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None and self._pid == os.getpid() and self._loop.is_running()
+
+    def start(self):
+        with self._lock:
+            if self.is_running:
+                return
+            # A runtime inherited through fork is dead weight: its thread did not survive.
+            self._loop = asyncio.new_event_loop()
+            self._pid = os.getpid()
+            self._engine = create_async_engine(
+                settings.DATABASE_URL,
+                pool_size=settings.CELERY_ASYNC_DB_POOL_SIZE,
+                max_overflow=settings.CELERY_ASYNC_DB_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                future=True,
+            )
+            self._session_factory = sessionmaker(
+                bind=self._engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+            )
+
+            started = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run_loop, args=(started,), name="celery-async-runtime", daemon=True
+            )
+            self._thread.start()
+            started.wait()
+            logger.info(f"[AsyncRuntime] Event loop started in worker pid={self._pid}.")
+
+    def _run_loop(self, started: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(started.set)
+        self._loop.run_forever()
+
+    def shutdown(self, timeout: float = 30):
+        with self._lock:
+            if not self.is_running:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(http_client_registry.aclose(), self._loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"[AsyncRuntime] HTTP client close failed: {type(e).__name__}: {e}")
+            try:
+                asyncio.run_coroutine_threadsafe(self._engine.dispose(), self._loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"[AsyncRuntime] Engine dispose failed: {type(e).__name__}: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._loop.close()
+            self._loop = self._thread = self._engine = self._session_factory = None
+            logger.info("[AsyncRuntime] Event loop stopped.")
+
+    def session(self) -> AsyncSession:
+        """AsyncSession bound to this worker's engine. Only valid inside run()."""
+        self.start()
+        return self._session_factory()
+
+    def submit(self, coro: Awaitable[Any]) -> Future:
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """Runs coro on the worker loop and blocks the calling task thread until it finishes."""
+        future = self.submit(coro)
+        try:
+            return future.result()
+        except BaseException:
+            # Soft time limits / worker termination: do not leave the coroutine running.
+            future.cancel()
+            raise
+
+
+async_runtime = AsyncWorkerRuntime()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_async_runtime(**_):
+    async_runtime.shutdown()
+
+
+def async_task(*task_args, **task_options) -> Callable:
+    """
+    Registers a coroutine function as a Celery task executed on the worker's
+    AsyncWorkerRuntime. Accepts the usual celery_app.task options (bind=True passes
+    the task instance as the first argument, as usual).
+
+        @async_task(name="...", bind=True)
+        async def my_task(self, ...):
+            async with async_runtime.session() as db:
+                ...
+    """
+    def decorator(coro_fn: Callable[..., Awaitable[Any]]):
+        @functools.wraps(coro_fn)
+        def run_in_runtime(*args, **kwargs):
+            return async_runtime.run(coro_fn(*args, **kwargs))
+
+        return celery_app.task(*task_args, **task_options)(run_in_runtime)
+
+    if len(task_args) == 1 and callable(task_args[0]) and not task_options:
+        coro_fn, task_args = task_args[0], ()
+        return decorator(coro_fn)
+    return decorator
@@ -0,0 +1,69 @@
+import os
+from typing import Final
+
+# --- Parallel Artifact Ingestion ---
+# Global cap on concurrently running ingestion lanes (one OS process per lane).
+# Lanes share the host's cores with page extraction: inside a lane the extraction
+# pool is min(PDF_EXTRACTION_WORKERS, cpu_count // lanes), so parallel ingestion
+# never runs more than about cpu_count pdfplumber processes in total.
+INGESTION_MAX_WORKERS: Final[int] = int(os.getenv("INGESTION_MAX_WORKERS", "4"))
+
+# Default per-exam cap. Can be overridden per exam via
+# ExamConfiguration.config_overrides["max_ingestion_concurrency"].
+INGESTION_MAX_PER_EXAM: Final[int] = int(os.getenv("INGESTION_MAX_PER_EXAM", "2"))
+INGESTION_CONCURRENCY_OVERRIDE_KEY: Final[str] = "max_ingestion_concurrency"
+
+# --- Fact Loading ---
+# COPY + staged SCD-2 retirement for cutoff_outcomes. "false" restores the
+# executemany path with tuple IN retirement.
+INGESTION_COPY_LOADER_ENABLED: Final[bool] = os.getenv("INGESTION_COPY_LOADER_ENABLED", "true").lower() == "true"
+
+# --- Run Instrumentation ---
+# Default for per-run cProfile capture (the admin router can enable it per request).
+INGESTION_PROFILE_ENABLED: Final[bool] = os.getenv("INGESTION_PROFILE_ENABLED", "false").lower() == "true"
+INGESTION_PROFILE_DIR: Final[str] = os.getenv("INGESTION_PROFILE_DIR", "/src/temp_downloads/profiles")
+
+# --- Page-Sharded PDF Extraction ---
+# Worker processes used for pdfplumber table detection. 1 disables the pool.
+# Each worker holds whole pages in memory, so the default stays small rather than
+# following the host's core count.
+PDF_EXTRACTION_WORKERS: Final[int] = int(os.getenv("PDF_EXTRACTION_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Contiguous pages handed to one worker per task.
+PDF_EXTRACTION_SHARD_SIZE: Final[int] = int(os.getenv("PDF_EXTRACTION_SHARD_SIZE", "25"))
+
+# --- Extracted Page Cache ---
+# Raw per-page extraction payloads keyed by (content digest, extraction version).
+PDF_PAGE_CACHE_ENABLED: Final[bool] = os.getenv("PDF_PAGE_CACHE_ENABLED", "true").lower() == "true"
+PDF_PAGE_CACHE_DIR: Final[str] = os.getenv("PDF_PAGE_CACHE_DIR", "/src/temp_downloads/page_cache")
+# Size cap for the cache directory. Least recently used entries are pruned after
+# each store; re-published PDFs and version bumps age out this way. 0 disables pruning.
+PDF_PAGE_CACHE_MAX_MB: Final[int] = int(os.getenv("PDF_PAGE_CACHE_MAX_MB", "2048"))
+
+# --- Notification Scanning ---
+# Concurrent liveness checks per scan. 1 restores the sequential walk.
+CUTOFF_SCAN_CONCURRENCY: Final[int] = int(os.getenv("CUTOFF_SCAN_CONCURRENCY", "8"))
+# Per-host token bucket depth. Refill rate is 1 / plugin.get_politeness_delay().
+CUTOFF_SCAN_HOST_BURST: Final[int] = int(os.getenv("CUTOFF_SCAN_HOST_BURST", "1"))
+# Unchanged seed pages (304 / same body hash) skip extraction and liveness checks,
+# but a full scan is forced after this many hours to catch silent PDF revisions.
+CUTOFF_SEED_FULL_RESCAN_HOURS: Final[int] = int(os.getenv("CUTOFF_SEED_FULL_RESCAN_HOURS", "24"))
+
+# --- JoSAA Round Harvesting ---
+# Rounds whose postback cascades run concurrently, each on its own cookie jar.
+JOSAA_PARALLEL_ROUNDS: Final[int] = int(os.getenv("JOSAA_PARALLEL_ROUNDS", "3"))
+# Hard cap on in-flight connections to the JoSAA server across all rounds.
+JOSAA_MAX_CONNECTIONS: Final[int] = int(os.getenv("JOSAA_MAX_CONNECTIONS", "3"))
+
+# --- External Provider Response Cache ---
+# Raw Serper (images / places) JSON keyed by normalized query. Forced admin
+# dispatches bypass the read; "false" disables the cache entirely.
+PROVIDER_CACHE_ENABLED: Final[bool] = os.getenv("PROVIDER_CACHE_ENABLED", "true").lower() == "true"
+PROVIDER_CACHE_TTL_SECONDS: Final[int] = int(os.getenv("PROVIDER_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+
+# --- Location Pipeline ---
+# Global Serper Places budget shared by every worker (Redis token bucket).
+LOCATION_PROVIDER_RATE_PER_SEC: Final[float] = float(os.getenv("LOCATION_PROVIDER_RATE_PER_SEC", "2"))
+LOCATION_PROVIDER_BURST: Final[int] = int(os.getenv("LOCATION_PROVIDER_BURST", "2"))
+# Colleges per batch task, and provider calls in flight inside one batch.
+LOCATION_BATCH_SIZE: Final[int] = int(os.getenv("LOCATION_BATCH_SIZE", "50"))
+LOCATION_BATCH_CONCURRENCY: Final[int] = int(os.getenv("LOCATION_BATCH_CONCURRENCY", "4"))
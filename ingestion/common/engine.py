@@ -1,6 +1,6 @@
 import uuid
 import logging
-from typing import Dict, Any, Literal
+from typing import Dict, Any, List, Literal
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy import update, and_  # Added for SCD Type 2
@@ -13,6 +13,9 @@ from app.models import (
 from app.services.registry_service import RegistryMode
 from ingestion.common.services.context_manager import ContextManager, PolicyViolationError
 from ingestion.common.interface.context_interface import ContextAdapter, ResolvedContext
+from ingestion.common.services.taxonomy_cache import SeatBucketCache
+from ingestion.common.services.metadata_accumulator import ExamMetadataAccumulator
+from ingestion.common.services.fact_loader import CutoffFactBulkLoader
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,9 @@ class UniversalIngestionEngine:
     1. Identity Resolution (via Registry)
     2. Policy Enforcement (via ContextManager)
     3. SCD Type 2 Storage (Retire Old -> Insert New)
+
+    process_row() is one transaction per row. process_batch() resolves a whole
+    batch in memory and writes each partition with one statement, committing once.
     """
     
     def __init__(self, context_manager: ContextManager):
@@ -64,6 +70,117 @@ class UniversalIngestionEngine:
             logger.error(f"Row processing failed: {str(e)}", exc_info=True)
             return "FAILED"
 
+    def process_batch(
+        self,
+        db: Session,
+        rows: List[Dict[str, Any]],
+        adapter: ContextAdapter,
+        mode: RegistryMode,
+        ingestion_run_id: uuid.UUID
+    ) -> Dict[str, int]:
+        """
+        Batched equivalent of process_row(). Returns counts per outcome.
+
+        Contexts are resolved in memory: the registry alias index is loaded for
+        the batch unless the caller already holds one (load it once per run when
+        calling repeatedly), buckets are governed by SeatBucketCache and metadata
+        is deferred. Accepted facts, identity quarantine and policy quarantine are
+        then each written with a single statement. Within a batch the last row for
+        a fact key wins, as it would with sequential process_row() calls.
+
+        Resolution writes nothing to the session, so a row that ends up quarantined
+        or FAILED only has its staged buckets / metadata undone in memory
+        (process_row() rolls those back too).
+
+        If the batched write fails, the batch is rolled back and replayed through
+        process_row(), which isolates the offending row.
+        """
+        counts = {"ACCEPTED": 0, "QUARANTINED_IDENTITY": 0, "QUARANTINED_POLICY": 0, "FAILED": 0}
+        if not rows:
+            return counts
+
+        registry = self.context_manager.registry
+        owns_alias_index = not registry.alias_index_loaded
+        if owns_alias_index:
+            registry.load_alias_index(db)
+
+        previous_caches = (self.context_manager.bucket_cache, self.context_manager.metadata_accumulator)
+        if self.context_manager.bucket_cache is None:
+            self.context_manager.bucket_cache = SeatBucketCache(db)
+        if self.context_manager.metadata_accumulator is None:
+            self.context_manager.metadata_accumulator = ExamMetadataAccumulator()
+
+        facts, identity_rows, policy_rows = [], [], []
+        try:
+            for row in rows:
+                self._begin_row()
+                try:
+                    context = self.context_manager.resolve_context(
+                        db, adapter, row, mode, ingestion_run_id
+                    )
+                    if not context:
+                        self._discard_row()
+                        identity_rows.append(self._identity_quarantine_values(row, ingestion_run_id))
+                        continue
+                    facts.append(self._build_fact_values(context, row, ingestion_run_id))
+
+                except PolicyViolationError as e:
+                    self._discard_row()
+                    policy_rows.append(self._policy_quarantine_values(row, adapter, str(e), ingestion_run_id))
+
+                except Exception as e:
+                    self._discard_row()
+                    logger.error(f"Row processing failed: {str(e)}", exc_info=True)
+                    counts["FAILED"] += 1
+
+            try:
+                self.context_manager.flush_pending_buckets()
+                self.context_manager.flush_pending_metadata(db)
+                CutoffFactBulkLoader(db).load(facts, keep_last=True)
+                if identity_rows:
+                    db.execute(insert(CollegeCandidate), identity_rows)
+                if policy_rows:
+                    db.execute(insert(SeatPolicyQuarantine), policy_rows)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"Batched write failed ({e}). Replaying {len(rows)} rows individually.")
+                self._discard_batch_caches(previous_caches)
+                return self._replay_rows(db, rows, adapter, mode, ingestion_run_id)
+
+        finally:
+            self.context_manager.bucket_cache, self.context_manager.metadata_accumulator = previous_caches
+            if owns_alias_index:
+                registry.clear_alias_index()
+
+        counts["ACCEPTED"] = len(facts)
+        counts["QUARANTINED_IDENTITY"] = len(identity_rows)
+        counts["QUARANTINED_POLICY"] = len(policy_rows)
+        return counts
+
+    def _begin_row(self):
+        self.context_manager.bucket_cache.begin_row()
+        self.context_manager.metadata_accumulator.begin_row()
+
+    def _discard_row(self):
+        self.context_manager.bucket_cache.discard_row()
+        self.context_manager.metadata_accumulator.discard_row()
+
+    def _discard_batch_caches(self, previous_caches):
+        # Staged buckets / metadata were rolled back with the batch.
+        self.context_manager.bucket_cache, self.context_manager.metadata_accumulator = previous_caches
+        if self.context_manager.bucket_cache is not None:
+            self.context_manager.bucket_cache.pending.clear()
+            self.context_manager.bucket_cache.known_buckets.clear()
+        if self.context_manager.metadata_accumulator is not None:
+            self.context_manager.metadata_accumulator.pending.clear()
+
+    def _replay_rows(self, db, rows, adapter, mode, ingestion_run_id) -> Dict[str, int]:
+        counts = {"ACCEPTED": 0, "QUARANTINED_IDENTITY": 0, "QUARANTINED_POLICY": 0, "FAILED": 0}
+        for row in rows:
+            counts[self.process_row(db, row, adapter, mode, ingestion_run_id)] += 1
+        return counts
+
     def _write_cutoff_fact(
         self, 
         db: Session, 
@@ -78,20 +195,7 @@ class UniversalIngestionEngine:
         """
         
         # --- Step A: Validation ---
-        try:
-            # Handle string ranks like "12,345" or "45.5"
-            closing_rank_str = str(row.get('cutoff_rank', 0)).replace(',', '')
-            closing_rank = int(float(closing_rank_str)) # Float cast handles 2025 decimals safely
-            if closing_rank <= 0: raise ValueError("Positive rank required")
-        except (ValueError, TypeError):
-            raise ValueError(f"Invalid rank: {row.get('cutoff_rank')}")
-        
-        opening_rank = None
-        if 'opening_rank' in row:
-            try: 
-                op_str = str(row['opening_rank']).replace(',', '')
-                opening_rank = int(float(op_str))
-            except: pass
+        values = self._build_fact_values(context, row, run_id)
 
         # --- Step B: SCD Type 2 Retirement (The "Soft Delete") ---
         # Before inserting, we must mark the PREVIOUS active record as inactive.
@@ -114,48 +218,90 @@ class UniversalIngestionEngine:
         db.execute(stmt)
 
         # --- Step C: Insert New Fact (Active) ---
-        fact = CutoffOutcome(
+        db.add(CutoffOutcome(**values))
+        db.flush()
+
+    def _build_fact_values(
+        self,
+        context: ResolvedContext,
+        row: Dict[str, Any],
+        run_id: uuid.UUID
+    ) -> Dict[str, Any]:
+        try:
+            # Handle string ranks like "12,345" or "45.5"
+            closing_rank_str = str(row.get('cutoff_rank', 0)).replace(',', '')
+            closing_rank = int(float(closing_rank_str)) # Float cast handles 2025 decimals safely
+            if closing_rank <= 0: raise ValueError("Positive rank required")
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid rank: {row.get('cutoff_rank')}")
+        
+        opening_rank = None
+        if 'opening_rank' in row:
+            try: 
+                op_str = str(row['opening_rank']).replace(',', '')
+                opening_rank = int(float(op_str))
+            except: pass
+
+        return {
             # Linkage
-            college_id=context.college_id,
-            seat_bucket_code=context.seat_bucket_code,
+            "college_id": context.college_id,
+            "seat_bucket_code": context.seat_bucket_code,
             
             # Dimensions (From Context)
-            exam_code=context.exam_code,
-            state_code=context.state_code, 
-            year=context.year,
-            round_number=context.round, 
+            "exam_code": context.exam_code,
+            "state_code": context.state_code, 
+            "year": context.year,
+            "round_number": context.round, 
             
             # Descriptive (From Context - UNIVERSAL)
-            institute_code=context.institute_code,
-            institute_name=context.institute_name,
-            program_code=context.program_code,
-            program_name=context.program_name,
+            "institute_code": context.institute_code,
+            "institute_name": context.institute_name,
+            "program_code": context.program_code,
+            "program_name": context.program_name,
             
             # Metrics
-            opening_rank=opening_rank,
-            closing_rank=closing_rank,
+            "opening_rank": opening_rank,
+            "closing_rank": closing_rank,
             
             # Audit
-            source_authority=context.exam_code,
-            source_document=row.get('source_document', 'unknown'),
-            ingestion_run_id=run_id,
-            created_by="universal_engine",
+            "source_authority": context.exam_code,
+            "source_document": row.get('source_document', 'unknown'),
+            "ingestion_run_id": run_id,
+            "created_by": "universal_engine",
             
             # SCD Flag
-            is_latest=True 
-        )
-        db.add(fact)
-        db.flush()
+            "is_latest": True 
+        }
+
+    def _identity_quarantine_values(self, row: Dict, run_id: uuid.UUID) -> Dict[str, Any]:
+        return {
+            "raw_name": row.get('college_name_raw', 'UNKNOWN'),
+            "source_document": row.get('source_document', 'unknown'),
+            "reason_flagged": "Identity Resolution Failed",
+            "status": "pending",
+            "ingestion_run_id": run_id,
+        }
+
+    def _policy_quarantine_values(self, row: Dict, adapter: ContextAdapter, reason: str, run_id: uuid.UUID) -> Dict[str, Any]:
+        try: slug = adapter.generate_slug(row)
+        except: slug = "UNKNOWN"
+
+        return {
+            "exam_code": adapter.get_exam_code(),
+            "seat_bucket_code": slug,
+            "violation_type": "POLICY_VIOLATION",
+            "source_exam": adapter.get_exam_code(),
+            "source_year": row.get('year', 0),
+            "source_round": row.get('round'),
+            "source_file": row.get('source_document'),
+            "raw_row": row,
+            "status": "OPEN",
+            "ingestion_run_id": run_id,
+        }
 
     def _log_identity_quarantine(self, db: Session, row: Dict, run_id: uuid.UUID):
         try:
-            stmt = insert(CollegeCandidate).values(
-                raw_name=row.get('college_name_raw', 'UNKNOWN'),
-                source_document=row.get('source_document', 'unknown'),
-                reason_flagged="Identity Resolution Failed",
-                status="pending",
-                ingestion_run_id=run_id
-            )
+            stmt = insert(CollegeCandidate).values(**self._identity_quarantine_values(row, run_id))
             db.execute(stmt)
             db.commit()
         except:
@@ -163,21 +309,7 @@ class UniversalIngestionEngine:
 
     def _log_policy_quarantine(self, db: Session, row: Dict, adapter: ContextAdapter, reason: str, run_id: uuid.UUID):
         try:
-            try: slug = adapter.generate_slug(row)
-            except: slug = "UNKNOWN"
-
-            stmt = insert(SeatPolicyQuarantine).values(
-                exam_code=adapter.get_exam_code(),
-                seat_bucket_code=slug,
-                violation_type="POLICY_VIOLATION",
-                source_exam=adapter.get_exam_code(),
-                source_year=row.get('year', 0),
-                source_round=row.get('round'),
-                source_file=row.get('source_document'),
-                raw_row=row,
-                status="OPEN",
-                ingestion_run_id=run_id
-            )
+            stmt = insert(SeatPolicyQuarantine).values(**self._policy_quarantine_values(row, adapter, reason, run_id))
             db.execute(stmt)
             db.commit()
         except:
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 
 @dataclass(frozen=True)
 class ResolvedContext:
@@ -32,6 +33,39 @@ class ResolvedContext:
     # Traceability
     is_newly_created: bool = False
 
+@dataclass(frozen=True)
+class ExamMetadataRecord:
+    """
+    One exam-specific college metadata row, described declaratively so it can be
+    written alone or deduplicated and batched with others of the same shape.
+
+    identity_columns mirror the table's unique constraint. With no update_columns
+    a conflict is ignored (first occurrence wins); otherwise the listed columns
+    take the incoming values (last occurrence wins).
+    """
+    model: Any
+    values: Dict[str, Any]
+    identity_columns: Tuple[str, ...]
+    constraint: Optional[str] = None
+    update_columns: Tuple[str, ...] = ()
+
+    @property
+    def identity(self) -> Tuple[Any, ...]:
+        return (self.model.__tablename__,) + tuple(self.values[c] for c in self.identity_columns)
+
+    @property
+    def statement_shape(self) -> Tuple[Any, ...]:
+        return (self.model, self.constraint, self.update_columns)
+
+    def build_statement(self, rows):
+        stmt = insert(self.model).values(rows)
+        if not self.update_columns:
+            return stmt.on_conflict_do_nothing()
+        return stmt.on_conflict_do_update(
+            constraint=self.constraint,
+            set_={col: stmt.excluded[col] for col in self.update_columns}
+        )
+
 class ContextAdapter(ABC):
     """
     The Strategy Pattern Interface.
@@ -70,5 +104,13 @@ class ContextAdapter(ABC):
         pass
 
     @abstractmethod
+    def build_exam_metadata(self, college_id: UUID, row: Dict[str, Any]) -> Optional[ExamMetadataRecord]:
+        """Returns the metadata row for this parsed row, or None if there is nothing to record."""
+        pass
+
     def upsert_exam_metadata(self, db: Session, college_id: UUID, row: Dict[str, Any]):
-        pass
\ No newline at end of file
+        record = self.build_exam_metadata(college_id, row)
+        if record is None:
+            return
+        db.execute(record.build_statement([record.values]))
+        db.flush()
\ No newline at end of file
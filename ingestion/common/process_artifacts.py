@@ -7,8 +7,11 @@ from sqlalchemy import select, update, insert, delete, or_, and_, tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 import traceback
+from time import perf_counter
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
-from app.database import SessionLocal
+from app.database import SessionLocal, sync_engine
 from app.models import (
     DiscoveredArtifact, CutoffOutcome, SeatPolicyQuarantine, 
     CollegeCandidate, ExamConfiguration, IngestionRun,
@@ -18,8 +21,21 @@ from app.services.registry_service import RegistryService, RegistryMode
 from app.domains.admin_portal.services.janitor_service import JanitorService
 from ingestion.common.services.context_manager import ContextManager, PolicyViolationError
 from ingestion.common.services.plugin_factory import PluginFactory 
-from ingestion.common.services.taxonomy_cache import TaxonomyCache
+from ingestion.common.services.taxonomy_cache import TaxonomyCache, SeatBucketCache
+from ingestion.common.services.metadata_accumulator import ExamMetadataAccumulator
+from ingestion.common.services.fact_loader import CutoffFactBulkLoader
+from ingestion.common.services.run_metrics import IngestionRunMetrics
+from ingestion.cutoff_ingestion.core.page_extractor import EXTRACTION_COUNTERS, set_extraction_worker_cap
 from ingestion.common.services.taxonomy_ingestion_service import TaxonomyIngestionEngine
+from ingestion.common.config import (
+    INGESTION_MAX_WORKERS,
+    PDF_EXTRACTION_WORKERS,
+    INGESTION_MAX_PER_EXAM,
+    INGESTION_CONCURRENCY_OVERRIDE_KEY,
+    INGESTION_COPY_LOADER_ENABLED,
+    INGESTION_PROFILE_ENABLED,
+    INGESTION_PROFILE_DIR,
+)
 from app.domains.student_portal.college_filter_tool.services.college_filter_rebuild_dispatcher import (
     CollegeFilterRebuildMode,
     CollegeFilterRebuildRequest,
@@ -31,10 +47,13 @@ logger = logging.getLogger("Universal_Orchestrator")
 MH_MEDICAL_EXAM_CODES = {"mh_neet_ug", "mh_ayush_aiq", "mh_nursing"}
 
 class ArtifactProcessor:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, profile: bool = INGESTION_PROFILE_ENABLED):
         self.db = db
+        self.profile = profile
+        self.metrics = IngestionRunMetrics(run_id=None)
         self.registry = RegistryService()
         self.context_manager = ContextManager(self.registry)
+        self.fact_loader = CutoffFactBulkLoader(db)
         
         self.temp_dir = "/src/temp_downloads"
         os.makedirs(self.temp_dir, exist_ok=True)
@@ -48,6 +67,109 @@ class ArtifactProcessor:
         """
         Fetches APPROVED artifacts OR those marked for reprocessing.
         """
+        artifacts = self._fetch_pending_artifacts(specific_exam)
+
+        logger.info(f"Found {len(artifacts)} artifacts to process.")
+        for artifact in artifacts:
+            self._process_single_artifact(
+                artifact,
+                skip_rebuild=skip_rebuild,
+            )
+
+    def process_approved_artifacts_parallel(
+        self,
+        specific_exam: str = None,
+        skip_rebuild: bool = False,
+        max_workers: int = None,
+        max_per_exam: int = None,
+    ):
+        """
+        Parallel variant of process_approved_artifacts.
+
+        Artifacts are grouped into lanes keyed by (exam, year, round). Each lane runs
+        in its own worker process with its own session, strictly in created_at order,
+        so SCD-2 'is_latest' retirement for the same bucket never races.
+        Lanes are scheduled under a global cap and a per-exam cap.
+        The post-ingest rebuild is dispatched once per exam after the batch drains.
+        """
+        artifacts = self._fetch_pending_artifacts(specific_exam)
+        logger.info(f"Found {len(artifacts)} artifacts to process (parallel mode).")
+        if not artifacts:
+            return {}
+
+        global_cap = max(1, max_workers or INGESTION_MAX_WORKERS)
+
+        lanes = defaultdict(list)
+        for artifact in artifacts:
+            lane_key = (artifact.exam_code, artifact.year, artifact.round_number)
+            lanes[lane_key].append(str(artifact.id))
+
+        exam_caps = {
+            exam_code: self._get_exam_concurrency(exam_code, max_per_exam)
+            for exam_code in {key[0] for key in lanes}
+        }
+
+        # The parent session must not hold a transaction open while workers write.
+        self.db.commit()
+
+        pending = deque(lanes.items())
+        in_flight = {}
+        running_per_exam = defaultdict(int)
+        ingested_per_exam = defaultdict(int)
+
+        lane_workers = min(global_cap, len(lanes))
+        with ProcessPoolExecutor(
+            max_workers=lane_workers,
+            initializer=_init_ingestion_worker,
+            initargs=(lane_workers,),
+        ) as pool:
+            while pending or in_flight:
+                # 1. Fill free slots, honoring per-exam caps (skipped lanes keep their order)
+                deferred = deque()
+                while pending and len(in_flight) < global_cap:
+                    lane_key, artifact_ids = pending.popleft()
+                    exam_code = lane_key[0]
+                    if running_per_exam[exam_code] >= exam_caps[exam_code]:
+                        deferred.append((lane_key, artifact_ids))
+                        continue
+
+                    future = pool.submit(_ingest_artifact_lane, artifact_ids, self.profile)
+                    in_flight[future] = lane_key
+                    running_per_exam[exam_code] += 1
+                    logger.info(
+                        f"🚦 Dispatched lane {lane_key} ({len(artifact_ids)} artifacts). "
+                        f"In flight: {len(in_flight)}/{global_cap}"
+                    )
+                deferred.extend(pending)
+                pending = deferred
+
+                # 2. Drain at least one finished lane
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    lane_key = in_flight.pop(future)
+                    exam_code = lane_key[0]
+                    running_per_exam[exam_code] -= 1
+                    try:
+                        ingested_per_exam[exam_code] += future.result()
+                    except Exception:
+                        logger.exception(f"Ingestion lane {lane_key} crashed.")
+
+        # 3. One rebuild per exam, after every lane for that exam has drained
+        for exam_code, ingested_count in ingested_per_exam.items():
+            if not ingested_count:
+                continue
+            if skip_rebuild:
+                logger.info(
+                    "Skipped college-filter rebuild dispatch for exam %s "
+                    "because skip_rebuild=True",
+                    exam_code,
+                )
+                continue
+            self._dispatch_post_ingest_rebuild(exam_code)
+
+        return dict(ingested_per_exam)
+
+    def _fetch_pending_artifacts(self, specific_exam: str = None):
         query = select(DiscoveredArtifact).where(
             or_(
                 DiscoveredArtifact.status == 'APPROVED',
@@ -58,14 +180,30 @@ class ArtifactProcessor:
         if specific_exam:
             query = query.where(DiscoveredArtifact.exam_code == specific_exam)
             
-        artifacts = self.db.execute(query.order_by(DiscoveredArtifact.created_at.asc())).scalars().all()
-
-        logger.info(f"Found {len(artifacts)} artifacts to process.")
-        for artifact in artifacts:
-            self._process_single_artifact(
-                artifact,
-                skip_rebuild=skip_rebuild,
+        return self.db.execute(query.order_by(DiscoveredArtifact.created_at.asc())).scalars().all()
+
+    def _get_exam_concurrency(self, exam_code: str, default: int = None) -> int:
+        limit = default or INGESTION_MAX_PER_EXAM
+        config = self.db.execute(
+            select(ExamConfiguration).where(ExamConfiguration.exam_code == exam_code)
+        ).scalar_one_or_none()
+        override = (config.config_overrides or {}).get(INGESTION_CONCURRENCY_OVERRIDE_KEY) if config else None
+        if override:
+            try:
+                limit = int(override)
+            except (TypeError, ValueError):
+                logger.warning(f"Invalid concurrency override for {exam_code}: {override!r}. Using {limit}.")
+        return max(1, limit)
+
+    def _dispatch_post_ingest_rebuild(self, exam_code: str) -> None:
+        college_filter_rebuild_dispatcher.dispatch(
+            CollegeFilterRebuildRequest(
+                reason="POST_INGEST",
+                rebuild_mode=CollegeFilterRebuildMode.FULL_STACK,
+                trigger_exam_code=exam_code,
+                created_by="system:artifact_processor",
             )
+        )
 
     def _get_ingestion_mode(self, exam_code: str) -> RegistryMode:
         try:
@@ -85,8 +223,10 @@ class ArtifactProcessor:
         self,
         artifact: DiscoveredArtifact,
         skip_rebuild: bool = False,
-    ):
+    ) -> bool:
+        """Returns True if the artifact reached INGESTED."""
         ingestion_run_id = uuid.uuid4()
+        ingested = False
         local_path = None
         
         try:
@@ -102,7 +242,11 @@ class ArtifactProcessor:
             self.db.commit()
         except Exception as e:
             logger.error(f"Failed to initialize IngestionRun: {e}")
-            return
+            return False
+
+        self.metrics = IngestionRunMetrics(ingestion_run_id, profile=self.profile, profile_dir=INGESTION_PROFILE_DIR)
+        self.metrics.start_profile()
+        extraction_baseline = EXTRACTION_COUNTERS.copy()
 
         try:
             # 1. LOAD PLUGIN & CONFIG
@@ -149,7 +293,8 @@ class ArtifactProcessor:
                 self.db.flush()
 
            # 3. DOWNLOAD & PREPARE
-            local_path = self._download_file(artifact.pdf_path, artifact.id, plugin)
+            with self.metrics.stage("download"):
+                local_path = self._download_file(artifact.pdf_path, artifact.id, plugin)
             
             # --- DYNAMIC PARSER RESOLUTION ---
             if hasattr(plugin, 'get_parser_with_context'):
@@ -167,12 +312,18 @@ class ArtifactProcessor:
             quarantine_buf = []
             identity_buf = []
 
-            taxonomy_cache = TaxonomyCache(self.db, artifact.exam_code)
+            with self.metrics.stage("preload"):
+                taxonomy_cache = TaxonomyCache(self.db, artifact.exam_code)
+                # Per-run alias snapshot: identity resolution becomes a dict lookup.
+                self.registry.load_alias_index(self.db)
+            self.context_manager.bucket_cache = SeatBucketCache(self.db)
+            self.context_manager.metadata_accumulator = ExamMetadataAccumulator()
             unknown_branches = set()
             unknown_courses = set()
 
             # 5. PARSING LOOP
-            for row in parser.parse():
+            for row in self.metrics.timed_iter("parse", parser.parse()):
+                self.metrics.incr("rows")
                 self._handle_row(
                     row=row, artifact=artifact, run_id=ingestion_run_id, 
                     stats=stats, stream=sanitized_stream, mode=mode, 
@@ -183,14 +334,21 @@ class ArtifactProcessor:
                     unknown_courses=unknown_courses
                 )
                 
-                if len(outcome_buf) >= self.BATCH_SIZE: self._flush_outcomes(outcome_buf)
-                if len(quarantine_buf) >= self.BATCH_SIZE: self._flush_quarantine(quarantine_buf)
-                if len(identity_buf) >= self.BATCH_SIZE: self._flush_identity(identity_buf) 
+                if len(outcome_buf) >= self.BATCH_SIZE:
+                    self._timed_flush("seat_buckets", self.context_manager.flush_pending_buckets)
+                    self._timed_flush("exam_metadata", self.context_manager.flush_pending_metadata, self.db)
+                    self._timed_flush("outcomes", self._flush_outcomes, outcome_buf)
+                if len(quarantine_buf) >= self.BATCH_SIZE: self._timed_flush("quarantine", self._flush_quarantine, quarantine_buf)
+                if len(identity_buf) >= self.BATCH_SIZE: self._timed_flush("identity", self._flush_identity, identity_buf)
 
             # Flush Remaining
-            self._flush_outcomes(outcome_buf)
-            self._flush_quarantine(quarantine_buf)
-            self._flush_identity(identity_buf)
+            self._timed_flush("seat_buckets", self.context_manager.flush_pending_buckets)
+            self._timed_flush("exam_metadata", self.context_manager.flush_pending_metadata, self.db)
+            self._timed_flush("outcomes", self._flush_outcomes, outcome_buf)
+            self._timed_flush("quarantine", self._flush_quarantine, quarantine_buf)
+            self._timed_flush("identity", self._flush_identity, identity_buf)
+
+            run_stats = self._collect_run_stats(stats, taxonomy_cache, extraction_baseline)
 
             # 6. SUCCESS STATE
             self.db.execute(
@@ -205,23 +363,17 @@ class ArtifactProcessor:
             self.db.execute(
                 update(IngestionRun)
                 .where(IngestionRun.run_id == ingestion_run_id)
-                .values(status="COMPLETED", stats=stats, completed_at=func.now())
+                .values(status="COMPLETED", stats=run_stats, completed_at=func.now())
             )
             self.db.commit()
+            ingested = True
 
             # ========================================================
             # 7. POST-COMMIT COLLEGE-FILTER REBUILD DISPATCH
             # ========================================================
             try:
                 if not skip_rebuild:
-                    college_filter_rebuild_dispatcher.dispatch(
-                        CollegeFilterRebuildRequest(
-                            reason="POST_INGEST",
-                            rebuild_mode=CollegeFilterRebuildMode.FULL_STACK,
-                            trigger_exam_code=artifact.exam_code,
-                            created_by="system:artifact_processor",
-                        )
-                    )
+                    self._dispatch_post_ingest_rebuild(artifact.exam_code)
                 else:
                     logger.info(
                         "Skipped college-filter rebuild dispatch for artifact %s "
@@ -291,13 +443,23 @@ class ArtifactProcessor:
             self.db.execute(
                 update(IngestionRun)
                 .where(IngestionRun.run_id == ingestion_run_id)
-                .values(status="FAILED", stats={"error": error_msg}, completed_at=func.now())
+                .values(
+                    status="FAILED",
+                    stats={"error": error_msg, **self._collect_run_stats({}, None, extraction_baseline)},
+                    completed_at=func.now()
+                )
             )
             self.db.commit()
             
         finally:
+            self.metrics.stop_profile()
+            self.registry.clear_alias_index()
+            self.context_manager.bucket_cache = None
+            self.context_manager.metadata_accumulator = None
             if local_path and os.path.exists(local_path): os.remove(local_path)
 
+        return ingested
+
     def _handle_row(self, row, artifact, run_id, stats, stream, mode, outcome_buf, quarantine_buf, identity_buf, adapter, plugin, taxonomy_cache, unknown_branches, unknown_courses):
         context_input = {}
         try:
@@ -317,10 +479,11 @@ class ArtifactProcessor:
                     unknown_courses.add(pre_identity_course)
 
             # 2. Resolve Context (Identity + Policy Check)
-            resolved = self.context_manager.resolve_context(
-                db=self.db, adapter=adapter, row_data=context_input,
-                mode=mode, ingestion_run_id=run_id
-            )
+            with self.metrics.stage("resolve_context"):
+                resolved = self.context_manager.resolve_context(
+                    db=self.db, adapter=adapter, row_data=context_input,
+                    mode=mode, ingestion_run_id=run_id
+                )
 
             if not resolved:
                 # [AUDIT FIX 1]: Bulletproof Dictionary Extraction
@@ -450,8 +613,44 @@ class ArtifactProcessor:
             })
             stats['quarantined'] += 1
 
+    def _timed_flush(self, name: str, flush_fn, *args):
+        started_at = perf_counter()
+        rows = flush_fn(*args)
+        if rows:
+            self.metrics.observe_flush(name, perf_counter() - started_at, rows)
+
+    def _collect_run_stats(self, stats, taxonomy_cache, extraction_baseline):
+        """Counts + the IngestionRunMetrics snapshot persisted in IngestionRun.stats."""
+        # Already collected on the success path: a failing commit must not count twice.
+        if self.metrics.finished:
+            return {**stats, **self.metrics.to_stats()}
+
+        extraction = EXTRACTION_COUNTERS.copy()
+        extraction.subtract(extraction_baseline)
+        self.metrics.incr("pages", extraction["pages"])
+
+        page_cache_lookups = extraction["page_cache_hits"] + extraction["page_cache_misses"]
+        if page_cache_lookups:
+            self.metrics.record_cache("page_cache", extraction["page_cache_hits"], page_cache_lookups)
+        if self.registry.index_lookups:
+            self.metrics.record_cache("identity_alias_index", self.registry.index_hits, self.registry.index_lookups)
+        if taxonomy_cache is not None and taxonomy_cache.lookups:
+            self.metrics.record_cache("taxonomy", taxonomy_cache.hits, taxonomy_cache.lookups)
+        bucket_cache = self.context_manager.bucket_cache
+        if bucket_cache is not None and bucket_cache.lookups:
+            self.metrics.record_cache("seat_buckets", bucket_cache.hits, bucket_cache.lookups)
+
+        self.metrics.finish()
+        return {**stats, **self.metrics.to_stats()}
+
     def _flush_outcomes(self, buffer):
-        if not buffer: return
+        if not buffer: return 0
+        count = len(buffer)
+
+        if INGESTION_COPY_LOADER_ENABLED:
+            self.fact_loader.load(buffer)
+            buffer.clear()
+            return count
         
         # [ENTERPRISE SHIELD] Observable In-Memory Deduplication
         unique_map = {}
@@ -502,16 +701,21 @@ class ArtifactProcessor:
 
         self.db.execute(insert(CutoffOutcome), deduped_buffer)
         buffer.clear()
+        return count
 
     def _flush_quarantine(self, buffer):
-        if not buffer: return
+        if not buffer: return 0
+        count = len(buffer)
         self.db.execute(insert(SeatPolicyQuarantine), buffer)
         buffer.clear()
+        return count
     
     def _flush_identity(self, buffer):
-        if not buffer: return
+        if not buffer: return 0
+        count = len(buffer)
         self.db.execute(insert(CollegeCandidate), buffer)
         buffer.clear()
+        return count
 
     def _download_file(self, url: str, artifact_id, plugin=None) -> str:
         from urllib.parse import urlparse, urljoin
@@ -603,6 +807,33 @@ class ArtifactProcessor:
             
         return local_filename
 
+def _init_ingestion_worker(lane_workers: int = 1):
+    # Forked workers must never reuse the parent's pooled connections.
+    sync_engine.dispose(close=False)
+    # Lanes are non-daemonic, so each could open a full extraction pool of its own.
+    # Split the CPU budget across lanes instead; a share of 1 means inline extraction.
+    cpu_share = (os.cpu_count() or 1) // max(1, lane_workers)
+    set_extraction_worker_cap(min(PDF_EXTRACTION_WORKERS, cpu_share))
+
+
+def _ingest_artifact_lane(artifact_ids, profile: bool = False) -> int:
+    """
+    Worker entrypoint: processes one (exam, year, round) lane sequentially
+    in a dedicated session. Rebuild dispatch is left to the coordinating parent.
+    """
+    ingested_count = 0
+    with SessionLocal() as db:
+        processor = ArtifactProcessor(db, profile=profile)
+        for artifact_id in artifact_ids:
+            artifact = db.get(DiscoveredArtifact, uuid.UUID(artifact_id))
+            if not artifact:
+                logger.warning(f"Artifact {artifact_id} vanished before lane execution. Skipping.")
+                continue
+            if processor._process_single_artifact(artifact, skip_rebuild=True):
+                ingested_count += 1
+    return ingested_count
+
+
 if __name__ == "__main__":
     db = SessionLocal()
     processor = ArtifactProcessor(db)
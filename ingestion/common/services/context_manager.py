@@ -7,6 +7,8 @@ import uuid
 from app.models import SeatBucketTaxonomy
 from app.services.registry_service import RegistryService, RegistryMode
 from ingestion.common.interface.context_interface import ContextAdapter, ResolvedContext
+from ingestion.common.services.taxonomy_cache import SeatBucketCache
+from ingestion.common.services.metadata_accumulator import ExamMetadataAccumulator
 
 class PolicyViolationError(Exception):
     """
@@ -20,9 +22,32 @@ class ContextManager:
     The Universal Gatekeeper.
     Passive Unit of Work: Prepares state, validates policy, flushes data.
     Does NOT Commit.
+
+    With a SeatBucketCache attached (bulk ingestion runs), bucket governance is
+    decided in memory and new BOOTSTRAP buckets are staged until
+    flush_pending_buckets(). Likewise an attached ExamMetadataAccumulator defers
+    exam metadata upserts until flush_pending_metadata(). Without them, every
+    row goes to the DB.
     """
-    def __init__(self, registry_service: RegistryService):
+    def __init__(
+        self,
+        registry_service: RegistryService,
+        bucket_cache: Optional[SeatBucketCache] = None,
+        metadata_accumulator: Optional[ExamMetadataAccumulator] = None,
+    ):
         self.registry = registry_service
+        self.bucket_cache = bucket_cache
+        self.metadata_accumulator = metadata_accumulator
+
+    def flush_pending_buckets(self) -> int:
+        if self.bucket_cache is None:
+            return 0
+        return self.bucket_cache.flush()
+
+    def flush_pending_metadata(self, db: Session) -> int:
+        if self.metadata_accumulator is None:
+            return 0
+        return self.metadata_accumulator.flush(db)
 
     def resolve_context(
         self,
@@ -61,7 +86,12 @@ class ContextManager:
         self._ensure_taxonomy(db, slug, adapter.get_exam_code(row_data), policy_attrs, mode)
 
         # 4. Metadata
-        adapter.upsert_exam_metadata(db, identity_result.college_id, row_data)
+        if self.metadata_accumulator is not None:
+            record = adapter.build_exam_metadata(identity_result.college_id, row_data)
+            if record is not None:
+                self.metadata_accumulator.add(record)
+        else:
+            adapter.upsert_exam_metadata(db, identity_result.college_id, row_data)
 
         # 5. Descriptive
         desc = adapter.resolve_descriptive_attributes(
@@ -95,6 +125,14 @@ class ContextManager:
         attrs: Dict[str, Any], 
         mode: RegistryMode
     ):
+        if self.bucket_cache is not None:
+            if self.bucket_cache.is_bucket_known(exam_code, slug):
+                return
+            if mode != RegistryMode.BOOTSTRAP:
+                raise PolicyViolationError(f"Bucket '{slug}' unknown in Continuous Mode.")
+            self.bucket_cache.stage_bucket(exam_code, slug, self._bucket_values(slug, exam_code, attrs))
+            return
+
         exists = db.execute(
             select(SeatBucketTaxonomy.seat_bucket_code)
             .where(SeatBucketTaxonomy.seat_bucket_code == slug)
@@ -106,15 +144,19 @@ class ContextManager:
         if mode != RegistryMode.BOOTSTRAP:
             raise PolicyViolationError(f"Bucket '{slug}' unknown in Continuous Mode.")
 
-        stmt = insert(SeatBucketTaxonomy).values(
-            seat_bucket_code=slug,
-            exam_code=exam_code,
-            category_name=attrs['category_group'], 
-            is_reserved=attrs['is_reserved'],
-            course_type=attrs.get('course_type'),
-            location_type=attrs.get('location_type'),
-            reservation_type=attrs.get('reservation_type'),
-            attributes=attrs.get('extra_attributes', {})
-        )
+        stmt = insert(SeatBucketTaxonomy).values(**self._bucket_values(slug, exam_code, attrs))
         db.execute(stmt)
-        db.flush() # Stage the taxonomy entry
\ No newline at end of file
+        db.flush() # Stage the taxonomy entry
+
+    @staticmethod
+    def _bucket_values(slug: str, exam_code: str, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "seat_bucket_code": slug,
+            "exam_code": exam_code,
+            "category_name": attrs['category_group'],
+            "is_reserved": attrs['is_reserved'],
+            "course_type": attrs.get('course_type'),
+            "location_type": attrs.get('location_type'),
+            "reservation_type": attrs.get('reservation_type'),
+            "attributes": attrs.get('extra_attributes', {}),
+        }
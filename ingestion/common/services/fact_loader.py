@@ -0,0 +1,134 @@
+import io
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class CutoffFactBulkLoader:
+    """
+    COPY-based SCD Type-2 loader for cutoff_outcomes.
+
+    Each batch is streamed into a transaction-scoped temp staging table with COPY,
+    then resolved set-wise in SQL:
+      1. Collision report  - duplicate keys within the batch (conflicting ranks are errors).
+      2. Retirement        - UPDATE ... FROM (distinct staged keys) flips is_latest.
+      3. Insert            - INSERT ... SELECT DISTINCT ON (key), first occurrence wins
+                             (last occurrence with keep_last=True).
+
+    Runs on the Session's own connection, so it shares the ingestion transaction
+    and never commits.
+    """
+
+    STAGE_TABLE = "cutoff_outcomes_stage"
+
+    FACT_COLUMNS: Tuple[str, ...] = (
+        "college_id", "exam_code", "year", "round_number", "state_code",
+        "institute_code", "institute_name", "program_code", "program_name",
+        "seat_bucket_code", "opening_rank", "closing_rank", "cutoff_percentile",
+        "source_authority", "created_by", "source_document", "ingestion_run_id",
+        "is_latest",
+    )
+
+    # SCD-2 identity of a fact (matches the historical retirement key).
+    KEY_COLUMNS: Tuple[str, ...] = (
+        "exam_code", "year", "round_number",
+        "institute_code", "program_code", "seat_bucket_code",
+    )
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def load(self, rows: List[Dict[str, Any]], keep_last: bool = False) -> Dict[str, int]:
+        if not rows:
+            return {"staged": 0, "retired": 0, "inserted": 0}
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            self._prepare_stage(cursor)
+            self._copy_rows(cursor, rows)
+            self._report_collisions(cursor, keep_last)
+
+            key_match = " AND ".join(f"co.{c} = s.{c}" for c in self.KEY_COLUMNS)
+            keys = ", ".join(self.KEY_COLUMNS)
+            columns = ", ".join(self.FACT_COLUMNS)
+            seq_order = "stage_seq DESC" if keep_last else "stage_seq"
+
+            cursor.execute(
+                f"UPDATE cutoff_outcomes co SET is_latest = false "
+                f"FROM (SELECT DISTINCT {keys} FROM {self.STAGE_TABLE}) s "
+                f"WHERE {key_match} AND co.is_latest = true"
+            )
+            retired = cursor.rowcount
+
+            cursor.execute(
+                f"INSERT INTO cutoff_outcomes ({columns}) "
+                f"SELECT {columns} FROM ("
+                f"  SELECT DISTINCT ON ({keys}) * FROM {self.STAGE_TABLE} ORDER BY {keys}, {seq_order}"
+                f") deduped"
+            )
+            inserted = cursor.rowcount
+        finally:
+            cursor.close()
+
+        return {"staged": len(rows), "retired": retired, "inserted": inserted}
+
+    def _prepare_stage(self, cursor):
+        columns = ", ".join(self.FACT_COLUMNS)
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {self.STAGE_TABLE} ON COMMIT DROP AS "
+            f"SELECT {columns}, 0::bigint AS stage_seq FROM cutoff_outcomes WITH NO DATA"
+        )
+        cursor.execute(f"TRUNCATE {self.STAGE_TABLE}")
+
+    def _copy_rows(self, cursor, rows: List[Dict[str, Any]]):
+        buffer = io.StringIO()
+        for seq, row in enumerate(rows):
+            fields = [_copy_text_value(row.get(c)) for c in self.FACT_COLUMNS]
+            fields.append(str(seq))
+            buffer.write("\t".join(fields))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        columns = ", ".join(self.FACT_COLUMNS + ("stage_seq",))
+        cursor.copy_expert(f"COPY {self.STAGE_TABLE} ({columns}) FROM STDIN", buffer)
+
+    def _report_collisions(self, cursor, keep_last: bool = False):
+        # [ENTERPRISE SHIELD] Observable deduplication, computed by the database.
+        keys = ", ".join(self.KEY_COLUMNS)
+        cursor.execute(
+            f"SELECT {keys}, array_agg(closing_rank ORDER BY stage_seq) "
+            f"FROM {self.STAGE_TABLE} GROUP BY {keys} HAVING count(*) > 1"
+        )
+        for record in cursor.fetchall():
+            unique_key = tuple(record[:-1])
+            ranks = record[-1][::-1] if keep_last else record[-1]
+            conflicting = [r for r in ranks if r != ranks[0]]
+            if conflicting:
+                logger.error(
+                    f"🚨 DATA COLLISION: Conflicting ranks found for {unique_key}! "
+                    f"Rank A: {ranks[0]} | Rank B: {conflicting[0]}. "
+                    f"Action: Preserving {'last' if keep_last else 'first'} extracted occurrence."
+                )
+            else:
+                logger.debug(f"♻️ Dropped exact PDF pagination duplicate for {unique_key}")
+
+
+def _copy_text_value(value: Any) -> str:
+    """Encodes one field for COPY ... FROM STDIN (text format)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
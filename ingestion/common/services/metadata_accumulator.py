@@ -0,0 +1,52 @@
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from ingestion.common.interface.context_interface import ExamMetadataRecord
+
+
+class ExamMetadataAccumulator:
+    """
+    Run-scoped buffer for exam metadata upserts.
+
+    The (college, code, year) identity repeats for every row of a college, so
+    records are deduplicated in memory and written as one multi-row upsert per
+    statement shape at flush time. Deduplication also keeps a single INSERT ... ON
+    CONFLICT DO UPDATE from touching the same target row twice.
+    """
+    def __init__(self):
+        self.pending: Dict[Tuple[Any, ...], ExamMetadataRecord] = {}
+        # (identity, record it replaced or None) since the last begin_row().
+        self._row_changes: List[Tuple[Tuple[Any, ...], Optional[ExamMetadataRecord]]] = []
+
+    def add(self, record: ExamMetadataRecord):
+        if record.update_columns or record.identity not in self.pending:
+            self._row_changes.append((record.identity, self.pending.get(record.identity)))
+            self.pending[record.identity] = record
+
+    def begin_row(self):
+        self._row_changes.clear()
+
+    def discard_row(self):
+        """Undoes the records added or replaced since begin_row()."""
+        for identity, previous in reversed(self._row_changes):
+            if previous is None:
+                self.pending.pop(identity, None)
+            else:
+                self.pending[identity] = previous
+        self._row_changes.clear()
+
+    def flush(self, db: Session) -> int:
+        if not self.pending:
+            return 0
+
+        grouped: Dict[Tuple[Any, ...], list] = {}
+        for record in self.pending.values():
+            grouped.setdefault(record.statement_shape, []).append(record)
+
+        for records in grouped.values():
+            db.execute(records[0].build_statement([r.values for r in records]))
+
+        count = len(self.pending)
+        self.pending.clear()
+        self._row_changes.clear()
+        return count
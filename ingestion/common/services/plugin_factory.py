@@ -1,49 +1,109 @@
+import importlib
+import logging
+from importlib.metadata import entry_points
 from typing import Dict, List, Type
-from ingestion.cutoff_ingestion.core.base_plugin import BaseCutoffPlugin
 
-# --- KARNATAKA PLUGINS ---
-from ingestion.cutoff_ingestion.plugins.kcet.plugin import KCETPlugin
-from ingestion.cutoff_ingestion.plugins.neet.states.ka.plugin import KarnatakaNEETPlugin
+from ingestion.cutoff_ingestion.core.base_plugin import BaseCutoffPlugin
 
-# --- MHT-CET (ENGINEERING/PHARMA) PLUGINS ---
-from ingestion.cutoff_ingestion.plugins.mhtcet.courses.be.plugin import MHTCETBTechPlugin
-from ingestion.cutoff_ingestion.plugins.mhtcet.courses.pharma.plugin import MHTCETPharmaPlugin
+logger = logging.getLogger(__name__)
 
-# --- MAHARASHTRA MEDICAL PLUGINS ---
-from ingestion.cutoff_ingestion.plugins.neet.states.mh.courses.ug.plugin import MHNeetUGPlugin
-from ingestion.cutoff_ingestion.plugins.neet.states.mh.courses.nursing.plugin import MHNursingPlugin
-from ingestion.cutoff_ingestion.plugins.neet.states.mh.courses.ayush_aiq.plugin import MHNeetAyushAiqPlugin
+# Third-party / out-of-tree plugins register under this entry-point group:
+#   [project.entry-points."derived_campus.cutoff_plugins"]
+#   my_exam = "my_package.plugin:MyExamPlugin"
+PLUGIN_ENTRY_POINT_GROUP = "derived_campus.cutoff_plugins"
 
-# --- JOSAA (JEE MAINS & ADVANCED) PLUGINS ---
-from ingestion.cutoff_ingestion.plugins.josaa.plugin import JosaaPlugin
 
 class PluginFactory:
     """
     Central Registry for all Exam Plugins.
+
+    Plugins are registered as "module:ClassName" strings and imported on the first
+    get_plugin() for their slug. Importing the factory therefore costs nothing:
+    Celery workers, beat and the CLI only load the plugin (and its parser stack)
+    they actually use.
     """
-    _registry: Dict[str, Type[BaseCutoffPlugin]] = {
-        "kcet": KCETPlugin,
-        "neet_ka": KarnatakaNEETPlugin,
-        "mhtcet_be": MHTCETBTechPlugin,
-        "mhtcet_pharma": MHTCETPharmaPlugin,
-        
+    _registry: Dict[str, str] = {
+        # --- KARNATAKA PLUGINS ---
+        "kcet": "ingestion.cutoff_ingestion.plugins.kcet.plugin:KCETPlugin",
+        "neet_ka": "ingestion.cutoff_ingestion.plugins.neet.states.ka.plugin:KarnatakaNEETPlugin",
+
+        # --- MHT-CET (ENGINEERING/PHARMA) PLUGINS ---
+        "mhtcet_be": "ingestion.cutoff_ingestion.plugins.mhtcet.courses.be.plugin:MHTCETBTechPlugin",
+        "mhtcet_pharma": "ingestion.cutoff_ingestion.plugins.mhtcet.courses.pharma.plugin:MHTCETPharmaPlugin",
+
         # MH Medical Hooks
-        "mh_neet_ug": MHNeetUGPlugin,
-        "mh_nursing": MHNursingPlugin,
-        "mh_ayush_aiq": MHNeetAyushAiqPlugin,
-        
+        "mh_neet_ug": "ingestion.cutoff_ingestion.plugins.neet.states.mh.courses.ug.plugin:MHNeetUGPlugin",
+        "mh_nursing": "ingestion.cutoff_ingestion.plugins.neet.states.mh.courses.nursing.plugin:MHNursingPlugin",
+        "mh_ayush_aiq": "ingestion.cutoff_ingestion.plugins.neet.states.mh.courses.ayush_aiq.plugin:MHNeetAyushAiqPlugin",
+
         # JoSAA (JEE) Hooks
-        "josaa": JosaaPlugin
+        "josaa": "ingestion.cutoff_ingestion.plugins.josaa.plugin:JosaaPlugin",
     }
 
+    _resolved: Dict[str, Type[BaseCutoffPlugin]] = {}
+    _entry_points_loaded: bool = False
+
     @classmethod
     def get_plugin(cls, exam_slug: str) -> BaseCutoffPlugin:
-        plugin_cls = cls._registry.get(exam_slug.lower())
-        if not plugin_cls:
+        return cls.get_plugin_class(exam_slug)()
+
+    @classmethod
+    def get_plugin_class(cls, exam_slug: str) -> Type[BaseCutoffPlugin]:
+        slug = exam_slug.lower()
+        plugin_cls = cls._resolved.get(slug)
+        if plugin_cls is not None:
+            return plugin_cls
+
+        target = cls._registry.get(slug)
+        if target is None:
+            cls._load_entry_points()
+            target = cls._registry.get(slug)
+        if not target:
             raise ValueError(f"Plugin not found for exam: {exam_slug}")
-        return plugin_cls()
+
+        plugin_cls = cls._import_target(target)
+        if not (isinstance(plugin_cls, type) and issubclass(plugin_cls, BaseCutoffPlugin)):
+            raise TypeError(f"Plugin target '{target}' for exam '{slug}' is not a BaseCutoffPlugin")
+
+        cls._resolved[slug] = plugin_cls
+        return plugin_cls
+
+    @classmethod
+    def register(cls, exam_slug: str, target: str):
+        """Registers (or overrides) a plugin by "module:ClassName" without importing it."""
+        slug = exam_slug.lower()
+        cls._registry[slug] = target
+        cls._resolved.pop(slug, None)
 
     @classmethod
     def list_available_plugins(cls) -> List[str]:
-        """Returns a list of registered exam slugs"""
-        return list(cls._registry.keys())
\ No newline at end of file
+        """Returns a list of registered exam slugs (no plugin module is imported)"""
+        cls._load_entry_points()
+        return list(cls._registry.keys())
+
+    # --- INTERNALS ---
+    @staticmethod
+    def _import_target(target: str):
+        module_path, _, attr = target.partition(":")
+        module = importlib.import_module(module_path)
+        return getattr(module, attr) if attr else module
+
+    @classmethod
+    def _load_entry_points(cls):
+        if cls._entry_points_loaded:
+            return
+        cls._entry_points_loaded = True
+
+        try:
+            discovered = entry_points(group=PLUGIN_ENTRY_POINT_GROUP)
+        except Exception as e:
+            logger.warning(f"Could not read '{PLUGIN_ENTRY_POINT_GROUP}' entry points: {e}")
+            return
+
+        for ep in discovered:
+            slug = ep.name.lower()
+            if slug in cls._registry:
+                # Built-in plugins win; an entry point cannot silently hijack a slug.
+                logger.warning(f"Ignoring entry-point plugin '{ep.value}': slug '{slug}' is already registered")
+                continue
+            cls._registry[slug] = ep.value
@@ -0,0 +1,122 @@
+import re
+import json
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from ingestion.common.config import PROVIDER_CACHE_ENABLED, PROVIDER_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class InMemoryCacheBackend:
+    """
+    Process-local stand-in for Redis (get / set with ex=). Used by scripts and
+    local runs that must not touch shared infrastructure.
+    """
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Optional[float], str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ex: Optional[int] = None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ex if ex else None, value)
+
+
+class ProviderResponseCache:
+    """
+    Persistent cache for paid search-provider responses.
+
+    Stores the raw provider JSON (before governance / parsing) under a key built from
+    the provider, the lookup kind and the normalized query, so rule changes in the
+    governance layer still apply to cached payloads. Backed by Redis by default; any
+    object with get(key) and set(key, value, ex=ttl) can be injected.
+
+    Cache faults never fail an ingestion: a broken backend degrades to a live call.
+    """
+    KEY_PREFIX = "provider_cache"
+
+    def __init__(self, backend: Any = None, ttl_seconds: Optional[int] = None, enabled: Optional[bool] = None):
+        self.enabled = PROVIDER_CACHE_ENABLED if enabled is None else enabled
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else PROVIDER_CACHE_TTL_SECONDS
+        self._backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            import redis
+            from app.config import settings
+
+            self._backend = redis.from_url(settings.REDIS_URL, decode_responses=True, socket_timeout=5.0)
+        return self._backend
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return _WHITESPACE.sub(" ", query).strip().casefold()
+
+    def build_key(self, provider: str, kind: str, query: str) -> str:
+        digest = hashlib.sha256(self.normalize(query).encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{provider.lower()}:{kind.lower()}:{digest}"
+
+    def get(self, provider: str, kind: str, query: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        key = self.build_key(provider, kind, query)
+        try:
+            raw = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"[ProviderCache] Read failed for {key}: {type(e).__name__}: {e}")
+            return None
+
+        if raw is None:
+            self.misses += 1
+            return None
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            logger.warning(f"[ProviderCache] Discarding corrupt entry {key}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return payload
+
+    def set(self, provider: str, kind: str, query: str, payload: Dict[str, Any]):
+        if not self.enabled:
+            return
+        key = self.build_key(provider, kind, query)
+        try:
+            self.backend.set(key, json.dumps(payload, separators=(",", ":")), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"[ProviderCache] Write failed for {key}: {type(e).__name__}: {e}")
+
+    def fetch(self, provider: str, kind: str, query: str, loader, force: bool = False) -> Dict[str, Any]:
+        """
+        Read-through lookup. force=True skips the read (admin "Force" re-dispatch) but
+        still refreshes the entry with the live response.
+        """
+        if not force:
+            cached = self.get(provider, kind, query)
+            if cached is not None:
+                logger.info(f"[ProviderCache] HIT {provider}/{kind} for '{query}'")
+                return cached
+
+        payload = loader(query)
+        self.set(provider, kind, query, payload)
+        return payload
@@ -0,0 +1,178 @@
+import io
+import os
+import logging
+import pstats
+import cProfile
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the flush latency histogram buckets. The last bucket is open-ended.
+FLUSH_LATENCY_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class IngestionRunMetrics:
+    """
+    Flight-recorder instrumentation for a single ingestion run.
+
+    Collects wall-clock time per stage (download, parse, resolve, taxonomy, flush),
+    row / page counters, flush latency histograms and cache hit rates, and renders
+    them into the JSON blob persisted in IngestionRun.stats.
+
+    Stage timers are cumulative: a stage entered once per row reports its total.
+    With profile=True the run is also captured with cProfile; the .prof dump path
+    and the top cumulative entries are included in the stats.
+    """
+
+    def __init__(self, run_id: Any, profile: bool = False, profile_dir: Optional[str] = None):
+        self.run_id = run_id
+        self.stage_seconds: Dict[str, float] = defaultdict(float)
+        self.stage_calls: Dict[str, int] = defaultdict(int)
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.cache_lookups: Dict[str, Dict[str, int]] = {}
+        self.flush_latencies: Dict[str, Dict[str, Any]] = {}
+
+        self.profile = profile
+        self.profile_dir = profile_dir
+        self._profiler: Optional[cProfile.Profile] = None
+        self._profile_summary: Optional[Dict[str, Any]] = None
+
+        self._started_at = perf_counter()
+        self._finished_at: Optional[float] = None
+
+    # --- COLLECTION ---
+    @contextmanager
+    def stage(self, name: str):
+        started_at = perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] += perf_counter() - started_at
+            self.stage_calls[name] += 1
+
+    def timed_iter(self, name: str, iterable: Iterable) -> Iterator:
+        """Attributes the time spent producing each item (e.g. parser.parse()) to a stage."""
+        iterator = iter(iterable)
+        while True:
+            started_at = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.stage_seconds[name] += perf_counter() - started_at
+                return
+            self.stage_seconds[name] += perf_counter() - started_at
+            self.stage_calls[name] += 1
+            yield item
+
+    @contextmanager
+    def flush(self, name: str, rows: int = 0):
+        started_at = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_flush(name, perf_counter() - started_at, rows)
+
+    def observe_flush(self, name: str, seconds: float, rows: int = 0):
+        latency_ms = seconds * 1000
+        entry = self.flush_latencies.setdefault(name, {
+            "count": 0, "rows": 0, "total_ms": 0.0, "max_ms": 0.0,
+            "buckets": [0] * (len(FLUSH_LATENCY_BUCKETS_MS) + 1),
+        })
+        entry["count"] += 1
+        entry["rows"] += rows
+        entry["total_ms"] += latency_ms
+        entry["max_ms"] = max(entry["max_ms"], latency_ms)
+        entry["buckets"][bisect_left(FLUSH_LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+        self.stage_seconds["flush"] += seconds
+        self.stage_calls["flush"] += 1
+
+    def incr(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    def record_cache(self, name: str, hits: int, lookups: int):
+        entry = self.cache_lookups.setdefault(name, {"hits": 0, "lookups": 0})
+        entry["hits"] += hits
+        entry["lookups"] += lookups
+
+    # --- PROFILING ---
+    def start_profile(self):
+        if not self.profile or self._profiler is not None:
+            return
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop_profile(self):
+        if self._profiler is None:
+            return
+        self._profiler.disable()
+        profiler, self._profiler = self._profiler, None
+
+        summary: Dict[str, Any] = {"engine": "cProfile"}
+        if self.profile_dir:
+            try:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                dump_path = os.path.join(self.profile_dir, f"{self.run_id}.prof")
+                profiler.dump_stats(dump_path)
+                summary["dump_path"] = dump_path
+            except OSError as e:
+                logger.warning(f"Could not persist profile for run {self.run_id}: {e}")
+
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(25)
+        summary["top_cumulative"] = stream.getvalue().splitlines()[-40:]
+        self._profile_summary = summary
+
+    # --- RENDERING ---
+    @property
+    def finished(self) -> bool:
+        return self._finished_at is not None
+
+    def finish(self):
+        if self._finished_at is None:
+            self._finished_at = perf_counter()
+        self.stop_profile()
+
+    def to_stats(self) -> Dict[str, Any]:
+        elapsed = (self._finished_at or perf_counter()) - self._started_at
+        rows = self.counters.get("rows", 0)
+        pages = self.counters.get("pages", 0)
+        parse_seconds = self.stage_seconds.get("parse", 0.0)
+
+        stats: Dict[str, Any] = {
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "counters": dict(self.counters),
+            "stages_ms": {name: round(seconds * 1000, 2) for name, seconds in self.stage_seconds.items()},
+            "stage_calls": dict(self.stage_calls),
+            "throughput": {
+                "rows_per_sec": round(rows / elapsed, 2) if elapsed > 0 else None,
+                "pages_per_sec": round(pages / parse_seconds, 2) if pages and parse_seconds > 0 else None,
+            },
+            "flush_latency_ms": {
+                name: {
+                    "count": entry["count"],
+                    "rows": entry["rows"],
+                    "avg": round(entry["total_ms"] / entry["count"], 2) if entry["count"] else None,
+                    "max": round(entry["max_ms"], 2),
+                    "histogram": dict(zip(
+                        [f"le_{b}" for b in FLUSH_LATENCY_BUCKETS_MS] + ["gt_last"],
+                        entry["buckets"],
+                    )),
+                }
+                for name, entry in self.flush_latencies.items()
+            },
+            "cache_hit_rates": {
+                name: {
+                    **entry,
+                    "hit_rate": round(entry["hits"] / entry["lookups"], 4) if entry["lookups"] else None,
+                }
+                for name, entry in self.cache_lookups.items()
+            },
+        }
+        if self._profile_summary:
+            stats["profile"] = self._profile_summary
+        return stats
@@ -1,6 +1,8 @@
+from typing import Any, Dict, List, Set, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import select
-from app.models import ExamBranchRegistry, ExamBranchAlias, ExamCourseType, ExamCourseTypeAlias
+from sqlalchemy.dialects.postgresql import insert
+from app.models import ExamBranchRegistry, ExamBranchAlias, ExamCourseType, ExamCourseTypeAlias, SeatBucketTaxonomy
 
 class TaxonomyCache:
     """
@@ -10,6 +12,8 @@ class TaxonomyCache:
     def __init__(self, db: Session, exam_code: str):
         self.valid_branches = set()
         self.valid_courses = set()
+        self.lookups = 0
+        self.hits = 0
         self._load(db, exam_code)
 
     def _load(self, db: Session, exam_code: str):
@@ -30,7 +34,90 @@ class TaxonomyCache:
         ).all())
 
     def is_branch_known(self, norm_name: str) -> bool:
-        return norm_name in self.valid_branches
+        return self._track(norm_name in self.valid_branches)
 
     def is_course_known(self, norm_name: str) -> bool:
-        return norm_name in self.valid_courses
\ No newline at end of file
+        return self._track(norm_name in self.valid_courses)
+
+    def _track(self, known: bool) -> bool:
+        self.lookups += 1
+        self.hits += known
+        return known
+
+class SeatBucketCache:
+    """
+    In-Memory seat bucket registry for a single ingestion run.
+
+    Known bucket codes are pre-loaded per exam on first use (one query per exam).
+    seat_bucket_code is the table's primary key, so a per-exam miss falls back to a
+    global lookup before the bucket is declared unknown. Buckets discovered in
+    BOOTSTRAP mode are staged and written with a single INSERT ... ON CONFLICT
+    DO NOTHING per flush batch.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+        self.known_buckets: Dict[str, Set[str]] = {}
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        # Codes confirmed absent from the table (staged ones are found in pending first).
+        self.absent_buckets: Set[str] = set()
+        # (exam_code, slug) staged since the last begin_row(), undone by discard_row().
+        self._row_staged: List[Tuple[str, str]] = []
+        self.lookups = 0
+        self.hits = 0
+
+    def _buckets_for(self, exam_code: str) -> Set[str]:
+        if exam_code not in self.known_buckets:
+            self.known_buckets[exam_code] = set(self.db.scalars(
+                select(SeatBucketTaxonomy.seat_bucket_code).where(SeatBucketTaxonomy.exam_code == exam_code)
+            ).all())
+        return self.known_buckets[exam_code]
+
+    def is_bucket_known(self, exam_code: str, slug: str) -> bool:
+        known = (
+            slug in self.pending
+            or slug in self._buckets_for(exam_code)
+            or self._exists_globally(exam_code, slug)
+        )
+        self.lookups += 1
+        self.hits += known
+        return known
+
+    def _exists_globally(self, exam_code: str, slug: str) -> bool:
+        if slug in self.absent_buckets:
+            return False
+        exists = self.db.scalar(
+            select(SeatBucketTaxonomy.seat_bucket_code).where(SeatBucketTaxonomy.seat_bucket_code == slug)
+        ) is not None
+        if exists:
+            self._buckets_for(exam_code).add(slug)
+        else:
+            self.absent_buckets.add(slug)
+        return exists
+
+    def stage_bucket(self, exam_code: str, slug: str, values: Dict[str, Any]):
+        self.pending[slug] = values
+        self._buckets_for(exam_code).add(slug)
+        self._row_staged.append((exam_code, slug))
+
+    def begin_row(self):
+        self._row_staged.clear()
+
+    def discard_row(self):
+        """Forgets buckets staged since begin_row() (a rejected row must leave no taxonomy)."""
+        for exam_code, slug in reversed(self._row_staged):
+            self.pending.pop(slug, None)
+            self.known_buckets.get(exam_code, set()).discard(slug)
+        self._row_staged.clear()
+
+    def flush(self) -> int:
+        if not self.pending:
+            return 0
+        count = len(self.pending)
+        self.db.execute(
+            insert(SeatBucketTaxonomy)
+            .values(list(self.pending.values()))
+            .on_conflict_do_nothing(index_elements=['seat_bucket_code'])
+        )
+        self.pending.clear()
+        self._row_staged.clear()
+        return count
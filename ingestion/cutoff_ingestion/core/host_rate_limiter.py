@@ -0,0 +1,43 @@
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+
+class HostTokenBucket:
+    """
+    Thread-safe per-host token bucket.
+
+    Each host refills at `rate_per_second` tokens up to `burst`. acquire() reserves
+    a token immediately (the balance may go negative) and sleeps outside the lock
+    until that reservation matures, so concurrent callers for the same host are
+    spaced evenly while different hosts never wait on each other.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # host -> (tokens, last_refill)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_delay(cls, delay_seconds: float, burst: int = 1) -> "HostTokenBucket":
+        return cls(1.0 / delay_seconds if delay_seconds > 0 else 0.0, burst)
+
+    def acquire(self, url: str) -> float:
+        """Blocks until a request to url's host is allowed. Returns the seconds waited."""
+        if self.rate_per_second <= 0:
+            return 0.0
+
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            tokens, last_refill = self._buckets.get(host, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - last_refill) * self.rate_per_second)
+            tokens -= 1.0
+            self._buckets[host] = (tokens, now)
+            wait = -tokens / self.rate_per_second if tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
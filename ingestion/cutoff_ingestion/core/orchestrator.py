@@ -1,16 +1,26 @@
 import logging
 import requests
 import hashlib
-import time
 import os
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from sqlalchemy.orm import Session
 from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
 from ingestion.common.services.governance import IngestionGovernanceController
 from ingestion.cutoff_ingestion.core.base_plugin import BaseCutoffPlugin
-from app.models import DiscoveredArtifact
+from ingestion.cutoff_ingestion.core.base_scanner import ScannedArtifact
+from ingestion.cutoff_ingestion.core.host_rate_limiter import HostTokenBucket
+from ingestion.common.config import (
+    CUTOFF_SCAN_CONCURRENCY,
+    CUTOFF_SCAN_HOST_BURST,
+    CUTOFF_SEED_FULL_RESCAN_HOURS,
+)
+from app.models import DiscoveredArtifact, SeedPageValidator
 
 # [SECURITY] Configurable Verification
 VERIFY_SSL = os.getenv("VERIFY_SSL", "false").lower() == "true"
@@ -20,10 +30,14 @@ if not VERIFY_SSL:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+Fingerprint = Tuple[bool, Optional[str], int]
+
+
 class UniversalNotificationOrchestrator:
-    def __init__(self, governance: IngestionGovernanceController):
+    def __init__(self, governance: IngestionGovernanceController, concurrency: Optional[int] = None):
         self.governance = governance
         self.request_timeout = 30
+        self.concurrency = max(1, concurrency if concurrency is not None else CUTOFF_SCAN_CONCURRENCY)
         
         # --- ENTERPRISE RESILIENCE: Connection Pooling & Retries ---
         self.session = requests.Session()
@@ -33,11 +47,12 @@ class UniversalNotificationOrchestrator:
             status_forcelist=[500, 502, 503, 504],
             allowed_methods=["HEAD", "GET"]
         )
-        adapter = HTTPAdapter(max_retries=retries)
+        # Pool sized for the concurrent liveness checks (requests.Session is shared across threads).
+        adapter = HTTPAdapter(max_retries=retries, pool_maxsize=self.concurrency)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
-    def _get_remote_fingerprint(self, url: str, headers: dict) -> tuple[bool, str, int]:
+    def _get_remote_fingerprint(self, url: str, headers: dict) -> Fingerprint:
         """
         Robust 'Head Check' with Range GET Fallback.
         Now natively supports local file artifacts (e.g., JoSAA HTML dumps).
@@ -116,97 +131,211 @@ class UniversalNotificationOrchestrator:
         
         headers = getattr(plugin, 'get_request_headers', lambda: {'User-Agent': 'DerivedBot/1.0'})()
         
-        # 1. Fetch Seed Page
+        # 1. Fetch Seed Page (conditional when a clean scan of it is on record)
+        validator = self._load_seed_validator(db, plugin.get_slug(), year, target_url)
+        revalidate = validator is not None and not self._full_rescan_due(validator)
+
+        request_headers = dict(headers)
+        if revalidate:
+            if validator.etag:
+                request_headers["If-None-Match"] = validator.etag
+            if validator.last_modified:
+                request_headers["If-Modified-Since"] = validator.last_modified
+
         try:
-            response = self.session.get(target_url, headers=headers, timeout=self.request_timeout, verify=VERIFY_SSL)
+            response = self.session.get(target_url, headers=request_headers, timeout=self.request_timeout, verify=VERIFY_SSL)
             response.raise_for_status()
         except Exception as e:
             logger.error(f"Failed to fetch seed page: {e}")
             return 0
 
+        # [EFFICIENCY] Unchanged seed page: nothing new can be linked from it.
+        body_hash = None if response.status_code == 304 else hashlib.sha256(response.content).hexdigest()
+        if revalidate and (response.status_code == 304 or body_hash == validator.body_hash):
+            return self._record_unchanged_seed(db, validator, response, year)
+
         # 2. DELEGATE TO SCANNER STRATEGY
         scanner = plugin.get_scanner()
         artifacts = scanner.extract_artifacts(response.content, target_url, year=year)
         
         # --- OBSERVABILITY METRICS ---
-        metrics = {"found": len(artifacts), "new": 0, "updated": 0, "failed": 0, "skipped_dead": 0}
+        metrics = {"found": len(artifacts), "new": 0, "updated": 0, "failed": 0, "skipped_dead": 0, "seed_unchanged": 0}
         logger.info(f"Scanner identified {metrics['found']} valid candidates.")
 
-        # 3. PROCESS LOOP
+        # Same link listed twice on a notice board: fingerprint and register it once.
+        unique_artifacts: Dict[str, ScannedArtifact] = {}
         for item in artifacts:
-            # Check DB (Read - Fast)
-            existing_artifact = db.execute(
+            unique_artifacts.setdefault(item.url, item)
+        artifacts = list(unique_artifacts.values())
+
+        # 3. PRELOAD KNOWN ARTIFACTS (one query instead of one per link)
+        existing_by_path: Dict[str, DiscoveredArtifact] = {
+            artifact.pdf_path: artifact
+            for artifact in db.execute(
                 select(DiscoveredArtifact).where(
                     DiscoveredArtifact.exam_code == plugin.get_slug(),
                     DiscoveredArtifact.year == year,
-                    DiscoveredArtifact.pdf_path == item.url
                 )
-            ).scalar_one_or_none()
+            ).scalars()
+        }
 
-            # [EFFICIENCY] Politeness Delay only before Network Calls
-            time.sleep(plugin.get_politeness_delay())
+        # 4. LIVENESS CHECKS (Network - Slow, bounded concurrency + per-host politeness)
+        fingerprints = self._fingerprint_all(artifacts, headers, plugin.get_politeness_delay())
 
-            # Liveness Check (Network - Slow)
-            is_live, remote_hash, size = self._get_remote_fingerprint(item.url, headers)
-            if not is_live: 
+        # 5. APPLY (one transaction; a savepoint per artifact keeps one bad row from sinking the scan)
+        for item, (is_live, remote_hash, size) in zip(artifacts, fingerprints):
+            if not is_live:
                 metrics["skipped_dead"] += 1
-                continue 
+                continue
 
-            # DB Operations (Write)
             try:
-                if existing_artifact:
-                    existing_artifact.last_seen_at = func.now()
-                    
-                    if existing_artifact.content_hash is None:
-                        existing_artifact.content_hash = remote_hash
-                        db.commit()
-                        metrics["updated"] += 1
-                        continue
-                    
-                    if existing_artifact.content_hash != remote_hash:
-                        logger.warning(f"⚠️ Silent Revision: {item.url}")
-                        existing_artifact.previous_content_hash = existing_artifact.content_hash
-                        existing_artifact.content_hash = remote_hash
-                        if existing_artifact.status != "PENDING":
-                            existing_artifact.status = "PENDING"
-                            existing_artifact.review_notes = f"Auto-Reset. Size: {size}b"
-                        db.commit()
-                        metrics["updated"] += 1
-                    else:
-                        db.commit()
-                else:
-                    clean_name, original_name, is_standardized = plugin.normalize_artifact_name(item.link_text)
-                    
-                    metadata = {
-                        "year": year,
-                        "round_name": clean_name,
-                        "original_name": original_name,
-                        "is_standardized": is_standardized,
-                        "round": item.detected_round, 
-                        "seat_type": None, 
-                        "exam_slug": plugin.get_slug(),
-                        "detection_method": item.detection_method,
-                        "context_header": item.context_header
-                    }
-
-                    art_id = self.governance.register_discovery(
-                        db=db, pdf_path=item.url, notification_url=target_url,
-                        metadata=metadata, detection_reason=f"Scanner:{item.detection_method}",
-                        source="PDF_LINK"
-                    )
-                    db.execute(
-                        update(DiscoveredArtifact)
-                        .where(DiscoveredArtifact.id == art_id)
-                        .values(content_hash=remote_hash)
+                with db.begin_nested():
+                    outcome = self._apply_artifact(
+                        db, plugin, year, target_url, item,
+                        existing_by_path.get(item.url), remote_hash, size,
                     )
-                    db.commit()
-                    metrics["new"] += 1
-                    logger.info(f"✅ Discovered: {clean_name} (Round: {item.detected_round})")
-                    
+                if outcome:
+                    metrics[outcome] += 1
             except Exception as e:
-                db.rollback()
                 metrics["failed"] += 1
                 logger.error(f"Transaction failed for {item.url}: {e}")
 
+        # Validators only follow a clean scan; dead links / failures are retried next run.
+        if not metrics["failed"] and not metrics["skipped_dead"]:
+            self._store_seed_validator(db, plugin.get_slug(), year, target_url, response, body_hash)
+
+        try:
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[{year}] Scan commit failed, no discoveries persisted: {e}")
+            raise
+
         logger.info(f"[{year}] Run Complete. Metrics: {metrics}")
-        return metrics["new"]
\ No newline at end of file
+        return metrics["new"]
+
+    # --- SEED PAGE VALIDATORS ---
+    @staticmethod
+    def _load_seed_validator(db: Session, exam_code: str, year: int, seed_url: str) -> Optional[SeedPageValidator]:
+        return db.execute(
+            select(SeedPageValidator).where(
+                SeedPageValidator.exam_code == exam_code,
+                SeedPageValidator.year == year,
+                SeedPageValidator.seed_url == seed_url,
+            )
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def _full_rescan_due(validator: SeedPageValidator) -> bool:
+        if CUTOFF_SEED_FULL_RESCAN_HOURS <= 0:
+            return True
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=CUTOFF_SEED_FULL_RESCAN_HOURS)
+        return validator.last_full_scan_at is None or validator.last_full_scan_at < cutoff
+
+    def _record_unchanged_seed(self, db: Session, validator: SeedPageValidator, response, year: int) -> int:
+        validator.last_checked_at = func.now()
+        validator.unchanged_skip_count = (validator.unchanged_skip_count or 0) + 1
+        # A 304 may carry refreshed validators.
+        if response.headers.get("ETag"):
+            validator.etag = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validator.last_modified = response.headers["Last-Modified"]
+        db.commit()
+
+        metrics = {
+            "found": 0, "new": 0, "updated": 0, "failed": 0, "skipped_dead": 0,
+            "seed_unchanged": 1,
+            "seed_check": "not_modified" if response.status_code == 304 else "hash_match",
+        }
+        logger.info(f"[{year}] Seed page unchanged. Skipping extraction and liveness checks. Metrics: {metrics}")
+        return 0
+
+    @staticmethod
+    def _store_seed_validator(db: Session, exam_code: str, year: int, seed_url: str, response, body_hash: str):
+        values = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body_hash": body_hash,
+            "last_full_scan_at": func.now(),
+            "last_checked_at": func.now(),
+            "unchanged_skip_count": 0,
+            "updated_at": func.now(),
+        }
+        db.execute(
+            insert(SeedPageValidator)
+            .values(exam_code=exam_code, year=year, seed_url=seed_url, **values)
+            .on_conflict_do_update(constraint="uq_seed_page_validator_identity", set_=values)
+        )
+
+    def _fingerprint_all(self, artifacts: List[ScannedArtifact], headers: dict, politeness_delay: float) -> List[Fingerprint]:
+        """Fingerprints every candidate, preserving order. Politeness is per host, not a global sleep."""
+        limiter = HostTokenBucket.from_delay(politeness_delay, CUTOFF_SCAN_HOST_BURST)
+
+        def _check(item: ScannedArtifact) -> Fingerprint:
+            if not (item.url.startswith("./") or item.url.startswith("/")):
+                limiter.acquire(item.url)
+            return self._get_remote_fingerprint(item.url, headers)
+
+        workers = min(self.concurrency, len(artifacts))
+        if workers <= 1:
+            return [_check(item) for item in artifacts]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan-liveness") as pool:
+            return list(pool.map(_check, artifacts))
+
+    def _apply_artifact(
+        self,
+        db: Session,
+        plugin: BaseCutoffPlugin,
+        year: int,
+        target_url: str,
+        item: ScannedArtifact,
+        existing_artifact: Optional[DiscoveredArtifact],
+        remote_hash: Optional[str],
+        size: int,
+    ) -> Optional[str]:
+        """Stages the DB changes for one live artifact. Returns the metric to bump, if any."""
+        if existing_artifact:
+            existing_artifact.last_seen_at = func.now()
+
+            if existing_artifact.content_hash is None:
+                existing_artifact.content_hash = remote_hash
+                return "updated"
+
+            if existing_artifact.content_hash != remote_hash:
+                logger.warning(f"⚠️ Silent Revision: {item.url}")
+                existing_artifact.previous_content_hash = existing_artifact.content_hash
+                existing_artifact.content_hash = remote_hash
+                if existing_artifact.status != "PENDING":
+                    existing_artifact.status = "PENDING"
+                    existing_artifact.review_notes = f"Auto-Reset. Size: {size}b"
+                return "updated"
+
+            return None
+
+        clean_name, original_name, is_standardized = plugin.normalize_artifact_name(item.link_text)
+
+        metadata = {
+            "year": year,
+            "round_name": clean_name,
+            "original_name": original_name,
+            "is_standardized": is_standardized,
+            "round": item.detected_round,
+            "seat_type": None,
+            "exam_slug": plugin.get_slug(),
+            "detection_method": item.detection_method,
+            "context_header": item.context_header
+        }
+
+        art_id = self.governance.register_discovery(
+            db=db, pdf_path=item.url, notification_url=target_url,
+            metadata=metadata, detection_reason=f"Scanner:{item.detection_method}",
+            source="PDF_LINK"
+        )
+        db.execute(
+            update(DiscoveredArtifact)
+            .where(DiscoveredArtifact.id == art_id)
+            .values(content_hash=remote_hash)
+        )
+        logger.info(f"✅ Discovered: {clean_name} (Round: {item.detected_round})")
+        return "new"
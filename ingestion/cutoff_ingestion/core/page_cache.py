@@ -0,0 +1,196 @@
+import os
+import hashlib
+import logging
+from typing import Any, Iterator, Optional, Tuple
+
+import msgpack
+
+from ingestion.common.config import PDF_PAGE_CACHE_DIR, PDF_PAGE_CACHE_ENABLED, PDF_PAGE_CACHE_MAX_MB
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractedPageCache:
+    """
+    Persistent cache of raw extracted page structures (table grids, gap text,
+    positioned text lines) produced by PageShardedExtractor.
+
+    Keyed by (PDF content digest, extraction version). Adapter / standardizer
+    fixes and BOOTSTRAP re-runs therefore replay cached pages and skip pdfplumber
+    entirely. Any change to a page function or its table settings MUST bump its
+    extraction version.
+
+    File layout (msgpack stream): header map, then one [page_index, payload] per page.
+    Writes go to a temp file and are renamed only after the last page, so readers
+    never observe partial entries.
+
+    The directory is bounded by max_mb: hits refresh an entry's mtime and every
+    store prunes the least recently used entries until the cap holds again.
+    """
+
+    FORMAT_VERSION = 1
+
+    ENTRY_SUFFIX = ".msgpack"
+
+    def __init__(
+        self,
+        cache_dir: str = PDF_PAGE_CACHE_DIR,
+        enabled: bool = PDF_PAGE_CACHE_ENABLED,
+        max_mb: int = PDF_PAGE_CACHE_MAX_MB,
+    ):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.max_bytes = max(0, max_mb) * 1024 * 1024
+        if self.enabled:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Page cache directory unavailable ({self.cache_dir}): {e}. Cache disabled.")
+                self.enabled = False
+
+    @staticmethod
+    def content_digest(pdf_path: str) -> str:
+        hasher = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def build_version(page_fn, extraction_version: str) -> str:
+        import pdfplumber  # deferred: keeps the PDF stack out of scan-only imports
+
+        return f"{page_fn.__module__}.{page_fn.__qualname__}:{extraction_version}:pdfplumber-{pdfplumber.__version__}"
+
+    def _entry_path(self, content_digest: str, version: str) -> str:
+        version_digest = hashlib.sha256(version.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{content_digest}.{version_digest}{self.ENTRY_SUFFIX}")
+
+    def load(self, content_digest: str, version: str) -> Optional[Iterator[Tuple[int, Any]]]:
+        """Returns a page iterator on hit, None on miss (or when disabled)."""
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(content_digest, version)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                header = next(msgpack.Unpacker(f, raw=False), None)
+        except Exception:
+            logger.warning(f"Unreadable page cache entry {path}. Treating as miss.")
+            return None
+
+        if not header or header.get("format") != self.FORMAT_VERSION or header.get("version") != version:
+            return None
+
+        try:
+            os.utime(path)  # LRU recency for prune()
+        except OSError:
+            pass
+
+        logger.info(f"⚡ Page cache HIT ({header.get('pages')} pages): {path}")
+        return self._iter_entry(path)
+
+    @staticmethod
+    def _iter_entry(path: str) -> Iterator[Tuple[int, Any]]:
+        with open(path, "rb") as f:
+            unpacker = msgpack.Unpacker(f, raw=False)
+            next(unpacker)  # header
+            for page_index, payload in unpacker:
+                yield page_index, payload
+
+    def store(
+        self,
+        content_digest: str,
+        version: str,
+        total_pages: int,
+        pages: Iterator[Tuple[int, Any]],
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Pass-through generator: yields every page to the caller while streaming it
+        to disk. The entry is committed only if the caller consumes all pages.
+        """
+        if not self.enabled:
+            yield from pages
+            return
+
+        path = self._entry_path(content_digest, version)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        packer = msgpack.Packer(use_bin_type=True)
+        handle = None
+        completed = False
+
+        try:
+            # Cache writes are best-effort: an I/O failure never fails the parse.
+            try:
+                handle = open(tmp_path, "wb")
+                handle.write(packer.pack({
+                    "format": self.FORMAT_VERSION,
+                    "version": version,
+                    "pages": total_pages,
+                }))
+            except Exception as e:
+                logger.warning(f"Page cache disabled for this run ({tmp_path}): {e}")
+                if handle is not None:
+                    handle.close()
+                handle = None
+
+            for page_index, payload in pages:
+                if handle is not None:
+                    try:
+                        handle.write(packer.pack([page_index, payload]))
+                    except Exception as e:
+                        logger.warning(f"Page cache write failed ({tmp_path}): {e}")
+                        handle.close()
+                        handle = None
+                yield page_index, payload
+
+            completed = True
+        finally:
+            if handle is not None:
+                handle.close()
+                if completed:
+                    os.replace(tmp_path, path)
+                    logger.info(f"💾 Page cache STORED ({total_pages} pages): {path}")
+                    self.prune(keep=path)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def prune(self, keep: Optional[str] = None) -> int:
+        """Deletes least recently used entries until the directory fits max_bytes."""
+        if not self.enabled or not self.max_bytes:
+            return 0
+
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(self.ENTRY_SUFFIX) and entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            logger.warning(f"Page cache prune skipped ({self.cache_dir}): {e}")
+            return 0
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # pruned concurrently by another worker
+            except OSError as e:
+                logger.warning(f"Could not prune page cache entry {path}: {e}")
+                continue
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"🧹 Page cache pruned {removed} entries (now {total / (1024 * 1024):.0f} MB)")
+        return removed
@@ -0,0 +1,232 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ingestion.common.config import PDF_EXTRACTION_WORKERS, PDF_EXTRACTION_SHARD_SIZE
+from ingestion.cutoff_ingestion.core.page_cache import ExtractedPageCache
+
+logger = logging.getLogger(__name__)
+
+# A page function receives one pdfplumber Page and returns a picklable payload
+# (plain dicts / lists / floats / strings). It must be a module-level callable.
+PageFunction = Callable[[Any], Any]
+
+# pdfplumber (and pdfminer under it) is imported where pages are actually opened:
+# process_artifacts imports this module for EXTRACTION_COUNTERS, and scan-only
+# workers / the API must not pay for the PDF stack.
+
+# Effective pool size for extractors built in this process. Callers that already run
+# inside a process pool (ingestion lanes) lower it via set_extraction_worker_cap().
+_worker_cap: int = PDF_EXTRACTION_WORKERS
+
+
+def set_extraction_worker_cap(max_workers: int):
+    """Caps the extraction pool for this process. 1 forces inline extraction."""
+    global _worker_cap
+    _worker_cap = max(1, max_workers)
+
+
+def extraction_worker_cap() -> int:
+    return _worker_cap
+
+
+# Process-wide tallies ("pages", "page_cache_hits", "page_cache_misses").
+# Ingestion runs read deltas around a parse for their stats.
+EXTRACTION_COUNTERS: Counter = Counter()
+
+
+class PageShardedExtractor:
+    """
+    Page-Sharded PDF Extraction Stage.
+
+    pdfplumber table detection is pure CPU and dominates ingestion time for large
+    counselling PDFs. This stage farms contiguous page ranges out to a process pool,
+    each worker opening the PDF independently, and yields the raw per-page payloads
+    back in strict page order.
+
+    Parsers keep their stateful context machines (college/course carried across page
+    breaks) and simply replay the payloads sequentially, so output is unchanged.
+
+    When an extraction_version is supplied, payloads are persisted in the
+    ExtractedPageCache and re-ingesting the same PDF skips pdfplumber entirely.
+    """
+
+    def __init__(
+        self,
+        pdf_path: str,
+        page_fn: PageFunction,
+        max_workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        extraction_version: Optional[str] = None,
+        page_cache: Optional[ExtractedPageCache] = None,
+    ):
+        self.pdf_path = pdf_path
+        self.page_fn = page_fn
+        cap = extraction_worker_cap()
+        self.max_workers = min(max_workers, cap) if max_workers is not None else cap
+        self.shard_size = max(1, shard_size or PDF_EXTRACTION_SHARD_SIZE)
+        self.extraction_version = extraction_version
+        self.page_cache = page_cache
+
+    def iter_pages(self) -> Iterator[Tuple[int, Any]]:
+        """Yields (page_index, payload) in page order. page_index is 0-based."""
+        for page in self._iter_pages():
+            EXTRACTION_COUNTERS["pages"] += 1
+            yield page
+
+    def _iter_pages(self) -> Iterator[Tuple[int, Any]]:
+        if not self.extraction_version:
+            yield from self._extract_pages()
+            return
+
+        cache = self.page_cache or ExtractedPageCache()
+        if not cache.enabled:
+            yield from self._extract_pages()
+            return
+
+        content_digest = cache.content_digest(self.pdf_path)
+        version = cache.build_version(self.page_fn, self.extraction_version)
+
+        cached_pages = cache.load(content_digest, version)
+        if cached_pages is not None:
+            EXTRACTION_COUNTERS["page_cache_hits"] += 1
+            yield from cached_pages
+            return
+
+        EXTRACTION_COUNTERS["page_cache_misses"] += 1
+
+        total_pages = self._count_pages()
+        yield from cache.store(content_digest, version, total_pages, self._extract_pages(total_pages))
+
+    def _count_pages(self) -> int:
+        import pdfplumber
+
+        with pdfplumber.open(self.pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def _extract_pages(self, total_pages: Optional[int] = None) -> Iterator[Tuple[int, Any]]:
+        if total_pages is None:
+            total_pages = self._count_pages()
+
+        shards = [
+            (start, min(start + self.shard_size, total_pages))
+            for start in range(0, total_pages, self.shard_size)
+        ]
+
+        if not self._use_pool(len(shards)):
+            for start, end in shards:
+                yield from _extract_shard(self.pdf_path, start, end, self.page_fn)
+            return
+
+        workers = min(self.max_workers, len(shards))
+        logger.info(
+            f"🧩 Page-sharded extraction: {total_pages} pages | "
+            f"{len(shards)} shards x {self.shard_size} | {workers} workers"
+        )
+
+        # Bounded look-ahead keeps at most 2 shards per worker buffered in the parent.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending_shards = deque(shards)
+            window = deque()
+
+            while pending_shards or window:
+                while pending_shards and len(window) < workers * 2:
+                    start, end = pending_shards.popleft()
+                    window.append(pool.submit(_extract_shard, self.pdf_path, start, end, self.page_fn))
+
+                yield from window.popleft().result()
+
+    def _use_pool(self, shard_count: int) -> bool:
+        if self.max_workers <= 1 or shard_count <= 1:
+            return False
+        # Daemonic processes (e.g. Celery prefork children) cannot spawn children.
+        if multiprocessing.current_process().daemon:
+            logger.info("Running inside a daemonic worker. Falling back to inline extraction.")
+            return False
+        return True
+
+
+def _extract_shard(pdf_path: str, start: int, end: int, page_fn: PageFunction) -> List[Tuple[int, Any]]:
+    import pdfplumber
+
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_index in range(start, end):
+            page = pdf.pages[page_index]
+            try:
+                results.append((page_index, page_fn(page)))
+            finally:
+                page.flush_cache()
+    return results
+
+
+# ==========================================================
+# SHARED PAGE FUNCTIONS
+# ==========================================================
+
+def extract_spatial_tables(
+    page,
+    table_settings: Dict[str, Any],
+    fallback_settings: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Tables in detection order, each with its bbox, extracted grid and the text
+    physically located in the gap between it and the previous table.
+    gap_text is None when there is no gap (or cropping failed).
+    """
+    tables = page.find_tables(table_settings=table_settings)
+    if not tables and fallback_settings:
+        tables = page.find_tables(table_settings=fallback_settings)
+
+    payload_tables = []
+    prev_table_bottom = 0
+
+    for table in tables:
+        top_bound = prev_table_bottom
+        bottom_bound = table.bbox[1]
+
+        gap_text = None
+        if bottom_bound - top_bound > 5:
+            try:
+                crop = page.crop((0, top_bound, page.width, bottom_bound))
+                gap_text = crop.extract_text() or ""
+            except Exception:
+                # Cropping can fail on edge cases; ignore safely
+                gap_text = None
+
+        payload_tables.append({
+            "bbox": tuple(table.bbox),
+            "gap_text": gap_text,
+            "grid": table.extract(),
+        })
+        prev_table_bottom = table.bbox[3]
+
+    return {"tables": payload_tables}
+
+
+def extract_positioned_lines_and_tables(page, table_settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Positioned text lines (sorted top-to-bottom) plus tables (sorted by top edge).
+    Character-level detail is dropped to keep payloads small.
+    """
+    text_lines = [
+        {"text": line["text"], "top": line["top"], "bottom": line["bottom"]}
+        for line in page.extract_text_lines()
+    ]
+    text_lines.sort(key=lambda x: x["top"])
+
+    tables = page.find_tables(table_settings=table_settings)
+    tables.sort(key=lambda t: t.bbox[1])
+
+    return {
+        "height": page.height,
+        "text_lines": text_lines,
+        "tables": [{"bbox": tuple(t.bbox), "grid": t.extract()} for t in tables],
+    }
+
+
+def extract_table_grids(page, table_settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Plain extract_tables() grids, no geometry."""
+    return {"tables": page.extract_tables(table_settings=table_settings)}
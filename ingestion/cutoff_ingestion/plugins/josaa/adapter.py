@@ -1,8 +1,6 @@
 from typing import Dict, Any, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
-from ingestion.common.interface.context_interface import ContextAdapter
+from ingestion.common.interface.context_interface import ContextAdapter, ExamMetadataRecord
 from app.models import JosaaCollegeMetadata
 
 class JosaaAdapter(ContextAdapter):
@@ -51,26 +49,22 @@ class JosaaAdapter(ContextAdapter):
             "program_name": row.get('program_name', 'UNKNOWN')
         }
 
-    def upsert_exam_metadata(self, db: Session, college_id: UUID, row: Dict[str, Any]):
+    def build_exam_metadata(self, college_id: UUID, row: Dict[str, Any]) -> Optional[ExamMetadataRecord]:
         """
-        Executes idempotent metadata insert. 
+        Idempotent metadata row. 
         Updates source_artifact_id if a newer artifact is processed to preserve lineage.
         """
-        stmt = insert(JosaaCollegeMetadata).values(
-            college_id=college_id,
-            institute_name_raw=row['college_name_raw'],
-            institute_type=row['institute_type'],
-            exam_code=row['exam_code'],
-            year=row['year'],
-            source_artifact_id=row['source_document']
-        )
-        
-        stmt = stmt.on_conflict_do_update(
+        return ExamMetadataRecord(
+            model=JosaaCollegeMetadata,
+            values={
+                "college_id": college_id,
+                "institute_name_raw": row['college_name_raw'],
+                "institute_type": row['institute_type'],
+                "exam_code": row['exam_code'],
+                "year": row['year'],
+                "source_artifact_id": row['source_document'],
+            },
+            identity_columns=("college_id", "institute_name_raw", "year"),
             constraint='uq_josaa_metadata_identity',
-            set_={
-                'source_artifact_id': stmt.excluded.source_artifact_id
-            }
-        )
-        
-        db.execute(stmt)
-        db.flush() # Securely assigns ID while remaining inside the Universal transaction boundary
\ No newline at end of file
+            update_columns=("source_artifact_id",),
+        )
\ No newline at end of file
@@ -1,45 +1,97 @@
 import logging
-from bs4 import BeautifulSoup
-from typing import Iterator, Dict, Any
+from lxml import etree
+from typing import Iterator, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
 class JosaaGridParser:
     """
-    Pure HTML Grid Extractor utilizing C-backed lxml for massive 14MB+ files.
+    Streaming HTML Grid Extractor for massive 14MB+ JoSAA result files.
+
+    Uses C-backed lxml iterparse (HTML mode) instead of a full in-memory tree:
+    each <tr> of GridView1 is decoded when its end tag is seen, then cleared and
+    detached, so memory stays constant regardless of file size.
     """
+    TARGET_TABLE_ID = "ctl00_ContentPlaceHolder1_GridView1"
+
     def __init__(self, file_path: str):
         self.file_path = file_path
 
     def parse(self) -> Iterator[Dict[str, Any]]:
-        logger.info(f"Parsing HTML Grid from: {self.file_path}")
+        logger.info(f"Streaming HTML Grid from: {self.file_path}")
+
+        headers: List[str] = []
+        target_table = None
+        table_found = False
+
         with open(self.file_path, 'rb') as f:
-            soup = BeautifulSoup(f.read(), 'lxml')
-        
-        table = soup.find('table', id='ctl00_ContentPlaceHolder1_GridView1')
-        if not table:
+            context = etree.iterparse(f, events=("start", "end"), html=True, recover=True)
+
+            for event, elem in context:
+                if not isinstance(elem.tag, str):
+                    continue
+
+                if event == "start":
+                    if target_table is None and elem.tag == "table" and elem.get("id") == self.TARGET_TABLE_ID:
+                        target_table = elem
+                        table_found = True
+                    continue
+
+                # --- END EVENTS ---
+                if target_table is None:
+                    # Outside the grid: drop subtree content as soon as it closes
+                    elem.clear()
+                    continue
+
+                if elem is target_table:
+                    break
+
+                if elem.tag != "tr":
+                    continue
+
+                row_data = self._decode_row(elem, headers)
+                self._release_row(elem)
+
+                if row_data is not None:
+                    yield row_data
+
+            del context
+
+        if not table_found:
             logger.error("Target GridView1 not found in HTML. Stream may be corrupted.")
-            return
 
-        headers = []
-        for tr in table.find_all('tr'):
-            # Dynamic column mapping (Zero Hardcoding)
-            if not headers:
-                th_elements = tr.find_all('th')
-                if th_elements:
-                    headers = [th.get_text(separator=" ", strip=True) for th in th_elements]
-                continue
-            
-            td_elements = tr.find_all('td')
-            if not td_elements or len(td_elements) != len(headers):
-                continue
-            
-            row_data = {}
-            for i, td in enumerate(td_elements):
-                row_data[headers[i]] = td.get_text(separator=" ", strip=True)
-            
-            # --- MANDATORY DTO MAPPINGS FOR UNIVERSAL ENGINE ---
-            row_data["college_name_raw"] = row_data.get("Institute", "")
-            row_data["cutoff_rank"] = row_data.get("Closing Rank", "0")
-            
-            yield row_data
\ No newline at end of file
+    def _decode_row(self, tr, headers: List[str]):
+        # Dynamic column mapping (Zero Hardcoding)
+        if not headers:
+            th_elements = list(tr.iter('th'))
+            if th_elements:
+                headers.extend(self._cell_text(th) for th in th_elements)
+            return None
+
+        td_elements = list(tr.iter('td'))
+        if not td_elements or len(td_elements) != len(headers):
+            return None
+
+        row_data = {}
+        for i, td in enumerate(td_elements):
+            row_data[headers[i]] = self._cell_text(td)
+
+        # --- MANDATORY DTO MAPPINGS FOR UNIVERSAL ENGINE ---
+        row_data["college_name_raw"] = row_data.get("Institute", "")
+        row_data["cutoff_rank"] = row_data.get("Closing Rank", "0")
+
+        return row_data
+
+    @staticmethod
+    def _cell_text(cell) -> str:
+        # Equivalent of BeautifulSoup get_text(separator=" ", strip=True)
+        return " ".join(fragment.strip() for fragment in cell.itertext() if fragment.strip())
+
+    @staticmethod
+    def _release_row(tr):
+        tr.clear()
+        parent = tr.getparent()
+        if parent is None:
+            return
+        while tr.getprevious() is not None:
+            del parent[0]
@@ -1,12 +1,19 @@
+import threading
 import httpx
-from typing import Dict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Optional
 
 class JosaaNetworkClient:
     """
     Pure IO Layer. Manages session cookies exclusively for a single round's lifecycle.
     Limits connections to prevent socket exhaustion.
+
+    `gate` is an optional semaphore shared by every client of a harvest: each request
+    (and each streamed response, until it is closed) holds one slot, which caps the
+    total number of in-flight connections to the JoSAA server across rounds.
     """
-    def __init__(self, timeout: int = 45):
+    def __init__(self, timeout: int = 45, gate: Optional[threading.Semaphore] = None):
+        self._gate = gate
         self.client = httpx.Client(
             http2=False,
             follow_redirects=False,  # DO NOT CHANGE THIS YET
@@ -27,18 +34,28 @@ class JosaaNetworkClient:
             }
         )
 
+    def _slot(self):
+        return self._gate if self._gate is not None else nullcontext()
+
     def get(self, url: str) -> httpx.Response:
-        return self.client.get(url)
+        with self._slot():
+            return self.client.get(url)
 
     def post(self, url: str, data: Dict[str, str]) -> httpx.Response:
         headers = self.client.headers.copy()
         headers["Referer"] = url
-        return self.client.post(url, data=data, headers=headers)
+        with self._slot():
+            return self.client.post(url, data=data, headers=headers)
 
+    @contextmanager
     def stream_post(self, url: str, data: Dict[str, str]):
         headers = self.client.headers.copy()
         headers["Referer"] = url
-        return self.client.stream("POST", url, data=data, headers=headers)
+        with self._slot(), self.client.stream("POST", url, data=data, headers=headers) as response:
+            yield response
+
+    def reset_cookies(self):
+        self.client.cookies.clear()
 
     def close(self):
         self.client.close()
@@ -1,7 +1,10 @@
 import os
 import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Optional
+from ingestion.common.config import JOSAA_PARALLEL_ROUNDS, JOSAA_MAX_CONNECTIONS
 from ingestion.cutoff_ingestion.core.base_scanner import BaseScanner, ScannedArtifact
 from .state_machine import JosaaStateMachine
 
@@ -17,7 +20,10 @@ class JosaaScanner(BaseScanner):
         if year is None:
             raise ValueError("JoSAA scanner requires an explicit year context to operate.")
             
-        machine = JosaaStateMachine(base_url, year)
+        # One semaphore for the whole harvest: rounds keep separate cookie jars,
+        # but never hold more than JOSAA_MAX_CONNECTIONS sockets between them.
+        gate = threading.BoundedSemaphore(max(1, JOSAA_MAX_CONNECTIONS))
+        machine = JosaaStateMachine(base_url, year, gate=gate)
         
         try:
             available_rounds = machine.discover_rounds()
@@ -27,23 +33,38 @@ class JosaaScanner(BaseScanner):
             logger.error(f"FATAL: Failed to bootstrap round discovery. Propagating exception: {e}")
             raise
 
+        url_hash = hashlib.sha256(base_url.encode()).hexdigest()[:8]
+        filepaths = {
+            r: os.path.join(self.temp_dir, f"josaa_r{r}_{url_hash}.html")
+            for r in available_rounds
+        }
+
+        harvested = set()
+        workers = max(1, min(JOSAA_PARALLEL_ROUNDS, len(available_rounds)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="josaa-round") as pool:
+            futures = {
+                pool.submit(machine.execute_round, r, filepaths[r], reuse_bootstrap=True): r
+                for r in available_rounds
+            }
+            for future in as_completed(futures):
+                r = futures[future]
+                try:
+                    if future.result():
+                        harvested.add(r)
+                except Exception as e:
+                    # We log and continue here to salvage other rounds if a single round's grid times out
+                    logger.error(f"Round {r} Extraction Failed completely after max retries: {e}")
+
         artifacts = []
         for r in available_rounds:
-            url_hash = hashlib.sha256(base_url.encode()).hexdigest()[:8]
-            filepath = os.path.join(self.temp_dir, f"josaa_r{r}_{url_hash}.html")
-            
-            try:
-                success = machine.execute_round(r, filepath)
-                if success:
-                    artifacts.append(ScannedArtifact(
-                        url=filepath, 
-                        link_text=f"Round {r} Cutoff (HTML)",
-                        context_header="JoSAA Final Ranks",
-                        detected_round=r,
-                        detection_method="Active_State_Emulation"
-                    ))
-            except Exception as e:
-                # We log and continue here to salvage other rounds if a single round's grid times out
-                logger.error(f"Round {r} Extraction Failed completely after max retries: {e}")
+            if r not in harvested:
+                continue
+            artifacts.append(ScannedArtifact(
+                url=filepaths[r],
+                link_text=f"Round {r} Cutoff (HTML)",
+                context_header="JoSAA Final Ranks",
+                detected_round=r,
+                detection_method="Active_State_Emulation"
+            ))
 
-        return artifacts
\ No newline at end of file
+        return artifacts
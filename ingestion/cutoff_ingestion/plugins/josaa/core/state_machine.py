@@ -1,22 +1,39 @@
+import os
 import time
 import random
 import logging
+import threading
 import httpx
-from typing import List
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from .constants import *
-from .state_extractor import StateExtractor, StateExtractionError
+from .state_extractor import StateExtractor, StateExtractionError, SelectNode
 from .network_client import JosaaNetworkClient
 
 logger = logging.getLogger(__name__)
 
 class StateIntegrityError(Exception): pass
 
+@dataclass(frozen=True)
+class BootstrapState:
+    """S0 form state of the landing page, shareable across round cascades."""
+    form_state: Dict[str, str]
+    select_queue: List[SelectNode]
+
 class JosaaStateMachine:
-    def __init__(self, target_url: str, target_year: int):
+    def __init__(self, target_url: str, target_year: int, gate: Optional[threading.Semaphore] = None):
         self.target_url = target_url
         self.target_year = target_year
+        self.gate = gate
+        self.bootstrap_state: Optional[BootstrapState] = None
+        # Flipped the first time the server refuses a shared bootstrap ViewState
+        # (e.g. ViewStateUserKey bound to the session); every round then bootstraps itself.
+        self.shared_bootstrap_rejected = False
+
+    def _client(self) -> JosaaNetworkClient:
+        return JosaaNetworkClient(gate=self.gate)
 
     def _verify_status(self, response: httpx.Response, state_id: str):
         if response.status_code != 200:
@@ -33,13 +50,17 @@ class JosaaStateMachine:
             if pattern.search(chunk):
                 raise StateIntegrityError(f"[{state_id}] Server Error Signature Detected: {pattern.pattern}")
 
+    def _bootstrap(self, client: JosaaNetworkClient, state_id: str = "S0_GET") -> Tuple[Dict[str, str], List[SelectNode]]:
+        resp = client.get(self.target_url)
+        self._verify_status(resp, state_id)
+        self._check_for_errors(resp.content, state_id)
+        return StateExtractor.extract_state(resp.content)
+
     def discover_rounds(self) -> List[int]:
-        with JosaaNetworkClient() as client:
-            resp = client.get(self.target_url)
-            self._verify_status(resp, "S0_DISCOVERY")
-            self._check_for_errors(resp.content, "S0_DISCOVERY")
-            
-            form_state, select_queue = StateExtractor.extract_state(resp.content)
+        with self._client() as client:
+            form_state, select_queue = self._bootstrap(client, "S0_DISCOVERY")
+            # Kept for round cascades that can start from it instead of their own GET.
+            self.bootstrap_state = BootstrapState(dict(form_state), list(select_queue))
 
             # --- [HARDENED FIX]: Archive Page Pre-Flight (Select Year First) ---
             for node in select_queue:
@@ -90,107 +111,135 @@ class JosaaStateMachine:
         retry=retry_if_exception_type((StateIntegrityError, StateExtractionError, httpx.RequestError)),
         reraise=True
     )
-    def execute_round(self, target_round: int, temp_filepath: str) -> bool:
+    def execute_round(self, target_round: int, temp_filepath: str, reuse_bootstrap: bool = False) -> bool:
         logger.info(f"Initiating Cascade for Round {target_round}...")
 
-        with JosaaNetworkClient() as client:
-            # === State S0: Bootstrap ===
-            resp = client.get(self.target_url)
-            self._verify_status(resp, "S0_GET")
-            self._check_for_errors(resp.content, "S0_GET")
-            form_state, select_queue = StateExtractor.extract_state(resp.content)
-
-            # === State S1..SN: Autonomous Dynamic Cascade ===
-            processed_controls = set()
+        with self._client() as client:
+            # === State S0: Bootstrap (shared when the server accepts it) ===
+            if reuse_bootstrap and self.bootstrap_state is not None and not self.shared_bootstrap_rejected:
+                try:
+                    return self._run_cascade(
+                        client, dict(self.bootstrap_state.form_state), list(self.bootstrap_state.select_queue),
+                        target_round, temp_filepath,
+                    )
+                except (StateIntegrityError, StateExtractionError) as e:
+                    self.shared_bootstrap_rejected = True
+                    logger.warning(
+                        f"Round {target_round}: shared bootstrap ViewState refused ({e}). "
+                        f"Falling back to per-round bootstrap."
+                    )
+                    client.reset_cookies()
+
+            form_state, select_queue = self._bootstrap(client)
+            return self._run_cascade(client, form_state, select_queue, target_round, temp_filepath)
+
+    def _run_cascade(
+        self,
+        client: JosaaNetworkClient,
+        form_state: Dict[str, str],
+        select_queue: List[SelectNode],
+        target_round: int,
+        temp_filepath: str,
+    ) -> bool:
+        # === State S1..SN: Autonomous Dynamic Cascade ===
+        processed_controls = set()
+        
+        while True:
+            target_node = None
+            for node in select_queue:
+                if node.requires_postback and node.control_id not in processed_controls:
+                    target_node = node
+                    break
             
-            while True:
-                target_node = None
-                for node in select_queue:
-                    if node.requires_postback and node.control_id not in processed_controls:
-                        target_node = node
-                        break
-                
-                if not target_node:
-                    break 
-                
-                payload = form_state.copy()
-                payload[TOKEN_EVENTTARGET] = target_node.control_id
-                payload[TOKEN_EVENTARGUMENT] = ""
-
-                target_round_str = str(target_round)
-                target_year_str = str(self.target_year)
+            if not target_node:
+                break 
+            
+            payload = form_state.copy()
+            payload[TOKEN_EVENTTARGET] = target_node.control_id
+            payload[TOKEN_EVENTARGUMENT] = ""
 
-                if target_year_str in target_node.available_options:
-                    payload[target_node.control_id] = target_year_str
-                elif target_round_str in target_node.available_options:
-                    payload[target_node.control_id] = target_round_str
-                elif TARGET_VALUE_ALL in target_node.available_options:
-                    payload[target_node.control_id] = TARGET_VALUE_ALL
-                else:
-                    payload[target_node.control_id] = target_node.available_options[-1]
-
-                time.sleep(random.uniform(JITTER_MIN_SEC, JITTER_MAX_SEC))
-                logger.info(f"Triggering AutoPostBack for: {target_node.control_id}")
-                
-                post_resp = client.post(self.target_url, data=payload)
-                self._verify_status(post_resp, f"SN_{target_node.control_id}")
-                self._check_for_errors(post_resp.content, f"SN_{target_node.control_id}")
+            target_round_str = str(target_round)
+            target_year_str = str(self.target_year)
 
-                new_state, new_queue = StateExtractor.extract_state(post_resp.content)
-                
-                if new_state[TOKEN_VIEWSTATE] == form_state[TOKEN_VIEWSTATE]:
-                    raise StateIntegrityError(f"[{target_node.control_id}] ViewState failed to mutate. Cascade corrupted.")
+            if target_year_str in target_node.available_options:
+                payload[target_node.control_id] = target_year_str
+            elif target_round_str in target_node.available_options:
+                payload[target_node.control_id] = target_round_str
+            elif TARGET_VALUE_ALL in target_node.available_options:
+                payload[target_node.control_id] = TARGET_VALUE_ALL
+            else:
+                payload[target_node.control_id] = target_node.available_options[-1]
 
-                form_state = new_state
-                select_queue = new_queue
-                processed_controls.add(target_node.control_id)
+            time.sleep(random.uniform(JITTER_MIN_SEC, JITTER_MAX_SEC))
+            logger.info(f"Triggering AutoPostBack for: {target_node.control_id}")
+            
+            post_resp = client.post(self.target_url, data=payload)
+            self._verify_status(post_resp, f"SN_{target_node.control_id}")
+            self._check_for_errors(post_resp.content, f"SN_{target_node.control_id}")
 
-            # === State SF: Final Submit ===
-            payload = form_state.copy()
-            payload[TOKEN_EVENTTARGET] = ""
-            payload[TOKEN_EVENTARGUMENT] = ""
+            new_state, new_queue = StateExtractor.extract_state(post_resp.content)
+            
+            if new_state[TOKEN_VIEWSTATE] == form_state[TOKEN_VIEWSTATE]:
+                raise StateIntegrityError(f"[{target_node.control_id}] ViewState failed to mutate. Cascade corrupted.")
 
-            # [CRITICAL FIX]: Inject values for non-postback dropdowns
-            for node in select_queue:
-                if node.control_id not in processed_controls:
-                    target_round_str = str(target_round)
-                    target_year_str = str(self.target_year)
+            form_state = new_state
+            select_queue = new_queue
+            processed_controls.add(target_node.control_id)
 
-                    if target_year_str in node.available_options:
-                        payload[node.control_id] = target_year_str
-                    elif target_round_str in node.available_options:
-                        payload[node.control_id] = target_round_str
-                    elif TARGET_VALUE_ALL in node.available_options:
-                        payload[node.control_id] = TARGET_VALUE_ALL
-                    elif node.available_options:
-                        payload[node.control_id] = node.available_options[-1]
-
-            payload[BTN_SUBMIT_NAME] = BTN_SUBMIT_VALUE
-
-            with client.stream_post(self.target_url, data=payload) as stream_resp:
-                self._verify_status(stream_resp, "SF_SUBMIT")
-                iterator = stream_resp.iter_bytes(chunk_size=STREAM_CHUNK_SIZE)
-                
-                buffer = b""
-                buffer_lower = b""
-                grid_found = False
-                
-                for chunk in iterator:
-                    buffer += chunk
-                    buffer_lower += chunk.lower()
-                    
-                    if b"<table" in buffer_lower and b"<th" in buffer_lower:
-                        grid_found = True
-                        break
-                    if len(buffer) > MAX_GRID_PROBE_BYTES:
-                        break
+        # === State SF: Final Submit ===
+        payload = form_state.copy()
+        payload[TOKEN_EVENTTARGET] = ""
+        payload[TOKEN_EVENTARGUMENT] = ""
 
-                if not grid_found:
-                    raise StateIntegrityError("[VF] Structural Table/Grid Data not found in response stream.")
+        # [CRITICAL FIX]: Inject values for non-postback dropdowns
+        for node in select_queue:
+            if node.control_id not in processed_controls:
+                target_round_str = str(target_round)
+                target_year_str = str(self.target_year)
 
-                with open(temp_filepath, 'wb') as f:
+                if target_year_str in node.available_options:
+                    payload[node.control_id] = target_year_str
+                elif target_round_str in node.available_options:
+                    payload[node.control_id] = target_round_str
+                elif TARGET_VALUE_ALL in node.available_options:
+                    payload[node.control_id] = TARGET_VALUE_ALL
+                elif node.available_options:
+                    payload[node.control_id] = node.available_options[-1]
+
+        payload[BTN_SUBMIT_NAME] = BTN_SUBMIT_VALUE
+
+        with client.stream_post(self.target_url, data=payload) as stream_resp:
+            self._verify_status(stream_resp, "SF_SUBMIT")
+            iterator = stream_resp.iter_bytes(chunk_size=STREAM_CHUNK_SIZE)
+            
+            buffer = b""
+            buffer_lower = b""
+            grid_found = False
+            
+            for chunk in iterator:
+                buffer += chunk
+                buffer_lower += chunk.lower()
+                
+                if b"<table" in buffer_lower and b"<th" in buffer_lower:
+                    grid_found = True
+                    break
+                if len(buffer) > MAX_GRID_PROBE_BYTES:
+                    break
+
+            if not grid_found:
+                raise StateIntegrityError("[VF] Structural Table/Grid Data not found in response stream.")
+
+            # Stream to a sibling .part file; concurrent rounds never expose half-written grids.
+            partial_path = f"{temp_filepath}.part"
+            try:
+                with open(partial_path, 'wb') as f:
                     f.write(buffer)
                     for chunk in iterator:
                         f.write(chunk)
+                os.replace(partial_path, temp_filepath)
+            except BaseException:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                raise
 
-        return True
\ No newline at end of file
+        return True
@@ -2,7 +2,6 @@ import re
 from typing import Dict, List, Any
 from ingestion.cutoff_ingestion.core.base_plugin import BaseCutoffPlugin
 from ingestion.cutoff_ingestion.plugins.josaa.core.scanner import JosaaScanner
-from ingestion.cutoff_ingestion.plugins.josaa.core.html_parser import JosaaGridParser
 
 class JosaaPlugin(BaseCutoffPlugin):
     def get_slug(self) -> str:
@@ -19,6 +18,7 @@ class JosaaPlugin(BaseCutoffPlugin):
         return JosaaScanner()
 
     def get_parser(self, pdf_path: str) -> Any:
+        from .core.html_parser import JosaaGridParser
         return JosaaGridParser(pdf_path)
 
     def get_adapter(self) -> Any:
@@ -1,10 +1,8 @@
 from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
 import re  # <--- Essential Import
 
 from app.models import KCETCollegeMetadata 
-from ingestion.common.interface.context_interface import ContextAdapter
+from ingestion.common.interface.context_interface import ContextAdapter, ExamMetadataRecord
 
 class KCETContextAdapter(ContextAdapter):
     def get_exam_code(self, row: Dict[str, Any] = None) -> str:
@@ -73,19 +71,21 @@ class KCETContextAdapter(ContextAdapter):
             "program_name": p_name
         }
 
-    def upsert_exam_metadata(self, db: Session, college_id: Any, row: Dict[str, Any]):
-        stmt = insert(KCETCollegeMetadata).values(
-            college_id=college_id,
-            kea_college_code=row['kea_code'],
-            kea_college_name_raw=row['college_name_raw'],
-            course_type=row['course_type_normalized'], 
-            year=row['year'],
-            source_artifact_id=row['source_artifact_id']
-        ).on_conflict_do_update(
+    def build_exam_metadata(self, college_id: Any, row: Dict[str, Any]) -> Optional[ExamMetadataRecord]:
+        return ExamMetadataRecord(
+            model=KCETCollegeMetadata,
+            values={
+                "college_id": college_id,
+                "kea_college_code": row['kea_code'],
+                "kea_college_name_raw": row['college_name_raw'],
+                "course_type": row['course_type_normalized'],
+                "year": row['year'],
+                "source_artifact_id": row['source_artifact_id'],
+            },
+            identity_columns=("college_id", "course_type", "year"),
             constraint='uq_kcet_metadata_identity',
-            set_={"kea_college_name_raw": row['college_name_raw']}
+            update_columns=("kea_college_name_raw",),
         )
-        db.execute(stmt)
 
     def _normalize_category_group(self, raw: str) -> str:
         if raw.startswith("GM"): return "GM"
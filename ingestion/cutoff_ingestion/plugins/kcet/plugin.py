@@ -4,7 +4,6 @@ import re
 from ingestion.cutoff_ingestion.core.base_plugin import BaseCutoffPlugin
 from ingestion.cutoff_ingestion.plugins.kcet.round_normalizer import RoundNormalizer
 from ingestion.cutoff_ingestion.plugins.kcet.adapter import KCETContextAdapter
-from ingestion.cutoff_ingestion.plugins.kcet.table_parser import KCETTableParser
 from ingestion.cutoff_ingestion.plugins.kcet.scanner import KCETScanner 
 from ingestion.cutoff_ingestion.plugins.kcet.row_standardizer import KCETRowStandardizer
 
@@ -188,6 +187,7 @@ class KCETPlugin(BaseCutoffPlugin):
         return KCETContextAdapter()
 
     def get_parser(self, pdf_path: str) -> Any:
+        from ingestion.cutoff_ingestion.plugins.kcet.table_parser import KCETTableParser
         return KCETTableParser(pdf_path)
 
     def sanitize_round_name(self, raw_name: str) -> str:
@@ -1,11 +1,24 @@
 import re
-import pdfplumber
 import logging
 from typing import Iterator, Dict, Any, List, Optional
+from ingestion.cutoff_ingestion.core.page_extractor import PageShardedExtractor, extract_spatial_tables
 from ingestion.cutoff_ingestion.plugins.kcet.row_standardizer import KCETRowStandardizer
 
 logger = logging.getLogger(__name__)
 
+KCET_TABLE_SETTINGS = {
+    "vertical_strategy": "lines", 
+    "horizontal_strategy": "lines", 
+    "snap_tolerance": 3
+}
+
+# Bump whenever KCET_TABLE_SETTINGS or extract_kcet_page changes (invalidates the page cache).
+KCET_EXTRACTION_VERSION = "v1"
+
+def extract_kcet_page(page) -> Dict[str, Any]:
+    """Worker-side page function: tables (find_tables for bbox) + floating gap text."""
+    return extract_spatial_tables(page, KCET_TABLE_SETTINGS)
+
 class KCETTableParser:
     """
     State Machine Parser for KCET Cutoff PDFs.
@@ -34,47 +47,23 @@ class KCETTableParser:
 
     def parse(self) -> Iterator[Dict[str, Any]]:
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    # Use find_tables to get coordinates (bbox)
-                    tables = page.find_tables(table_settings={
-                        "vertical_strategy": "lines", 
-                        "horizontal_strategy": "lines", 
-                        "snap_tolerance": 3
-                    })
-                    
-                    if not tables: continue
-
-                    prev_table_bottom = 0
-                    
-                    for table in tables:
-                        # --- PHASE 1: SPATIAL SCAN (The "Gap" Fix) ---
-                        # Scan the text physically located ABOVE this table but BELOW the previous one.
-                        # This catches "College: E002" headers that float between tables.
-                        
-                        top_bound = prev_table_bottom
-                        bottom_bound = table.bbox[1] # Top of current table
-                        
-                        # Only scan if there is a gap (e.g. > 10 units) to avoid overlapping weirdness
-                        if bottom_bound - top_bound > 5:
-                            try:
-                                # Define area: (left, top, right, bottom)
-                                crop_area = (0, top_bound, page.width, bottom_bound)
-                                crop = page.crop(crop_area)
-                                text_in_gap = crop.extract_text() or ""
-                                self._scan_text_for_context(text_in_gap, page_num, source="SPATIAL_GAP")
-                            except Exception:
-                                # Cropping can fail on edge cases; ignore safely
-                                pass
-                        
-                        # --- PHASE 2: PROCESS TABLE ---
-                        # Extract data and process rows (includes the "Embedded Header" check)
-                        table_data = table.extract()
-                        if table_data:
-                            yield from self._process_table_grid(table_data, page_num)
-                        
-                        # Update tracker
-                        prev_table_bottom = table.bbox[3] # Bottom of current table
+            # Table detection runs page-sharded; context is replayed here in page order.
+            extractor = PageShardedExtractor(
+                self.pdf_path, extract_kcet_page, extraction_version=KCET_EXTRACTION_VERSION
+            )
+            for page_num, page_data in extractor.iter_pages():
+                for table in page_data["tables"]:
+                    # --- PHASE 1: SPATIAL SCAN (The "Gap" Fix) ---
+                    # Text physically located ABOVE this table but BELOW the previous one.
+                    # This catches "College: E002" headers that float between tables.
+                    if table["gap_text"] is not None:
+                        self._scan_text_for_context(table["gap_text"], page_num, source="SPATIAL_GAP")
+
+                    # --- PHASE 2: PROCESS TABLE ---
+                    # Extract data and process rows (includes the "Embedded Header" check)
+                    table_data = table["grid"]
+                    if table_data:
+                        yield from self._process_table_grid(table_data, page_num)
 
         except Exception as e:
             logger.error(f"Parser Crash on {self.pdf_path}: {e}")
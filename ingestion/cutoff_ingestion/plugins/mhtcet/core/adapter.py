@@ -1,10 +1,8 @@
 import re
 import logging
 from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
 
-from ingestion.common.interface.context_interface import ContextAdapter
+from ingestion.common.interface.context_interface import ContextAdapter, ExamMetadataRecord
 from app.models import MhtcetCollegeMetadata
 from .row_standardizer import MHTCETRowStandardizer
 
@@ -160,21 +158,23 @@ class MHTCETContextAdapter(ContextAdapter):
             "program_name": row.get("course_name", "Unknown Program")
         }
 
-    def upsert_exam_metadata(self, db: Session, college_id: Any, row: Dict[str, Any]):
+    def build_exam_metadata(self, college_id: Any, row: Dict[str, Any]) -> Optional[ExamMetadataRecord]:
         raw_dte = row.get("college_dte_code") or row.get("choice_code", "")
         dte_code = self._extract_dte_code(raw_dte)
         
-        if not dte_code: return
+        if not dte_code: return None
         
         course_val = "BE" if "BE" in self.exam_slug else "PHARMA"
         
-        stmt = insert(MhtcetCollegeMetadata).values(
-            college_id=college_id,
-            dte_code=dte_code,
-            dte_name_raw=row.get("college_name_raw", "Unknown"),
-            course_type=course_val,
-            year=row['year'],
-            source_artifact_id=row.get("source_document")
-        ).on_conflict_do_nothing()
-        db.execute(stmt)
-        db.flush()
\ No newline at end of file
+        return ExamMetadataRecord(
+            model=MhtcetCollegeMetadata,
+            values={
+                "college_id": college_id,
+                "dte_code": dte_code,
+                "dte_name_raw": row.get("college_name_raw", "Unknown"),
+                "course_type": course_val,
+                "year": row['year'],
+                "source_artifact_id": row.get("source_document"),
+            },
+            identity_columns=("dte_code", "course_type", "year"),
+        )
\ No newline at end of file
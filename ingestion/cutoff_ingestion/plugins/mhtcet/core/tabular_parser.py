@@ -1,10 +1,29 @@
 import re
-import pdfplumber
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import Iterator, List, Dict, Any, Tuple
+
+from ingestion.cutoff_ingestion.core.page_extractor import PageShardedExtractor, extract_table_grids
 
 logger = logging.getLogger(__name__)
 
+# [THE ENTERPRISE FIX] Strict Column Enforcement
+# We NEVER use 'text' for vertical_strategy because it causes column bleeding.
+# By forcing 'lines', we mathematically bind the extraction to the PDF's drawn grid.
+# High tolerance ensures it survives broken borders on page breaks.
+MHTCET_TABULAR_TABLE_SETTINGS = {
+    "vertical_strategy": "lines", 
+    "horizontal_strategy": "lines",
+    "intersection_y_tolerance": 25, 
+    "intersection_x_tolerance": 25
+}
+
+# Bump whenever the settings or page function change (invalidates the page cache).
+MHTCET_TABULAR_EXTRACTION_VERSION = "v1"
+
+def extract_mhtcet_tabular_page(page) -> Dict[str, Any]:
+    """Worker-side page function: raw table grids only."""
+    return extract_table_grids(page, MHTCET_TABULAR_TABLE_SETTINGS)
+
 class MHTCETTabularParser:
     
     HEADER_ALIASES = {
@@ -20,74 +39,68 @@ class MHTCETTabularParser:
         self.metadata = artifact_metadata
         self.pdf_path = pdf_path
 
-    def parse(self) -> List[Dict[str, Any]]:
-        extracted_rows = []
+    def parse(self) -> Iterator[Dict[str, Any]]:
+        # Streaming: rows are yielded as soon as a table is decoded so the
+        # ingestion loop can flush batches while later pages are still parsing.
+        rows_yielded = 0
         logger.info(f"📄 Starting Tabular Extraction for {self.pdf_path}")
         
-        # [THE ENTERPRISE FIX] Strict Column Enforcement
-        # We NEVER use 'text' for vertical_strategy because it causes column bleeding.
-        # By forcing 'lines', we mathematically bind the extraction to the PDF's drawn grid.
-        # High tolerance ensures it survives broken borders on page breaks.
-        enterprise_table_settings = {
-            "vertical_strategy": "lines", 
-            "horizontal_strategy": "lines",
-            "intersection_y_tolerance": 25, 
-            "intersection_x_tolerance": 25
-        }
-        
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
+        # pdfplumber work runs page-sharded; grids are replayed here in page order.
+        extractor = PageShardedExtractor(
+            self.pdf_path, extract_mhtcet_tabular_page, extraction_version=MHTCET_TABULAR_EXTRACTION_VERSION
+        )
+        for page_index, page_data in extractor.iter_pages():
+            
+            tables = page_data["tables"]
+            if not tables: continue
                 
-                tables = page.extract_tables(table_settings=enterprise_table_settings)
-                if not tables: continue
-                    
-                for table_idx, table in enumerate(tables):
-                    if not table or len(table) < 2: continue
-                    
-                    header_idx = -1
-                    for i, row in enumerate(table[:10]): 
-                        row_text = " ".join([str(c).lower() for c in row if c])
-                        if "choice code" in row_text or "institute" in row_text:
-                            header_idx = i
-                            break
-                            
-                    if header_idx == -1: continue
+            for table_idx, table in enumerate(tables):
+                if not table or len(table) < 2: continue
+                
+                header_idx = -1
+                for i, row in enumerate(table[:10]): 
+                    row_text = " ".join([str(c).lower() for c in row if c])
+                    if "choice code" in row_text or "institute" in row_text:
+                        header_idx = i
+                        break
                         
-                    headers = self._normalize_headers(table[header_idx])
+                if header_idx == -1: continue
+                    
+                headers = self._normalize_headers(table[header_idx])
 
-                    for row in table[header_idx + 1:]:
-                        row_dict = {}
-                        for h, v in zip(headers, row):
-                            if h == "unknown": continue
-                            if h not in row_dict: 
-                                row_dict[h] = v
+                for row in table[header_idx + 1:]:
+                    row_dict = {}
+                    for h, v in zip(headers, row):
+                        if h == "unknown": continue
+                        if h not in row_dict: 
+                            row_dict[h] = v
+                    
+                    choice_code = str(row_dict.get("choice_code", "")).strip()
+                    if not choice_code or choice_code == "None": continue 
                         
-                        choice_code = str(row_dict.get("choice_code", "")).strip()
-                        if not choice_code or choice_code == "None": continue 
-                            
-                        if "closing_rank" not in row_dict: continue
+                    if "closing_rank" not in row_dict: continue
 
-                        if "seat_type" not in row_dict:
-                            if self.metadata.get("seat_type") == "DIPLOMA":
-                                row_dict["seat_type"] = "DIPLOMA"
-                            else:
-                                row_dict["seat_type"] = self.metadata.get("quota") or "AI"
-                            
-                        rank, percentile = self._split_rank_percentile(row_dict.get("closing_rank", ""))
-                        if rank is None: continue 
-                        
-                        # Data loss prevention check
-                        if not row_dict.get("course_name") or not str(row_dict.get("course_name")).strip():
-                            logger.warning(f"Data Loss Warning: Empty course name for {choice_code}. Dropping row.")
-                            continue
-                        
-                        row_dict["cutoff_rank"] = rank
-                        row_dict["cutoff_percentile"] = percentile
-                        row_dict["round"] = self.metadata.get("round", 1)
-                        extracted_rows.append(row_dict)
+                    if "seat_type" not in row_dict:
+                        if self.metadata.get("seat_type") == "DIPLOMA":
+                            row_dict["seat_type"] = "DIPLOMA"
+                        else:
+                            row_dict["seat_type"] = self.metadata.get("quota") or "AI"
                         
-        logger.info(f"✅ Tabular Extraction Complete. Total rows found: {len(extracted_rows)}")
-        return extracted_rows
+                    rank, percentile = self._split_rank_percentile(row_dict.get("closing_rank", ""))
+                    if rank is None: continue 
+                    
+                    # Data loss prevention check
+                    if not row_dict.get("course_name") or not str(row_dict.get("course_name")).strip():
+                        logger.warning(f"Data Loss Warning: Empty course name for {choice_code}. Dropping row.")
+                        continue
+                    
+                    row_dict["cutoff_rank"] = rank
+                    row_dict["cutoff_percentile"] = percentile
+                    row_dict["round"] = self.metadata.get("round", 1)
+                    rows_yielded += 1
+                    yield row_dict
+                    
+        logger.info(f"✅ Tabular Extraction Complete. Total rows found: {rows_yielded}")
 
     def _normalize_headers(self, raw_headers: List[str]) -> List[str]:
         norm_headers = []
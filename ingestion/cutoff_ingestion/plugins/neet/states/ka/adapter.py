@@ -1,8 +1,6 @@
 from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
 from app.models import NeetCollegeMetadata 
-from ingestion.common.interface.context_interface import ContextAdapter
+from ingestion.common.interface.context_interface import ContextAdapter, ExamMetadataRecord
 from ingestion.cutoff_ingestion.plugins.neet.states.ka.row_standardizer import KarnatakaNEETRowStandardizer
 
 class KarnatakaNEETContextAdapter(ContextAdapter):
@@ -53,16 +51,18 @@ class KarnatakaNEETContextAdapter(ContextAdapter):
             "program_name": row.get('course_name_raw', 'UNKNOWN')
         }
 
-    def upsert_exam_metadata(self, db: Session, college_id: Any, row: Dict[str, Any]):
-        stmt = insert(NeetCollegeMetadata).values(
-            college_id=college_id,
-            kea_college_code=row['kea_code'],
-            kea_college_name_raw=row['college_name_raw'],
-            course_type=row['course_normalized'], 
-            year=row['year'],
-            source_artifact_id=row['source_artifact_id']
-        ).on_conflict_do_update(
+    def build_exam_metadata(self, college_id: Any, row: Dict[str, Any]) -> Optional[ExamMetadataRecord]:
+        return ExamMetadataRecord(
+            model=NeetCollegeMetadata,
+            values={
+                "college_id": college_id,
+                "kea_college_code": row['kea_code'],
+                "kea_college_name_raw": row['college_name_raw'],
+                "course_type": row['course_normalized'],
+                "year": row['year'],
+                "source_artifact_id": row['source_artifact_id'],
+            },
+            identity_columns=("college_id", "course_type", "year"),
             constraint='uq_neet_metadata_identity',
-            set_={"kea_college_name_raw": row['college_name_raw']}
-        )
-        db.execute(stmt)
\ No newline at end of file
+            update_columns=("kea_college_name_raw",),
+        )
\ No newline at end of file
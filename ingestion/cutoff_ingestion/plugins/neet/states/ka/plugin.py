@@ -2,7 +2,6 @@ from typing import Dict, List, Optional, Any
 from ingestion.cutoff_ingestion.plugins.neet.core.base_state_plugin import BaseNEETStatePlugin
 from ingestion.cutoff_ingestion.plugins.neet.states.ka.scanner import KarnatakaNEETScanner
 from ingestion.cutoff_ingestion.plugins.neet.states.ka.adapter import KarnatakaNEETContextAdapter
-from ingestion.cutoff_ingestion.plugins.neet.states.ka.table_parser import KarnatakaNEETTableParser
 from ingestion.cutoff_ingestion.plugins.neet.states.ka.row_standardizer import KarnatakaNEETRowStandardizer
 
 class KarnatakaNEETPlugin(BaseNEETStatePlugin):
@@ -32,6 +31,7 @@ class KarnatakaNEETPlugin(BaseNEETStatePlugin):
 
     def get_parser_with_context(self, pdf_path: str, artifact: Any) -> Any:
         # Passes the dynamic Round Number and UUID into the parser for validation
+        from .table_parser import KarnatakaNEETTableParser
         return KarnatakaNEETTableParser(pdf_path, artifact.id, artifact.round_number)
 
     def sanitize_round_name(self, raw_name: str) -> str:
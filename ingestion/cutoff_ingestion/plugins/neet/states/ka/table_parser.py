@@ -1,12 +1,23 @@
 import re
-import pdfplumber
 import logging
-from typing import Iterator, Dict, Any, Optional
+import itertools
+from typing import Iterator, Dict, Any, Optional, Iterable, Tuple, List
 import uuid
+from ingestion.cutoff_ingestion.core.page_extractor import PageShardedExtractor, extract_spatial_tables
 from ingestion.cutoff_ingestion.plugins.neet.states.ka.row_standardizer import KarnatakaNEETRowStandardizer
 
 logger = logging.getLogger(__name__)
 
+NEET_KA_TABLE_SETTINGS = {"vertical_strategy": "lines"}
+NEET_KA_FALLBACK_TABLE_SETTINGS = {"vertical_strategy": "text"}
+
+# Bump whenever the settings or page function change (invalidates the page cache).
+NEET_KA_EXTRACTION_VERSION = "v1"
+
+def extract_neet_ka_page(page) -> Dict[str, Any]:
+    """Worker-side page function: ruled tables (text-strategy fallback) + gap text."""
+    return extract_spatial_tables(page, NEET_KA_TABLE_SETTINGS, NEET_KA_FALLBACK_TABLE_SETTINGS)
+
 class KarnatakaNEETTableParser:
     PARSER_VERSION = "neet_dual_v3.2" # Bumped version
     
@@ -23,31 +34,32 @@ class KarnatakaNEETTableParser:
 
     def parse(self) -> Iterator[Dict[str, Any]]:
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                engine_choice = self._route_engine(pdf)
-                logger.info(f"[{self.artifact_id}] Structural Routing: Selected {engine_choice}")
+            # Table detection runs page-sharded; both engines replay pages in order.
+            pages = PageShardedExtractor(
+                self.pdf_path, extract_neet_ka_page, extraction_version=NEET_KA_EXTRACTION_VERSION
+            ).iter_pages()
+            head_pages = list(itertools.islice(pages, 2))
 
-                if engine_choice == "TRANSACTIONAL":
-                    yield from self._run_transactional_engine(pdf)
-                else:
-                    yield from self._run_matrix_engine(pdf)
+            engine_choice = self._route_engine(head_pages)
+            logger.info(f"[{self.artifact_id}] Structural Routing: Selected {engine_choice}")
+
+            page_stream = itertools.chain(head_pages, pages)
+            if engine_choice == "TRANSACTIONAL":
+                yield from self._run_transactional_engine(page_stream)
+            else:
+                yield from self._run_matrix_engine(page_stream)
 
         except Exception as e:
             logger.error(f"Parser Crash on {self.pdf_path}: {e}")
             raise
 
-    def _route_engine(self, pdf) -> str:
+    def _route_engine(self, head_pages: List[Tuple[int, Dict[str, Any]]]) -> str:
         best_score = -1
         best_engine = "MATRIX" 
         
-        pages_to_scan = min(2, len(pdf.pages))
-        for i in range(pages_to_scan):
-            tables = pdf.pages[i].find_tables(table_settings={"vertical_strategy": "lines"})
-            if not tables:
-                tables = pdf.pages[i].find_tables(table_settings={"vertical_strategy": "text"})
-            
-            for table in tables:
-                data = table.extract()
+        for _, page_data in head_pages:
+            for table in page_data["tables"]:
+                data = table["grid"]
                 if not data or len(data) < 2: continue
                 
                 header_row = [str(c).upper().strip() for c in data[0] if c]
@@ -73,18 +85,14 @@ class KarnatakaNEETTableParser:
                     
         return best_engine
 
-    def _run_transactional_engine(self, pdf) -> Iterator[Dict[str, Any]]:
+    def _run_transactional_engine(self, pages: Iterable[Tuple[int, Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
         agg_map = {}
         course_tracker = {}
         code_to_name_map = {} # <--- [FIX] Maps KEA Code back to real College Name
         
-        for page_num, page in enumerate(pdf.pages):
-            tables = pdf.pages[page_num].find_tables(table_settings={"vertical_strategy": "lines"})
-            if not tables:
-                tables = pdf.pages[page_num].find_tables(table_settings={"vertical_strategy": "text"})
-                
-            for table in tables:
-                data = table.extract()
+        for _, page_data in pages:
+            for table in page_data["tables"]:
+                data = table["grid"]
                 if not data: continue
                 
                 header = [str(c).upper().strip() for c in data[0] if c]
@@ -152,36 +160,23 @@ class KarnatakaNEETTableParser:
                 "parser_version": self.PARSER_VERSION
             }
 
-    def _run_matrix_engine(self, pdf) -> Iterator[Dict[str, Any]]:
+    def _run_matrix_engine(self, pages: Iterable[Tuple[int, Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
         current_college_code = None
         current_college_name = None
         last_column_count = -1
         category_map = {}
 
-        for page_num, page in enumerate(pdf.pages):
-            tables = pdf.pages[page_num].find_tables(table_settings={"vertical_strategy": "lines"})
-            if not tables:
-                tables = pdf.pages[page_num].find_tables(table_settings={"vertical_strategy": "text"})
-                
-            prev_table_bottom = 0
-            
-            for table in tables:
-                top_bound = prev_table_bottom
-                bottom_bound = table.bbox[1]
-                
-                if bottom_bound - top_bound > 5:
-                    try:
-                        crop = page.crop((0, top_bound, page.width, bottom_bound))
-                        text = crop.extract_text() or ""
-                        for line in text.split('\n'):
-                            match = self.COLLEGE_HEADER_REGEX.search(line.strip())
-                            if match:
-                                current_college_code = match.group(1).upper()
-                                current_college_name = match.group(2).strip()
-                    except Exception: pass
+        for _, page_data in pages:
+            for table in page_data["tables"]:
+                # Floating college headers between tables (gap text is pre-cropped by the extractor)
+                if table["gap_text"] is not None:
+                    for line in table["gap_text"].split('\n'):
+                        match = self.COLLEGE_HEADER_REGEX.search(line.strip())
+                        if match:
+                            current_college_code = match.group(1).upper()
+                            current_college_name = match.group(2).strip()
                 
-                data = table.extract()
-                prev_table_bottom = table.bbox[3]
+                data = table["grid"]
                 if not data: continue
                 
                 header_row = [str(c).upper().strip() if c else "" for c in data[0]]
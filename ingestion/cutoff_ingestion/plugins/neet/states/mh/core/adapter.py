@@ -1,11 +1,9 @@
 from typing import Dict, Any, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
 import logging
 
 from app.models import MhtcetCollegeMetadata 
-from ingestion.common.interface.context_interface import ContextAdapter
+from ingestion.common.interface.context_interface import ContextAdapter, ExamMetadataRecord
 from ingestion.cutoff_ingestion.plugins.neet.states.mh.core.row_standardizer import MHNeetRowStandardizer
 
 logger = logging.getLogger(__name__)
@@ -73,20 +71,22 @@ class MHNeetContextAdapter(ContextAdapter):
             "program_name": prog_code.replace('_', ' ') # E.g., "MBBS_BDS" -> "MBBS BDS"
         }
 
-    def upsert_exam_metadata(self, db: Session, college_id: UUID, row: Dict[str, Any]):
+    def build_exam_metadata(self, college_id: UUID, row: Dict[str, Any]) -> Optional[ExamMetadataRecord]:
         # [ENTERPRISE FIX]: Defensively clean empty strings to None for strict PostgreSQL UUID columns
         raw_source_id = row.get('source_artifact_id')
         clean_source_id = str(raw_source_id) if raw_source_id and str(raw_source_id).strip() else None
 
-        stmt = insert(MhtcetCollegeMetadata).values(
-            college_id=college_id,
-            dte_code=str(row['institute_code']),
-            dte_name_raw=str(row['institute_name']),
-            course_type=str(row["specific_course_type"]),
-            year=int(row['year']),
-            source_artifact_id=clean_source_id
-        ).on_conflict_do_update(
+        return ExamMetadataRecord(
+            model=MhtcetCollegeMetadata,
+            values={
+                "college_id": college_id,
+                "dte_code": str(row['institute_code']),
+                "dte_name_raw": str(row['institute_name']),
+                "course_type": str(row["specific_course_type"]),
+                "year": int(row['year']),
+                "source_artifact_id": clean_source_id,
+            },
+            identity_columns=("dte_code", "course_type", "year"),
             constraint='uq_mhtcet_metadata_identity',
-            set_={"dte_name_raw": str(row['institute_name'])}
-        )
-        db.execute(stmt)
\ No newline at end of file
+            update_columns=("dte_name_raw",),
+        )
\ No newline at end of file
@@ -1,13 +1,32 @@
 import re
 import logging
-import pdfplumber
-import gc
 from typing import Iterator, Dict, Any, List
+from ingestion.cutoff_ingestion.core.page_extractor import PageShardedExtractor
 from ingestion.cutoff_ingestion.plugins.neet.states.mh.core.row_standardizer import MHNeetRowStandardizer
 from ingestion.cutoff_ingestion.plugins.neet.states.mh.core import constants as M  
 
 logger = logging.getLogger(__name__)
 
+MH_NEET_TABLE_SETTINGS = {
+    "vertical_strategy": "text", 
+    "horizontal_strategy": "text"
+}
+MH_NEET_REQUIRED_COLUMNS = {'sr_no', 'rank', 'gender', 'category', 'quota', 'college'}
+
+# Bump whenever the settings or page function change (invalidates the page cache).
+MH_NEET_EXTRACTION_VERSION = "v1"
+
+def extract_mh_neet_page(page) -> Dict[str, Any]:
+    """
+    Worker-side page function. Text-strategy table, plus the raw page text
+    only when the table is unusable and the regex fallback will be needed.
+    """
+    table = page.extract_table(MH_NEET_TABLE_SETTINGS)
+    text = None
+    if not MHNeetTabularParser._is_table_usable(table):
+        text = page.extract_text()
+    return {"table": table, "text": text}
+
 class MHNeetTabularParser:
     PARSER_VERSION = "mh_medical_v4.0" # Promoted to v4.0 for structural perfection
     
@@ -35,48 +54,28 @@ class MHNeetTabularParser:
     def parse(self) -> Iterator[Dict[str, Any]]:
         logger.info(f"📄 Starting MH Medical Parsing for {self.pdf_path}")
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            
-        logger.info(f"📊 Detected {total_pages} pages. Engaging Chunked Memory Streaming...")
+        PROGRESS_EVERY = 50
+        processed_pages = 0
 
-        CHUNK_SIZE = 50
-        for chunk_start in range(0, total_pages, CHUNK_SIZE):
-            chunk_end = min(chunk_start + CHUNK_SIZE, total_pages)
-            
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num in range(chunk_start + 1, chunk_end + 1):
-                    page_index = page_num - 1
-                    page = pdf.pages[page_index]
-                    
-                    self.last_c_code = None
-                    
-                    try:
-                        table = page.extract_table({
-                            "vertical_strategy": "text", 
-                            "horizontal_strategy": "text"
-                        })
-                        
-                        use_fallback = False
-                        col_map = {}
-                        if not table or len(table) < 3:
-                            use_fallback = True
-                        else:
-                            col_map = self._map_headers(table[:5])
-                            required = {'sr_no', 'rank', 'gender', 'category', 'quota', 'college'}
-                            if not required.issubset(set(col_map.keys())):
-                                use_fallback = True
-                            
-                        if use_fallback:
-                            self._parse_page_with_regex(page)
-                        else:
-                            self._parse_page_with_table(table, col_map)
-                            
-                    finally:
-                        page.flush_cache()
-            
-            gc.collect()
-            logger.info(f"♻️ Memory flushed. Processed {chunk_end}/{total_pages} pages.")
+        # Table detection runs page-sharded (each shard re-opens the PDF, bounding memory);
+        # the floating-name state machine replays pages here in order.
+        extractor = PageShardedExtractor(
+            self.pdf_path, extract_mh_neet_page, extraction_version=MH_NEET_EXTRACTION_VERSION
+        )
+        for page_index, page_data in extractor.iter_pages():
+            self.last_c_code = None
+
+            table = page_data["table"]
+            if self._is_table_usable(table):
+                self._parse_page_with_table(table, self._map_headers(table[:5]))
+            else:
+                self._parse_page_with_regex(page_data["text"])
+
+            processed_pages += 1
+            if processed_pages % PROGRESS_EVERY == 0:
+                logger.info(f"♻️ Processed {processed_pages} pages.")
+
+        logger.info(f"📊 Completed {processed_pages} pages.")
             
         for (c_code, quota, cat, g), max_rank in self.tracker.items():
             c_name = self.names_map.get(c_code, "Unknown")
@@ -102,14 +101,22 @@ class MHNeetTabularParser:
                 "parser_version": self.PARSER_VERSION
             }
 
-    def _map_headers(self, header_rows: List[List[str]]) -> Dict[str, int]:
+    @classmethod
+    def _is_table_usable(cls, table) -> bool:
+        if not table or len(table) < 3:
+            return False
+        col_map = cls._map_headers(table[:5])
+        return MH_NEET_REQUIRED_COLUMNS.issubset(set(col_map.keys()))
+
+    @classmethod
+    def _map_headers(cls, header_rows: List[List[str]]) -> Dict[str, int]:
         col_map = {}
         for row in header_rows:
             if not row: continue
             for col_idx, cell in enumerate(row):
                 cell_str = str(cell).strip().lower()
                 if not cell_str: continue
-                for std_key, patterns in self.HEADER_ALIASES.items():
+                for std_key, patterns in cls.HEADER_ALIASES.items():
                     if std_key not in col_map: 
                         if any(re.search(p, cell_str) for p in patterns):
                             col_map[std_key] = col_idx
@@ -182,8 +189,8 @@ class MHNeetTabularParser:
             # SUCCESS. Arm the tracker for the next possible floating line.
             self.last_c_code = c_code
 
-    def _parse_page_with_regex(self, page):
-        lines = page.extract_text().split('\n')
+    def _parse_page_with_regex(self, page_text: str):
+        lines = page_text.split('\n')
         for line in lines:
             line = line.strip()
             if not line: continue
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.config import settings
+from ingestion.common.services.provider_response_cache import ProviderResponseCache
 from .pincode_resolver import pincode_resolver
 
 logger = logging.getLogger(__name__)
@@ -37,7 +38,10 @@ class GooglePlacesClient:
     TIMEOUT_SEC = 10
     PINCODE_REGEX = re.compile(r'\b[1-9][0-9]{5}\b')
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ProviderResponseCache] = None, rate_limiter=None):
+        self.cache = cache if cache is not None else ProviderResponseCache()
+        # Optional RedisTokenBucket: every live attempt (retries included) spends one token.
+        self.rate_limiter = rate_limiter
         self._api_key = getattr(settings, "SERPER_API_KEY", os.getenv("SERPER_API_KEY"))
         if not self._api_key:
             raise ValueError("CRITICAL: SERPER_API_KEY missing from environment variables.")
@@ -66,6 +70,9 @@ class GooglePlacesClient:
         reraise=True
     )
     def _execute_search(self, query: str) -> Dict[str, Any]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
         payload = {"q": query}
         try:
             response = self.session.post(self.BASE_URL, json=payload, timeout=self.TIMEOUT_SEC)
@@ -85,12 +92,12 @@ class GooglePlacesClient:
         else:
             response.raise_for_status()
 
-    def search_college_location(self, canonical_name: str, expected_state_code: str) -> Optional[LocationCandidateDTO]:
+    def search_college_location(self, canonical_name: str, expected_state_code: str, force: bool = False) -> Optional[LocationCandidateDTO]:
         query = self._build_query(canonical_name, expected_state_code)
         logger.info(f"[GooglePlaces] Searching location for: '{query}'")
 
         try:
-            raw_json = self._execute_search(query)
+            raw_json = self.cache.fetch("SERPER_PLACES", "college_location", query, self._execute_search, force=force)
         except Exception as e:
             logger.error(f"[GooglePlaces] Search failed for {canonical_name}: {str(e)}")
             return None
@@ -0,0 +1,154 @@
+import os
+import json
+import mmap
+import struct
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# --- On-disk layout (little-endian) ---
+#   header   : magic, version, record_count, district_count, state_count,
+#              records_offset, districts_offset, states_offset
+#   records  : record_count x (pin u32, district_idx u16, state_idx u16), sorted by pin
+#   districts: "\n"-joined UTF-8 interned district names
+#   states   : "\n"-joined UTF-8 interned state codes
+INDEX_MAGIC = b"PINIDX\x00\x01"
+INDEX_VERSION = 1
+HEADER = struct.Struct("<8sIIIIIII")
+RECORD = struct.Struct("<IHH")
+
+
+class PincodeIndexError(Exception): pass
+
+
+def build_pincode_index(entries: Iterable[Tuple[str, str, str]], index_path: Path) -> int:
+    """
+    Compiles (pincode, district, state_code) rows into the fixed-width index.
+    First occurrence of a PIN wins (same as the JSON loader). Written atomically,
+    so concurrently booting workers never map a half-written file.
+    """
+    districts: Dict[str, int] = {}
+    states: Dict[str, int] = {}
+    records: Dict[int, Tuple[int, int]] = {}
+
+    for pin, district, state_code in entries:
+        pin_value = int(pin)
+        if pin_value in records:
+            continue
+        district_idx = districts.setdefault(district, len(districts))
+        state_idx = states.setdefault(state_code, len(states))
+        records[pin_value] = (district_idx, state_idx)
+
+    if len(districts) > 0xFFFF or len(states) > 0xFFFF:
+        raise PincodeIndexError("Interned table overflow: more than 65535 districts or states.")
+
+    district_blob = "\n".join(districts).encode("utf-8")
+    state_blob = "\n".join(states).encode("utf-8")
+
+    records_offset = HEADER.size
+    districts_offset = records_offset + len(records) * RECORD.size
+    states_offset = districts_offset + len(district_blob)
+
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".pincodes_", dir=index_path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(
+                INDEX_MAGIC, INDEX_VERSION, len(records), len(districts), len(states),
+                records_offset, districts_offset, states_offset,
+            ))
+            for pin_value in sorted(records):
+                f.write(RECORD.pack(pin_value, *records[pin_value]))
+            f.write(district_blob)
+            f.write(state_blob)
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return len(records)
+
+
+def iter_pincode_json(json_path: Path, state_map: Dict[str, str]) -> Iterable[Tuple[str, str, str]]:
+    """Normalized (pincode, district, state_code) rows from the raw pincodes.json array."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        raw_data = json.load(f)
+
+    if not isinstance(raw_data, list):
+        raise PincodeIndexError("Invalid dataset schema: pincodes.json must be a JSON array.")
+
+    for entry in raw_data:
+        if not isinstance(entry, dict):
+            continue
+
+        # Robust extraction handles both String and Integer JSON types safely
+        pin = str(entry.get("pincode", "")).strip()
+        if len(pin) != 6 or not pin.isdigit():
+            continue
+
+        state_raw = str(entry.get("stateName", "")).strip().upper()
+        yield (
+            pin,
+            str(entry.get("districtName", "")).strip().title(),
+            state_map.get(state_raw, state_raw[:2]),
+        )
+
+
+class PincodeIndex:
+    """
+    Read-only, memory-mapped view of a compiled pincode index.
+
+    Opening it reads the header and the two small interned tables; records stay in
+    the page cache and are binary-searched in place, so forked Celery children share
+    the same physical pages and boot without parsing anything.
+    """
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        with open(self.index_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            (magic, version, self.record_count, district_count, state_count,
+             self._records_offset, districts_offset, states_offset) = HEADER.unpack_from(self._mm, 0)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                raise PincodeIndexError(f"Unsupported pincode index format in {self.index_path}")
+
+            self._districts = self._read_table(districts_offset, states_offset, district_count)
+            self._states = self._read_table(states_offset, len(self._mm), state_count)
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _read_table(self, start: int, end: int, count: int) -> List[str]:
+        values = self._mm[start:end].decode("utf-8").split("\n") if count else []
+        if len(values) != count:
+            raise PincodeIndexError(f"Corrupt interned table in {self.index_path}")
+        return values
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def lookup(self, pin: str) -> Optional[Dict[str, str]]:
+        if len(pin) != 6 or not pin.isdigit():
+            return None
+        target = int(pin)
+
+        lo, hi = 0, self.record_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pin_value, district_idx, state_idx = RECORD.unpack_from(self._mm, self._records_offset + mid * RECORD.size)
+            if pin_value < target:
+                lo = mid + 1
+            elif pin_value > target:
+                hi = mid
+            else:
+                return {"district": self._districts[district_idx], "state_code": self._states[state_idx]}
+        return None
+
+    def close(self):
+        self._mm.close()
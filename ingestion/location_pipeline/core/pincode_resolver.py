@@ -1,8 +1,9 @@
-import json
 import logging
 from pathlib import Path
 from typing import Optional, Dict
 
+from .pincode_index import PincodeIndex, build_pincode_index, iter_pincode_json
+
 logger = logging.getLogger(__name__)
 
 # --- GEOGRAPHIC STANDARDIZER (ISO 3166-2:IN) ---
@@ -25,12 +26,21 @@ STATE_MAP_CONSTANT = {
     "LAKSHADWEEP": "LD", "PUDUCHERRY": "PY"
 }
 
+# __file__ = ingestion/location_pipeline/core/pincode_resolver.py -> parents[2] = ingestion/
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+PINCODE_JSON_PATH = ASSETS_DIR / "pincodes.json"
+PINCODE_INDEX_PATH = ASSETS_DIR / "pincodes.idx"
+
 class PincodeResolver:
     """
-    O(1) In-Memory Geographic Decoder.
-    Transforms raw JSON array into a hyper-fast hashmap on worker boot.
+    O(log n) Memory-Mapped Geographic Decoder.
+    Serves lookups from the compiled pincodes.idx (see pincode_index.py); boot cost is
+    an mmap, and the pages are shared by every worker process on the host.
+    A missing or stale index is compiled from pincodes.json on first boot
+    (scripts/build_pincode_index.py does the same ahead of deploys).
     """
     _instance = None
+    _index: Optional[PincodeIndex] = None
     _dataset: Dict[str, Dict[str, str]] = {}
     _loaded = False
 
@@ -44,54 +54,46 @@ class PincodeResolver:
             self._load_dataset()
 
     def _load_dataset(self):
-        # Deterministic Path Resolution mapped to your VS Code Workspace
-        # __file__       = ingestion/location_pipeline/core/pincode_resolver.py
-        # parent 1       = core/
-        # parent 2       = location_pipeline/
-        # parent 3       = ingestion/
-        
-        current_path = Path(__file__).resolve()
-        ingestion_dir = current_path.parent.parent.parent 
-        file_path = ingestion_dir / "assets" / "pincodes.json"
+        self._loaded = True
+        json_path, index_path = PINCODE_JSON_PATH, PINCODE_INDEX_PATH
 
-        if not file_path.exists():
-            logger.warning(f"⚠️ Pincode dataset missing at {file_path}. PIN resolution disabled.")
-            self._dataset = {}
-            self._loaded = True
+        if not index_path.exists() and not json_path.exists():
+            logger.warning(f"⚠️ Pincode dataset missing at {json_path}. PIN resolution disabled.")
             return
 
+        if json_path.exists() and self._index_is_stale(json_path, index_path):
+            try:
+                count = build_pincode_index(iter_pincode_json(json_path, STATE_MAP_CONSTANT), index_path)
+                logger.info(f"📍 Compiled {count} unique PIN codes into {index_path.name}.")
+            except Exception as e:
+                logger.error(f"❌ Failed to compile pincode index: {str(e)}")
+                if not index_path.exists():
+                    self._load_json_fallback(json_path)
+                    return
+
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                raw_data = json.load(f)
-            
-            if not isinstance(raw_data, list):
-                logger.error("❌ Invalid dataset schema: pincodes.json must be a JSON array.")
-                self._dataset = {}
-                self._loaded = True
-                return
+            self._index = PincodeIndex(index_path)
+            logger.info(f"📍 Memory-mapped {len(self._index)} unique PIN codes.")
+        except Exception as e:
+            logger.error(f"❌ Failed to map pincode index: {str(e)}")
+            if json_path.exists():
+                self._load_json_fallback(json_path)
+
+    @staticmethod
+    def _index_is_stale(json_path: Path, index_path: Path) -> bool:
+        return not index_path.exists() or index_path.stat().st_mtime < json_path.stat().st_mtime
 
-            for entry in raw_data:
-                if not isinstance(entry, dict):
-                    continue
-                    
-                # Robust extraction handles both String and Integer JSON types safely
-                pin = str(entry.get("pincode", "")).strip()
-                if len(pin) == 6:
-                    if pin not in self._dataset:
-                        state_raw = str(entry.get("stateName", "")).strip().upper()
-                        state_code = STATE_MAP_CONSTANT.get(state_raw, state_raw[:2])
-                        
-                        self._dataset[pin] = {
-                            "district": str(entry.get("districtName", "")).strip().title(),
-                            "state_code": state_code
-                        }
-                    
+    def _load_json_fallback(self, json_path: Path):
+        """Legacy in-memory hashmap, used only when the index cannot be written or mapped."""
+        try:
+            dataset = {}
+            for pin, district, state_code in iter_pincode_json(json_path, STATE_MAP_CONSTANT):
+                dataset.setdefault(pin, {"district": district, "state_code": state_code})
+            self._dataset = dataset
             logger.info(f"📍 Successfully loaded {len(self._dataset)} unique PIN codes into memory cache.")
-            self._loaded = True
         except Exception as e:
             logger.error(f"❌ Failed to parse pincodes.json: {str(e)}")
             self._dataset = {}
-            self._loaded = True
 
     def resolve(self, pincode: str) -> Optional[Dict[str, str]]:
         if not pincode:
@@ -99,6 +101,8 @@ class PincodeResolver:
         pin = pincode.strip()
         if len(pin) != 6:
             return None
+        if self._index is not None:
+            return self._index.lookup(pin)
         return self._dataset.get(pin)
 
-pincode_resolver = PincodeResolver()
\ No newline at end of file
+pincode_resolver = PincodeResolver()
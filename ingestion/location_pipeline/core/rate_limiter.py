@@ -0,0 +1,54 @@
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Atomic refill + reservation, timed by the Redis server clock so every worker
+# host agrees on "now". Returns the seconds the caller must wait (as a string:
+# Lua numbers are truncated to integers on the way out).
+RESERVE_LUA_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+
+tokens = math.min(burst, tokens + (now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 60)
+
+if tokens < 0 then
+  return tostring(-tokens / rate)
+end
+return "0"
+"""
+
+
+class RedisTokenBucket:
+    """
+    Cluster-wide token bucket for a paid provider.
+
+    Celery's per-task rate_limit is enforced per worker process, so N workers can
+    call the provider N times faster than intended. Here every caller reserves a
+    token from one Redis hash (the balance may go negative) and sleeps until its
+    reservation matures, which spaces calls evenly across all workers.
+    """
+    def __init__(self, redis_client, key: str, rate_per_second: float, burst: int = 1):
+        self.redis_client = redis_client
+        self.key = f"ratelimit:{key}"
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self._reserve = redis_client.register_script(RESERVE_LUA_SCRIPT)
+
+    def acquire(self) -> float:
+        """Blocks until a provider call is allowed. Returns the seconds waited."""
+        if self.rate_per_second <= 0:
+            return 0.0
+
+        wait = float(self._reserve(keys=[self.key], args=[self.rate_per_second, self.burst]))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
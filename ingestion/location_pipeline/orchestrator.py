@@ -1,25 +1,40 @@
+import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy import case, func, exists
+from sqlalchemy import case, func, exists, select
 
 from app.models import (
+    College,
     CollegeLocation, 
     CollegeLocationCandidate, 
     LocationStatusEnum, 
     LocationIngestionTracker
 )
-from .core.google_places_client import GooglePlacesClient
+from ingestion.common.config import (
+    LOCATION_PROVIDER_RATE_PER_SEC,
+    LOCATION_PROVIDER_BURST,
+    LOCATION_BATCH_CONCURRENCY,
+)
+from .core.google_places_client import GooglePlacesClient, LocationCandidateDTO
+from .core.rate_limiter import RedisTokenBucket
 
 logger = logging.getLogger(__name__)
 
 class LocationIngestionOrchestrator:
-    def __init__(self, db_session_factory: sessionmaker):
+    def __init__(self, db_session_factory: sessionmaker, rate_limiter: Optional[RedisTokenBucket] = None):
         self.SessionLocal = db_session_factory
-        self.client = GooglePlacesClient()
+        if rate_limiter is None:
+            from .core.redis_lock import redis_client
+            rate_limiter = RedisTokenBucket(
+                redis_client, "serper_places", LOCATION_PROVIDER_RATE_PER_SEC, LOCATION_PROVIDER_BURST
+            )
+        self.client = GooglePlacesClient(rate_limiter=rate_limiter)
 
-    def ingest_location(self, college_id: str, canonical_name: str, state_code: str) -> bool:
+    def ingest_location(self, college_id: str, canonical_name: str, state_code: str, force: bool = False) -> bool:
         # 1. HARD EXHAUSTION GATE
         with self.SessionLocal() as session:
             is_exhausted = session.query(
@@ -51,7 +66,7 @@ class LocationIngestionOrchestrator:
                 return True
 
         # 3. NETWORK IO: GOOGLE PLACES API
-        candidate_dto = self.client.search_college_location(canonical_name, state_code)
+        candidate_dto = self.client.search_college_location(canonical_name, state_code, force=force)
 
         if not candidate_dto:
             logger.warning(f"[{college_id}] No viable location candidates found by API.")
@@ -61,6 +76,132 @@ class LocationIngestionOrchestrator:
         # 4. THE TRANSACTIONAL COMMIT
         return self._attempt_db_commit(college_id, candidate_dto)
 
+    def ingest_location_batch(self, colleges: List[Dict[str, str]], force: bool = False) -> Dict[str, int]:
+        """
+        Batch variant of ingest_location for bulk backfills.
+        colleges: [{"college_id", "canonical_name", "state_code"}, ...]
+
+        One query replaces the three per-college gate checks, provider calls run on a
+        small pool behind the global token bucket, and candidates / exhaustion
+        increments are written in one transaction each.
+        """
+        summary = {"eligible": 0, "ingested": 0, "no_candidate": 0, "skipped": 0}
+        if not colleges:
+            return summary
+
+        # 1-2. HARD EXHAUSTION GATE + SOFT LOCK, set-based
+        eligible_ids = self._filter_eligible([c["college_id"] for c in colleges])
+        targets = [c for c in colleges if c["college_id"] in eligible_ids]
+        summary["eligible"] = len(targets)
+        summary["skipped"] = len(colleges) - len(targets)
+        if not targets:
+            return summary
+
+        # 3. NETWORK IO: paced cluster-wide by the Redis token bucket
+        workers = max(1, min(LOCATION_BATCH_CONCURRENCY, len(targets)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="location-batch") as pool:
+            dtos = list(pool.map(
+                lambda c: self.client.search_college_location(c["canonical_name"], c["state_code"], force=force),
+                targets
+            ))
+
+        found: List[Tuple[str, LocationCandidateDTO]] = []
+        missing: List[str] = []
+        for college, dto in zip(targets, dtos):
+            if dto:
+                found.append((college["college_id"], dto))
+            else:
+                missing.append(college["college_id"])
+
+        # 4. BATCHED TRANSACTIONAL COMMITS
+        summary["ingested"] = self._bulk_insert_candidates(found)
+        summary["no_candidate"] = len(missing)
+        self._bulk_increment_semantic_exhaustion(missing)
+
+        logger.info(f"[LocationBatch] {summary}")
+        return summary
+
+    def _filter_eligible(self, college_ids: List[str]) -> Set[str]:
+        stmt = select(College.college_id).where(
+            College.college_id.in_(college_ids),
+            ~exists().where(
+                LocationIngestionTracker.college_id == College.college_id,
+                LocationIngestionTracker.is_exhausted == True
+            ),
+            ~exists().where(CollegeLocation.college_id == College.college_id),
+            ~exists().where(
+                CollegeLocationCandidate.college_id == College.college_id,
+                CollegeLocationCandidate.status == LocationStatusEnum.PENDING
+            ),
+        )
+        with self.SessionLocal() as session:
+            return {str(college_id) for college_id in session.scalars(stmt)}
+
+    def _bulk_insert_candidates(self, found: List[Tuple[str, LocationCandidateDTO]]) -> int:
+        if not found:
+            return 0
+
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "college_id": college_id,
+                "address_line": dto.raw_address,
+                "city": dto.parsed_city,
+                "district": dto.parsed_district,
+                "state_code": dto.parsed_state_code,
+                "pincode": dto.pincode,
+                "latitude": dto.latitude,
+                "longitude": dto.longitude,
+                "source_provider": "SERPER_PLACES",
+                "raw_provider_payload": dto.raw_payload,
+                "status": LocationStatusEnum.PENDING,
+            }
+            for college_id, dto in found
+        ]
+
+        # A concurrent single-college task may have secured a PENDING row meanwhile;
+        # uq_pending_location_candidate turns that into a skipped row, not a failed batch.
+        stmt = insert(CollegeLocationCandidate).values(rows).on_conflict_do_nothing().returning(
+            CollegeLocationCandidate.college_id
+        )
+        with self.SessionLocal() as session:
+            try:
+                inserted = session.execute(stmt).all()
+                session.commit()
+            except OperationalError:
+                session.rollback()
+                # Safe to retry: the eligibility filter and ON CONFLICT make the batch idempotent.
+                raise
+
+        logger.info(f"[LocationBatch] Secured {len(inserted)}/{len(rows)} Location Candidates.")
+        return len(inserted)
+
+    def _bulk_increment_semantic_exhaustion(self, college_ids: List[str]):
+        if not college_ids:
+            return
+        with self.SessionLocal() as session:
+            try:
+                stmt = insert(LocationIngestionTracker).values([
+                    {"college_id": college_id, "attempt_count": 1, "is_exhausted": False}
+                    for college_id in dict.fromkeys(college_ids)
+                ])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['college_id'],
+                    set_={
+                        'attempt_count': LocationIngestionTracker.attempt_count + 1,
+                        'is_exhausted': case(
+                            (LocationIngestionTracker.attempt_count + 1 >= 3, True),
+                            else_=LocationIngestionTracker.is_exhausted
+                        ),
+                        'last_attempted_at': func.now()
+                    }
+                )
+                session.execute(stmt)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"[LocationBatch] Failed to increment exhaustion trackers for {len(college_ids)} colleges: {str(e)}")
+
     def _attempt_db_commit(self, college_id: str, dto) -> bool:
         with self.SessionLocal() as session:
             new_candidate = CollegeLocationCandidate(
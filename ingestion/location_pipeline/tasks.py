@@ -1,4 +1,5 @@
 import logging
+from typing import Dict, List
 from celery import shared_task
 from sqlalchemy.exc import OperationalError
 from redis.exceptions import ConnectionError as RedisConnectionError
@@ -41,7 +42,7 @@ return 0
     reject_on_worker_lost=True, 
     queue="ingestion_queue"
 )
-def ingest_college_location_task(self, college_id: str, canonical_name: str, state_code: str):
+def ingest_college_location_task(self, college_id: str, canonical_name: str, state_code: str, force: bool = False):
     """
     Asynchronous executor for Location Pipeline.
     Protected by strict distributed locks and telemetry counters.
@@ -64,7 +65,9 @@ def ingest_college_location_task(self, college_id: str, canonical_name: str, sta
             success = orchestrator.ingest_location(
                 college_id=college_id, 
                 canonical_name=canonical_name, 
-                state_code=state_code
+                state_code=state_code,
+                # Retries after transient infra failures reuse the response the first attempt paid for.
+                force=force and self.request.retries == 0
             )
             
             if success:
@@ -78,4 +81,44 @@ def ingest_college_location_task(self, college_id: str, canonical_name: str, sta
             with redis_client.pipeline() as pipe:
                 pipe.eval(SAFE_DECR_SCRIPT, 1, TELEMETRY_KEY)
                 pipe.expire(TELEMETRY_KEY, 1800)
-                pipe.execute()
\ No newline at end of file
+                pipe.execute()
+
+
+@shared_task(
+    name="ingestion.location_pipeline.tasks.ingest_college_location_batch_task",
+    bind=True,
+    max_retries=3,
+    autoretry_for=TRANSIENT_INFRA_ERRORS, 
+    retry_backoff=True,         
+    retry_backoff_max=300,      
+    retry_jitter=True,
+    acks_late=True,             
+    reject_on_worker_lost=True, 
+    queue="ingestion_queue"
+)
+def ingest_college_location_batch_task(self, colleges: List[Dict[str, str]], force: bool = False):
+    """
+    Bulk backfill executor. No Celery rate_limit here: provider calls are paced by the
+    orchestrator's cluster-wide Redis token bucket instead of per worker.
+    """
+    with redis_client.pipeline() as pipe:
+        pipe.incr(TELEMETRY_KEY)
+        pipe.expire(TELEMETRY_KEY, 1800)
+        pipe.execute()
+
+    try:
+        logger.info(f"▶️ Starting Location Batch for {len(colleges)} colleges.")
+        orchestrator = LocationIngestionOrchestrator(SessionLocal)
+        return orchestrator.ingest_location_batch(
+            colleges,
+            # Retries after transient infra failures reuse the responses the first attempt paid for.
+            force=force and self.request.retries == 0
+        )
+    except Exception as e:
+        logger.exception(f"❌ Location Batch Failure: {type(e).__name__}")
+        raise
+    finally:
+        with redis_client.pipeline() as pipe:
+            pipe.eval(SAFE_DECR_SCRIPT, 1, TELEMETRY_KEY)
+            pipe.expire(TELEMETRY_KEY, 1800)
+            pipe.execute()
@@ -39,4 +39,8 @@ CAMPUS_MAX_BYTES: Final[int] = 5 * 1024 * 1024   # 5 MB
 
 # --- Rate Limiting Defaults ---
 DEFAULT_REQUEST_TIMEOUT_SEC: Final[int] = 10
-DEFAULT_RETRY_ATTEMPTS: Final[int] = 3
\ No newline at end of file
+DEFAULT_RETRY_ATTEMPTS: Final[int] = 3
+
+# --- Candidate Probing ---
+# Candidates HEAD-probed (and the survivors downloaded) in parallel per ingestion.
+PROBE_CONCURRENCY: Final[int] = 5
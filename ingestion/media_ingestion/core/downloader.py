@@ -27,6 +27,12 @@ class DownloadedMedia:
     content_hash: str
     byte_size: int
 
+@dataclass
+class ProbedCandidate:
+    final_url: str
+    declared_mime: Optional[str]
+    declared_size: Optional[int]
+
 class SecureMediaDownloader:
     """
     Enterprise-grade streaming downloader. 
@@ -80,15 +86,21 @@ class SecureMediaDownloader:
 
     def _get_safe_stream(self, url: str) -> requests.Response:
         """Executes HTTP GET while manually traversing redirects to enforce SSRF checks."""
+        return self._safe_request("GET", url)
+
+    def _safe_request(self, method: str, url: str, extra_headers: Optional[dict] = None) -> requests.Response:
+        """Any verb, same SSRF-checked manual redirect traversal. response.url is the final hop."""
         current_url = url
+        headers = {**self.DEFAULT_HEADERS, **(extra_headers or {})}
         
         for hop in range(self.MAX_REDIRECTS):
             self._verify_ip_safety(current_url)
             
             # Explicit security: verify=True, allow_redirects=False
-            response = requests.get(
+            response = requests.request(
+                method,
                 current_url, 
-                headers=self.DEFAULT_HEADERS,
+                headers=headers,
                 stream=True, 
                 timeout=self.TIMEOUT_TUPLE, 
                 allow_redirects=False,
@@ -110,6 +122,54 @@ class SecureMediaDownloader:
             
         raise DownloadError(f"Exceeded maximum of {self.MAX_REDIRECTS} redirects.")
 
+    def _check_declared_headers(self, headers, max_bytes: int, declared_length: Optional[str]) -> Optional[str]:
+        """Advisory Content-Type + strict Content-Length gate. Returns the declared base MIME (or None)."""
+        declared_type = headers.get("Content-Type", "").lower()
+        base_type = declared_type.split(";")[0].strip()
+
+        if base_type and base_type not in self.ALLOWED_MIMES:
+            raise MalformedHeaderError(f"Rejected: Declared Content-Type '{declared_type}' is not an authorized image format.")
+
+        if declared_length:
+            try:
+                if int(declared_length) > max_bytes:
+                    raise FileTooLargeError(f"Rejected: Declared size {declared_length} exceeds limit.")
+            except ValueError:
+                raise MalformedHeaderError("Rejected: Content-Length header is not a valid integer.")
+
+        return base_type or None
+
+    def probe(self, url: str, max_bytes: int) -> ProbedCandidate:
+        """
+        Cheap pre-flight for a candidate: HEAD (or a 1-byte ranged GET when HEAD is
+        refused) through the same SSRF firewall and redirect cap as the download.
+        Rejects on declared MIME / size without transferring the body.
+        """
+        try:
+            try:
+                response = self._safe_request("HEAD", url)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code not in (403, 405, 501):
+                    raise
+                response = self._safe_request("GET", url, {"Range": "bytes=0-0"})
+
+            with response:
+                declared_length = response.headers.get("Content-Length")
+                if response.status_code == 206:
+                    # "bytes 0-0/12345" -> total size lives after the slash
+                    declared_length = response.headers.get("Content-Range", "").rpartition("/")[2]
+                    if declared_length == "*":
+                        declared_length = None
+
+                base_type = self._check_declared_headers(response.headers, max_bytes, declared_length)
+                return ProbedCandidate(
+                    final_url=response.url,
+                    declared_mime=base_type,
+                    declared_size=int(declared_length) if declared_length else None,
+                )
+        except requests.RequestException as e:
+            raise DownloadError(f"Probe failed - {type(e).__name__}: {str(e)}") from e
+
     def download_and_validate(self, url: str, max_bytes: int) -> DownloadedMedia:
         safe_hostname = urlparse(url).hostname or "unknown_host"
         temp_fd, temp_path = tempfile.mkstemp(prefix="derived_media_")
@@ -119,21 +179,10 @@ class SecureMediaDownloader:
             # Context manager guarantees socket closure on all exit paths
             with self._get_safe_stream(url) as response:
                 
-                # Strict Pre-Flight Content-Type Verification (Advisory Fail-Fast)
-                declared_type = response.headers.get("Content-Type", "").lower()
-                base_type = declared_type.split(";")[0].strip()
-                
-                if base_type and base_type not in self.ALLOWED_MIMES:
-                     raise MalformedHeaderError(f"Rejected: Declared Content-Type '{declared_type}' is not an authorized image format.")
-
-                # Pre-Flight Content-Length (Strict Fail-Closed)
-                declared_length = response.headers.get("Content-Length")
-                if declared_length:
-                    try:
-                        if int(declared_length) > max_bytes:
-                            raise FileTooLargeError(f"Rejected: Declared size {declared_length} exceeds limit.")
-                    except ValueError:
-                        raise MalformedHeaderError("Rejected: Content-Length header is not a valid integer.")
+                # Strict Pre-Flight Content-Type (Advisory Fail-Fast) / Content-Length (Strict Fail-Closed)
+                base_type = self._check_declared_headers(
+                    response.headers, max_bytes, response.headers.get("Content-Length")
+                ) or ""
 
                 # The Air-Lock Stream & Incremental Hash
                 bytes_received = 0
@@ -1,11 +1,12 @@
 import os
 import logging
 import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.config import settings
 from app.models import MediaTypeEnum
+from ingestion.common.services.provider_response_cache import ProviderResponseCache
 
 from .constants import DEFAULT_REQUEST_TIMEOUT_SEC, DEFAULT_RETRY_ATTEMPTS
 from .search_interface import (
@@ -30,7 +31,9 @@ class GoogleImageSearchClient(ImageSearchProvider):
 
     BASE_URL = "https://google.serper.dev/images"
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ProviderResponseCache] = None):
+        self.cache = cache if cache is not None else ProviderResponseCache()
+
         # We use os.getenv as a fallback so you don't have to modify your Pydantic settings.py
         self._api_key = getattr(settings, "SERPER_API_KEY", os.getenv("SERPER_API_KEY"))
         
@@ -55,26 +58,26 @@ class GoogleImageSearchClient(ImageSearchProvider):
     # Public Entry Points
     # ============================================================
 
-    def search_logo(self, canonical_name: str, city: str, max_results: int = 5) -> SearchResult:
+    def search_logo(self, canonical_name: str, city: str, max_results: int = 5, force: bool = False) -> SearchResult:
         query = self._build_logo_query(canonical_name, city)
-        return self._orchestrate_search(query, MediaTypeEnum.LOGO, max_results)
+        return self._orchestrate_search(query, MediaTypeEnum.LOGO, max_results, force)
 
-    def search_campus_hero(self, canonical_name: str, city: str, max_results: int = 5) -> SearchResult:
+    def search_campus_hero(self, canonical_name: str, city: str, max_results: int = 5, force: bool = False) -> SearchResult:
         query = self._build_campus_query(canonical_name, city)
-        return self._orchestrate_search(query, MediaTypeEnum.CAMPUS_HERO, max_results)
+        return self._orchestrate_search(query, MediaTypeEnum.CAMPUS_HERO, max_results, force)
 
     # ============================================================
     # Core Orchestration
     # ============================================================
 
-    def _orchestrate_search(self, query: str, media_type: MediaTypeEnum, max_results: int) -> SearchResult:
-        """Coordinates the exact sequence: Telemetry -> IO -> Parse -> Govern -> Cap."""
+    def _orchestrate_search(self, query: str, media_type: MediaTypeEnum, max_results: int, force: bool = False) -> SearchResult:
+        """Coordinates the exact sequence: Telemetry -> IO (cache-through) -> Parse -> Govern -> Cap."""
         telemetry = SearchTelemetry(raw_query=query)
         logger.info(f"[{self.provider_name}] Executing {media_type.value} search. Query: '{query}'")
 
         try:
-            # 1. Network IO (Defensive)
-            raw_json = self._execute_search(query)
+            # 1. Network IO (Defensive), served from the provider cache unless forced
+            raw_json = self.cache.fetch(self.provider_name, media_type.value, query, self._execute_search, force=force)
             
             # 2. Schema Firewall (Parsing)
             raw_candidates = self._parse_response(raw_json)
@@ -88,11 +88,11 @@ class ImageSearchProvider(ABC):
         pass
 
     @abstractmethod
-    def search_logo(self, canonical_name: str, city: str, max_results: int = 5) -> SearchResult:
+    def search_logo(self, canonical_name: str, city: str, max_results: int = 5, force: bool = False) -> SearchResult:
         pass
 
     @abstractmethod
-    def search_campus_hero(self, canonical_name: str, city: str, max_results: int = 5) -> SearchResult:
+    def search_campus_hero(self, canonical_name: str, city: str, max_results: int = 5, force: bool = False) -> SearchResult:
         pass
 
     # ---------------------------
@@ -1,10 +1,10 @@
 import os
 import logging
-import boto3
+from typing import Set
 from botocore.exceptions import BotoCoreError, ClientError
-from botocore.config import Config
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 from app.config import settings
+from app.services.object_storage import ObjectStorage, get_s3_client
 
 logger = logging.getLogger(__name__)
 
@@ -32,29 +32,27 @@ def is_retryable_storage_error(exception: BaseException) -> bool:
 
     return False
 
+# Buckets already verified by this process (the check costs a round-trip per task otherwise).
+_verified_buckets: Set[str] = set()
+
 class MinioStorageClient:
     """
     Deterministic storage adapter for S3-compatible backends.
     Enforces strict access controls, idempotent bandwidth preservation, 
     and highly surgical transient fault tolerance.
+    Rides on the process-wide pooled S3 client (app.services.object_storage).
     """
     def __init__(self):
         self.bucket_name = settings.S3_BUCKET_NAME
-        
-        # Enforce strict AWS Signature v4 for perfect MinIO compatibility
-        strict_config = Config(signature_version="s3v4")
-        
-        self.s3_client = boto3.client(
-            "s3",
-            endpoint_url=settings.S3_ENDPOINT_URL,
-            aws_access_key_id=settings.S3_ACCESS_KEY,
-            aws_secret_access_key=settings.S3_SECRET_KEY,
-            config=strict_config
-        )
+        self.s3_client = get_s3_client(settings.S3_ENDPOINT_URL, settings.S3_ACCESS_KEY, settings.S3_SECRET_KEY)
+        self.storage = ObjectStorage(self.bucket_name, self.s3_client)
 
         # Fail-Fast Infrastructure Check: Guarantee bucket exists on boot
+        if self.bucket_name in _verified_buckets:
+            return
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
+            _verified_buckets.add(self.bucket_name)
             logger.info(f"[Storage] Verified access to bucket: {self.bucket_name}")
         except ClientError as e:
             raise StorageConfigurationError(f"CRITICAL: Bucket '{self.bucket_name}' is inaccessible or missing: {str(e)}") from e
@@ -75,42 +73,24 @@ class MinioStorageClient:
         mime_type: str
     ) -> str:
         """
-        Executes a pre-flight idempotency check, verifies local file integrity, 
-        and streams the payload to MinIO via TransferManager.
+        Verifies local file integrity, then streams the payload to MinIO via
+        TransferManager (multipart above the threshold) unless the key already exists.
         """
         # Deterministic Path: colleges/UUID/logo/hash.png
         storage_key = f"colleges/{college_id}/{media_type.lower()}/{content_hash}{extension}"
-        
-        # 1. Bandwidth Idempotency Check
-        try:
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=storage_key)
-            logger.info(f"[Storage] Object {storage_key} already exists. Skipping upload.")
-            return storage_key
-        except ClientError as e:
-            # Safely handle various S3-compatible missing object codes
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code not in ("404", "NoSuchKey", "NotFound"):
-                # If it's a 403 or 500 during head_object, we raise it. Tenacity will evaluate it.
-                raise StorageUploadError(f"MinIO Head Object Failure: {str(e)}") from e
 
-        # 2. Local Integrity Verification (Pre-Stream)
+        # 1. Local Integrity Verification (Pre-Stream)
         try:
             file_size = os.path.getsize(file_path)
         except OSError as e:
             raise StorageUploadError(f"Failed to read file size for {file_path}: {str(e)}") from e
 
-        # 3. Upload Stream (Boto3 TransferManager handles chunking automatically)
+        # 2. Idempotent Upload Stream: content-hash key, so an existing object is the same
+        # bytes and ObjectStorage skips on its HEAD. Head/transfer failures (403, 500, socket
+        # drops) surface below and Tenacity evaluates them.
         try:
-            with open(file_path, "rb") as f:
-                self.s3_client.upload_fileobj(
-                    f, 
-                    self.bucket_name, 
-                    storage_key,
-                    ExtraArgs={
-                        "ContentType": mime_type
-                    }
-                )
-            logger.info(f"[Storage] Successfully persisted {storage_key} to MinIO ({file_size} bytes).")
+            if self.storage.upload_file(file_path, storage_key, mime_type, skip_if_exists=True):
+                logger.info(f"[Storage] Successfully persisted {storage_key} to MinIO ({file_size} bytes).")
             return storage_key
 
         except (BotoCoreError, ClientError) as e:
@@ -1,15 +1,19 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Tuple
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy import case, func, exists
 
 from app.models import CollegeMedia, MediaTypeEnum, MediaStatusEnum, MediaIngestionTracker
-from .core.constants import LOGO_MAX_BYTES, CAMPUS_MAX_BYTES
+from .core.constants import LOGO_MAX_BYTES, CAMPUS_MAX_BYTES, PROBE_CONCURRENCY
 from .core.google_search_client import GoogleImageSearchClient
+from .core.search_interface import ImageCandidate
 from .core.downloader import (
     SecureMediaDownloader, 
+    DownloadedMedia,
     SecurityViolationError, 
     DownloadError, 
     FileTooLargeError, 
@@ -35,10 +39,11 @@ class MediaIngestionOrchestrator:
     def _get_max_bytes(self, media_type: MediaTypeEnum) -> int:
         return LOGO_MAX_BYTES if media_type == MediaTypeEnum.LOGO else CAMPUS_MAX_BYTES
 
-    def ingest_media(self, college_id: str, canonical_name: str, city: str, media_type: MediaTypeEnum) -> bool:
+    def ingest_media(self, college_id: str, canonical_name: str, city: str, media_type: MediaTypeEnum, force: bool = False) -> bool:
         """
         Executes the Stop-on-First-Success ingestion pipeline.
         Returns True if a candidate was successfully secured and committed.
+        force=True re-queries the search provider instead of serving its cached response.
         """
         # ==========================================
         # 0. HARD EXHAUSTION GATE (CIRCUIT BREAKER)
@@ -74,9 +79,9 @@ class MediaIngestionOrchestrator:
         # 2. NETWORK IO: GOOGLE DISCOVERY
         # ==========================================
         if media_type == MediaTypeEnum.LOGO:
-            search_result = self.search_client.search_logo(canonical_name, city)
+            search_result = self.search_client.search_logo(canonical_name, city, force=force)
         else:
-            search_result = self.search_client.search_campus_hero(canonical_name, city)
+            search_result = self.search_client.search_campus_hero(canonical_name, city, force=force)
 
         if not search_result.candidates:
             logger.warning(f"[{college_id}] No viable candidates found for {media_type.name}.")
@@ -86,33 +91,23 @@ class MediaIngestionOrchestrator:
         max_bytes = self._get_max_bytes(media_type)
 
         # ==========================================
-        # 3. THE STOP-ON-FIRST-SUCCESS LOOP
+        # 3. CONCURRENT AIR-LOCK (PROBE -> DOWNLOAD)
         # ==========================================
-        for candidate in search_result.candidates:
-            downloaded_media = None
-            try:
-                # --- PHASE A: THE AIR-LOCK ---
-                try:
-                    downloaded_media = self.downloader.download_and_validate(candidate.image_url, max_bytes)
-                except SecurityViolationError as e:
-                    logger.warning(f"[{college_id}] Security Violation on {candidate.source_domain}: {str(e)}")
-                    continue 
-                except (DownloadError, FileTooLargeError, MalformedHeaderError, InvalidMimeTypeError) as e:
-                    logger.debug(f"[{college_id}] Air-Lock rejected candidate: {str(e)}")
-                    continue 
+        # Every candidate is HEAD-probed at once, survivors are downloaded at once;
+        # rank order is preserved so the winner is still the best-ranked survivor.
+        downloads = self._acquire_candidates(college_id, search_result.candidates, max_bytes)
 
-                # --- PHASE A.1: CRYPTOGRAPHIC TOMBSTONE SKIP ---
-                with self.SessionLocal() as skip_session:
-                    tombstone_check = skip_session.query(CollegeMedia).filter(
-                        CollegeMedia.college_id == college_id,
-                        CollegeMedia.content_hash == downloaded_media.content_hash
-                    ).first()
-                    
-                    if tombstone_check:
-                        logger.info(f"[{college_id}] Tombstone Skip: Hash {downloaded_media.content_hash} already known (Status: {tombstone_check.status.value}). Dropping candidate.")
-                        if os.path.exists(downloaded_media.temp_file_path):
-                            os.remove(downloaded_media.temp_file_path)
-                        continue
+        try:
+            # --- PHASE A.1: CRYPTOGRAPHIC TOMBSTONE SKIP (one query for all hashes) ---
+            known_hashes = self._known_content_hashes(college_id, {media.content_hash for _, media in downloads})
+
+            # ==========================================
+            # 4. THE STOP-ON-FIRST-SUCCESS LOOP
+            # ==========================================
+            for candidate, downloaded_media in downloads:
+                if downloaded_media.content_hash in known_hashes:
+                    logger.info(f"[{college_id}] Tombstone Skip: Hash {downloaded_media.content_hash} already known. Dropping candidate.")
+                    continue
 
                 # --- PHASE B: THE VAULT ADAPTER ---
                 try:
@@ -141,15 +136,69 @@ class MediaIngestionOrchestrator:
                     logger.info(f"[{college_id}] Successfully ingested {media_type.name}. Halting loop.")
                     return True
 
-            finally:
-                # Memory & Disk Immunity: Guarantee /tmp filesystem stays clean
-                if downloaded_media and os.path.exists(downloaded_media.temp_file_path):
+                # Same bytes from another candidate URL would collide the same way.
+                known_hashes.add(downloaded_media.content_hash)
+
+        finally:
+            # Memory & Disk Immunity: Guarantee /tmp filesystem stays clean
+            for _, downloaded_media in downloads:
+                if os.path.exists(downloaded_media.temp_file_path):
                     os.remove(downloaded_media.temp_file_path)
 
         # Loop exhausted all candidates without returning True.
         self._increment_semantic_exhaustion(college_id, media_type)
         return False
 
+    def _acquire_candidates(
+        self, college_id: str, candidates: List[ImageCandidate], max_bytes: int
+    ) -> List[Tuple[ImageCandidate, DownloadedMedia]]:
+        """
+        Probes all candidates in parallel, then downloads the probe survivors in parallel.
+        Returns (candidate, media) in the original rank order; rejects are logged and dropped.
+        """
+        workers = max(1, min(PROBE_CONCURRENCY, len(candidates)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="media-probe") as pool:
+            probes = list(pool.map(lambda c: self._probe_candidate(college_id, c, max_bytes), candidates))
+            survivors = [(candidate, probe.final_url) for candidate, probe in zip(candidates, probes) if probe]
+
+            downloads = list(pool.map(
+                lambda item: self._download_candidate(college_id, item[0], item[1], max_bytes), survivors
+            ))
+
+        return [(candidate, media) for (candidate, _), media in zip(survivors, downloads) if media]
+
+    def _probe_candidate(self, college_id: str, candidate: ImageCandidate, max_bytes: int):
+        try:
+            return self.downloader.probe(candidate.image_url, max_bytes)
+        except SecurityViolationError as e:
+            logger.warning(f"[{college_id}] Security Violation on {candidate.source_domain}: {str(e)}")
+        except DownloadError as e:
+            logger.debug(f"[{college_id}] Probe rejected candidate: {str(e)}")
+        return None
+
+    def _download_candidate(self, college_id: str, candidate: ImageCandidate, url: str, max_bytes: int) -> Optional[DownloadedMedia]:
+        # The probe's final hop is re-verified by the downloader's SSRF firewall (DNS may have moved).
+        try:
+            return self.downloader.download_and_validate(url, max_bytes)
+        except SecurityViolationError as e:
+            logger.warning(f"[{college_id}] Security Violation on {candidate.source_domain}: {str(e)}")
+        except (DownloadError, FileTooLargeError, MalformedHeaderError, InvalidMimeTypeError) as e:
+            logger.debug(f"[{college_id}] Air-Lock rejected candidate: {str(e)}")
+        except Exception as e:
+            # A single candidate's transport failure must not sink its siblings' downloads.
+            logger.debug(f"[{college_id}] Air-Lock transport failure on {candidate.source_domain}: {type(e).__name__}")
+        return None
+
+    def _known_content_hashes(self, college_id: str, content_hashes: Set[str]) -> Set[str]:
+        if not content_hashes:
+            return set()
+        with self.SessionLocal() as session:
+            rows = session.query(CollegeMedia.content_hash).filter(
+                CollegeMedia.college_id == college_id,
+                CollegeMedia.content_hash.in_(content_hashes)
+            ).all()
+        return {row.content_hash for row in rows}
+
     def _attempt_db_commit(self, college_id, media_type, candidate, downloaded_media, storage_key) -> bool:
         """
         Executes the ephemeral DB commit and the highly surgical exception routing matrix.
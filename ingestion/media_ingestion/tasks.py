@@ -39,7 +39,7 @@ TELEMETRY_KEY = "telemetry:active_media_tasks"
     retry_jitter=True,
     queue="ingestion_queue"
 )
-def ingest_college_media_task(self, college_id: str, canonical_name: str, city: str, media_type_str: str):
+def ingest_college_media_task(self, college_id: str, canonical_name: str, city: str, media_type_str: str, force: bool = False):
     try:
         media_type = MediaTypeEnum[media_type_str]
     except KeyError:
@@ -65,7 +65,9 @@ def ingest_college_media_task(self, college_id: str, canonical_name: str, city:
                 college_id=college_id, 
                 canonical_name=canonical_name, 
                 city=city, 
-                media_type=media_type
+                media_type=media_type,
+                # Retries after transient infra failures reuse the response the first attempt paid for.
+                force=force and self.request.retries == 0
             )
             
             if success:
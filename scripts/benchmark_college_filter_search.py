@@ -0,0 +1,708 @@
+"""
+College-Filter Search Latency Benchmark.
+
+Seeds a synthetic search_read_model and drives the student college-filter search
+with concurrent simulated students, writing machine-readable JSON so latency
+regressions in the runtime (path validation, repository queries, scoring, sorting,
+snapshot cache) can be compared across commits.
+
+Modes:
+  seed     Inserts synthetic paths x colleges x programs x seat buckets into the
+           configured database: exam_path_catalog + filter schema, per-path
+           probability policies, a COMPLETED search_read_model_builds row and the
+           read-model rows (projection / evidence stats, cold-start share).
+  direct   Calls CollegeFilterRuntimeService.search in-process. Cache status and
+           the per-stage timings come from the service itself.
+  http     POSTs /student/college-filter/search against a running API. Cache status
+           is inferred from the fingerprint (first sighting = miss, later = hit),
+           so pass --flush-cache or wait out the snapshot TTL between runs.
+           Every new fingerprint is a billable search for the token's student.
+  compare  Diffs two result files and exits non-zero on a p95 latency regression.
+
+Traffic model (per simulated student):
+  a fresh search (random path, score and filter subset), then with
+  --repeat-ratio the same search again (cache traffic) and with --page-ratio
+  the next page of a random band (pagination over the cached snapshot).
+
+Seed and run against a scratch database, e.g.:
+  POSTGRES_DB=derived_bench python scripts/benchmark_college_filter_search.py seed \\
+      --create-schema --paths 2 --colleges 300 --programs 12 --buckets 10
+  POSTGRES_DB=derived_bench python scripts/benchmark_college_filter_search.py direct \\
+      --students 50 --concurrency 16 --flush-cache --output search_bench.json
+  python scripts/benchmark_college_filter_search.py compare baseline.json search_bench.json
+"""
+import sys
+import os
+import argparse
+import asyncio
+import json
+import logging
+import math
+import platform
+import random
+import subprocess
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+# 1. Setup Paths (To allow importing from 'backend')
+CURRENT_SCRIPT_PATH = os.path.abspath(__file__)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(CURRENT_SCRIPT_PATH))
+sys.path.append(os.path.join(PROJECT_ROOT, "backend"))
+sys.path.append(PROJECT_ROOT)
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger("SearchBenchmark")
+logger.setLevel(logging.INFO)
+
+SCRATCH_DB_MARKERS = ("bench", "test", "scratch")
+BENCH_PATH_PREFIX = "bench_path_"
+SEARCH_ENDPOINT = "/student/college-filter/search"
+
+# Stages timed inside CollegeFilterRuntimeService._compute_search_snapshot_runtime.
+SNAPSHOT_STAGES = (
+    "path_validation_ms",
+    "primary_query_ms",
+    "primary_scoring_ms",
+    "suggested_query_ms",
+    "suggested_scoring_ms",
+    "sorting_ms",
+)
+BANDS = ("safe", "moderate", "hard", "suggested")
+
+CATEGORIES = ("GM", "OBC", "SC", "ST", "EWS")
+RESERVATION_TYPES = ("GENERAL", "RURAL", "KANNADA_MEDIUM")
+COURSE_TYPES = ("ENGINEERING", "ENGINEERING", "ENGINEERING", "ARCHITECTURE")
+LOCATION_TYPES = ("HOME_STATE", "OTHER_STATE")
+STATES = (("KA", ("Bengaluru Urban", "Mysuru", "Dakshina Kannada")), ("MH", ("Pune", "Mumbai", "Nagpur")))
+
+# (filter_key, label, control_type, option_source)
+FILTER_SCHEMA = (
+    ("score", "Rank", "NUMBER_INPUT", "STATIC"),
+    ("category", "Category", "SELECT", "SERVING_MAP"),
+    ("reservation_type", "Reservation", "SELECT", "SERVING_MAP"),
+    ("course_type", "Course Type", "SELECT", "SERVING_MAP"),
+    ("location_type", "Location Type", "SELECT", "LOCATION"),
+    ("state_code", "State", "SELECT", "LOCATION"),
+    ("district", "District", "AUTOCOMPLETE", "LOCATION"),
+)
+OPTIONAL_FILTERS = {
+    "reservation_type": RESERVATION_TYPES,
+    "course_type": tuple(sorted(set(COURSE_TYPES))),
+    "location_type": LOCATION_TYPES,
+    "state_code": tuple(code for code, _ in STATES),
+}
+
+MAX_RANK = 120000
+
+
+# ==========================================================
+# SEEDING
+# ==========================================================
+
+def _policy_values(policy_key: str, path_id: Optional[uuid.UUID]) -> Dict[str, Any]:
+    return {
+        "policy_id": uuid.uuid4(),
+        "policy_key": policy_key,
+        "path_id": path_id,
+        "is_active": True,
+        "version_no": 1,
+        "weight_round_evidence": Decimal("0.4000"),
+        "weight_round_stability": Decimal("0.3500"),
+        "weight_current_year_presence": Decimal("0.2500"),
+        "weight_margin": Decimal("0.7000"),
+        "weight_confidence": Decimal("0.3000"),
+        "probability_base": Decimal("50.0000"),
+        "probability_multiplier": Decimal("100.0000"),
+        "probability_min": Decimal("1.0000"),
+        "probability_max": Decimal("99.0000"),
+        "safe_min_margin": Decimal("0.1000"),
+        "safe_min_confidence": Decimal("0.6000"),
+        "moderate_min_margin": Decimal("0.0000"),
+        "moderate_min_confidence": Decimal("0.4500"),
+        "hard_min_margin": Decimal("-0.1500"),
+        "hard_min_confidence": Decimal("0.3000"),
+        "suggested_min_margin": Decimal("-0.0500"),
+        "suggested_min_confidence": Decimal("0.5000"),
+        "suggested_score_penalty": Decimal("5.0000"),
+        "suggested_probability_penalty": Decimal("10.0000"),
+        "cold_start_probability_cap": Decimal("60.0000"),
+        "cold_start_safe_min_margin": Decimal("0.2000"),
+        "cold_start_safe_min_confidence": Decimal("0.7500"),
+        "notes": "Synthetic policy seeded by benchmark_college_filter_search.py",
+    }
+
+
+def _bucket_profile(bucket_index: int) -> Dict[str, str]:
+    category = CATEGORIES[bucket_index % len(CATEGORIES)]
+    reservation_type = RESERVATION_TYPES[(bucket_index // len(CATEGORIES)) % len(RESERVATION_TYPES)]
+    return {
+        "seat_bucket_code": f"BENCH_{category}_{reservation_type}_{bucket_index:03d}",
+        "category_name": category,
+        "reservation_type": reservation_type,
+    }
+
+
+def _read_model_row(
+    rng: random.Random,
+    build_id: uuid.UUID,
+    path: Dict[str, Any],
+    college: Dict[str, Any],
+    program_index: int,
+    bucket_index: int,
+    policy_id: uuid.UUID,
+) -> Dict[str, Any]:
+    # Popular colleges / programs close earlier; reserved buckets close later.
+    base_rank = college["selectivity"] * (1 + program_index * 0.35) * (1 + (bucket_index % len(CATEGORIES)) * 0.6)
+    closing_rank = min(MAX_RANK, max(50, int(base_rank * rng.uniform(0.85, 1.15))))
+    opening_rank = max(1, int(closing_rank * rng.uniform(0.4, 0.9)))
+
+    is_cold_start = rng.random() < 0.08
+    is_projected = rng.random() < 0.6
+    current_cutoff = closing_rank * rng.uniform(0.92, 1.08) if is_projected else closing_rank
+
+    bucket = _bucket_profile(bucket_index)
+    return {
+        "build_id": build_id,
+        "path_id": path["path_id"],
+        "path_key": path["path_key"],
+        "exam_code": path["exam_code"],
+        "live_round_number": 2,
+        "comparison_year": 2024,
+        "comparison_round_number": 2,
+        "college_id": college["college_id"],
+        "college_name": college["name"],
+        "institute_code": college["institute_code"],
+        "institute_name": college["name"],
+        "program_code": f"P{program_index:03d}",
+        "program_name": f"Synthetic Program {program_index}",
+        "branch_option_key": f"branch_{program_index:03d}",
+        "course_type": COURSE_TYPES[program_index % len(COURSE_TYPES)],
+        "location_type": college["location_type"],
+        "state_code": college["state_code"],
+        "district": college["district"],
+        "pincode": college["pincode"],
+        "metric_type": "rank",
+        "opening_rank": Decimal(opening_rank),
+        "closing_rank": Decimal(closing_rank),
+        "cutoff_percentile": None,
+        "current_round_cutoff_value": Decimal(str(round(current_cutoff, 4))),
+        "is_projected_current_round": is_projected,
+        "round_evidence_score": Decimal(str(round(rng.uniform(0.1, 0.4) if is_cold_start else rng.uniform(0.5, 1.0), 4))),
+        "round_stability_score": Decimal(str(round(rng.uniform(0.3, 1.0), 4))),
+        "current_year_presence_score": Decimal(str(round(rng.uniform(0.0, 0.5) if is_cold_start else rng.uniform(0.6, 1.0), 4))),
+        "is_cold_start": is_cold_start,
+        "source_authority": "BENCHMARK",
+        "source_document": "synthetic",
+        "latest_year_available": 2024,
+        "latest_round_available": 2,
+        "active_policy_id": policy_id,
+        **bucket,
+    }
+
+
+def seed_read_model(args) -> Dict[str, Any]:
+    from sqlalchemy import delete, select
+    from sqlalchemy.dialects.postgresql import insert
+
+    from app.database import SessionLocal
+    from app.models import (
+        College, ExamPathCatalog, ExamPathFilterSchema, ProbabilityPolicyConfig,
+        SearchReadModel, SearchReadModelBuild,
+    )
+
+    rng = random.Random(args.seed)
+    started_at = perf_counter()
+    rows_written = 0
+
+    with SessionLocal() as db:
+        # Re-seeding replaces the previous synthetic catalogue; read-model rows and
+        # filter schema cascade from the path.
+        db.execute(delete(ExamPathCatalog).where(ExamPathCatalog.path_key.like(f"{BENCH_PATH_PREFIX}%")))
+        db.execute(delete(ProbabilityPolicyConfig).where(ProbabilityPolicyConfig.policy_key.like("bench_%")))
+        db.execute(delete(SearchReadModelBuild).where(SearchReadModelBuild.trigger_reason == "BENCHMARK"))
+
+        has_default_policy = db.execute(
+            select(ProbabilityPolicyConfig.policy_id).where(
+                ProbabilityPolicyConfig.path_id.is_(None),
+                ProbabilityPolicyConfig.is_active.is_(True),
+            ).limit(1)
+        ).scalar_one_or_none()
+        if not has_default_policy:
+            db.execute(insert(ProbabilityPolicyConfig).values(_policy_values("bench_default", None)))
+
+        colleges = []
+        for c in range(args.colleges):
+            state_code, districts = STATES[c % len(STATES)]
+            name = f"Synthetic Benchmark College {c:05d}"
+            colleges.append({
+                "college_id": uuid.uuid4(),
+                "name": name,
+                "institute_code": f"BC{c:05d}",
+                "state_code": state_code,
+                "district": districts[(c // len(STATES)) % len(districts)],
+                "pincode": f"{560001 + c % 900}",
+                "location_type": LOCATION_TYPES[0 if state_code == "KA" else 1],
+                "selectivity": rng.lognormvariate(8.0, 1.0),
+            })
+        db.execute(
+            insert(College)
+            .values([
+                {"college_id": c["college_id"], "canonical_name": c["name"],
+                 "normalized_name": c["name"].lower(), "state_code": c["state_code"]}
+                for c in colleges
+            ])
+            .on_conflict_do_nothing(constraint="uq_college_normalized_name")
+        )
+        # Re-seeding keeps the registry rows of earlier runs; reuse their ids.
+        registered = dict(db.execute(
+            select(College.normalized_name, College.college_id).where(
+                College.normalized_name.in_([c["name"].lower() for c in colleges])
+            )
+        ).all())
+        for c in colleges:
+            c["college_id"] = registered[c["name"].lower()]
+
+        build_id = uuid.uuid4()
+        db.execute(insert(SearchReadModelBuild).values(
+            build_id=build_id, status="COMPLETED", trigger_reason="BENCHMARK",
+            completed_at=datetime.now(timezone.utc), created_by="benchmark",
+        ))
+
+        paths = []
+        for p in range(args.paths):
+            path = {
+                "path_id": uuid.uuid4(),
+                "path_key": f"{BENCH_PATH_PREFIX}{p}",
+                "exam_code": f"BENCH{p}",
+            }
+            paths.append(path)
+            db.execute(insert(ExamPathCatalog).values(
+                path_id=path["path_id"], path_key=path["path_key"],
+                visible_label=f"Benchmark Path {p}", exam_family="BENCHMARK",
+                resolved_exam_code=path["exam_code"], metric_type="rank",
+                expected_max_rounds=3, supports_course_relaxation=True, display_order=900 + p,
+            ))
+            db.execute(insert(ExamPathFilterSchema).values([
+                {
+                    "path_id": path["path_id"], "filter_key": key, "filter_label": label,
+                    "control_type": control_type, "option_source": option_source,
+                    "is_required": key in ("score", "category"),
+                    "sort_order": order,
+                    "depends_on_filter_key": "state_code" if key == "district" else None,
+                }
+                for order, (key, label, control_type, option_source) in enumerate(FILTER_SCHEMA)
+            ]))
+
+            policy = _policy_values(f"bench_{path['path_key']}", path["path_id"])
+            db.execute(insert(ProbabilityPolicyConfig).values(policy))
+
+            batch: List[Dict[str, Any]] = []
+            for college in colleges:
+                for program_index in range(args.programs):
+                    for bucket_index in range(args.buckets):
+                        batch.append(_read_model_row(
+                            rng, build_id, path, college, program_index, bucket_index, policy["policy_id"]
+                        ))
+                        if len(batch) >= args.chunk_size:
+                            db.execute(insert(SearchReadModel), batch)
+                            rows_written += len(batch)
+                            batch = []
+            if batch:
+                db.execute(insert(SearchReadModel), batch)
+                rows_written += len(batch)
+            logger.info(f"  seeded {path['path_key']} ({rows_written} rows so far)")
+
+        db.execute(
+            SearchReadModelBuild.__table__.update()
+            .where(SearchReadModelBuild.build_id == build_id)
+            .values(rows_written=rows_written)
+        )
+        db.commit()
+
+    return {
+        "paths": args.paths,
+        "colleges": args.colleges,
+        "programs": args.programs,
+        "buckets": args.buckets,
+        "rows_written": rows_written,
+        "elapsed_s": round(perf_counter() - started_at, 2),
+    }
+
+
+def load_bench_paths() -> List[Dict[str, Any]]:
+    from sqlalchemy import select
+
+    from app.database import SessionLocal
+    from app.models import ExamPathCatalog
+
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(ExamPathCatalog.path_id, ExamPathCatalog.path_key)
+            .where(ExamPathCatalog.path_key.like(f"{BENCH_PATH_PREFIX}%"), ExamPathCatalog.active.is_(True))
+            .order_by(ExamPathCatalog.path_key)
+        ).all()
+    return [{"path_id": str(path_id), "path_key": path_key} for path_id, path_key in rows]
+
+
+def flush_snapshot_cache() -> int:
+    from ingestion.location_pipeline.tasks import redis_client
+    from app.domains.student_portal.college_filter_tool.services.search_snapshot_cache_service import (
+        CollegeFilterSearchSnapshotCacheService,
+    )
+
+    deleted = 0
+    for key in redis_client.scan_iter(match=f"{CollegeFilterSearchSnapshotCacheService.KEY_PREFIX}:*", count=500):
+        deleted += redis_client.delete(key)
+    return deleted
+
+
+# ==========================================================
+# TRAFFIC GENERATION
+# ==========================================================
+
+def build_student_sessions(paths: List[Dict[str, Any]], args) -> List[List[Dict[str, Any]]]:
+    """Pre-computes every student's request sequence so runs are reproducible."""
+    rng = random.Random(args.seed)
+    sessions = []
+    for _ in range(args.students):
+        requests = []
+        for _ in range(args.searches_per_student):
+            path = rng.choice(paths)
+            filters: Dict[str, Any] = {"category": rng.choice(CATEGORIES)}
+            for key, options in OPTIONAL_FILTERS.items():
+                if rng.random() < args.filter_probability:
+                    filters[key] = rng.choice(options)
+            if "state_code" in filters and rng.random() < args.filter_probability:
+                districts = dict(STATES)[filters["state_code"]]
+                filters["district"] = rng.choice(districts)
+
+            # Skewed towards competitive ranks, like real traffic.
+            score = max(1, min(MAX_RANK, int(rng.lognormvariate(9.0, 1.1))))
+            payload = {
+                "path_id": path["path_id"],
+                "score": str(score),
+                "filters": filters,
+                "page_size": args.page_size,
+                "page_by_band": {band: 1 for band in BANDS},
+            }
+            requests.append({"kind": "fresh", "payload": payload})
+
+            if rng.random() < args.repeat_ratio:
+                requests.append({"kind": "repeat", "payload": payload})
+
+            if rng.random() < args.page_ratio:
+                band = rng.choice(BANDS)
+                paged = dict(payload, page_by_band={**payload["page_by_band"], band: rng.randint(2, 4)})
+                requests.append({"kind": "page", "payload": paged})
+        sessions.append(requests)
+    return sessions
+
+
+def _fingerprint_key(payload: Dict[str, Any]) -> str:
+    # page_by_band / page_size are excluded from the snapshot fingerprint.
+    return json.dumps([payload["path_id"], payload["score"], payload["filters"]], sort_keys=True)
+
+
+async def _direct_search(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from app.database import AsyncSessionLocal
+    from app.domains.student_portal.college_filter_tool.schemas.runtime_search_schemas import (
+        CollegeFilterSearchRequest,
+    )
+    from app.domains.student_portal.college_filter_tool.services.college_filter_runtime_service import (
+        CollegeFilterRuntimeService,
+    )
+
+    request = CollegeFilterSearchRequest.model_validate(payload)
+    async with AsyncSessionLocal() as db:
+        service = CollegeFilterRuntimeService(db)
+        started_at = perf_counter()
+        await service.search(request=request)
+        latency_ms = (perf_counter() - started_at) * 1000
+    return {"latency_ms": latency_ms, **service.last_search_timings}
+
+
+async def run_load(sessions: List[List[Dict[str, Any]]], args) -> List[Dict[str, Any]]:
+    samples: List[Dict[str, Any]] = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+    seen_fingerprints = set()
+
+    client = None
+    if args.command == "http":
+        import httpx
+
+        headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+        client = httpx.AsyncClient(
+            base_url=args.base_url, headers=headers, timeout=args.timeout,
+            limits=httpx.Limits(max_connections=args.concurrency),
+        )
+
+    async def _one(request: Dict[str, Any]):
+        payload = request["payload"]
+        sample: Dict[str, Any] = {"kind": request["kind"]}
+        async with semaphore:
+            try:
+                if client is None:
+                    sample.update(await _direct_search(payload))
+                else:
+                    fingerprint = _fingerprint_key(payload)
+                    started_at = perf_counter()
+                    response = await client.post(SEARCH_ENDPOINT, json=payload)
+                    sample["latency_ms"] = (perf_counter() - started_at) * 1000
+                    sample["http_status"] = response.status_code
+                    response.raise_for_status()
+                    sample["cache_status"] = "hit" if fingerprint in seen_fingerprints else "miss"
+                    seen_fingerprints.add(fingerprint)
+            except Exception as e:
+                sample["error"] = f"{type(e).__name__}: {e}"
+        samples.append(sample)
+
+    async def _student(requests: List[Dict[str, Any]]):
+        # A student's searches are sequential; think time only between them.
+        for request in requests:
+            await _one(request)
+            if args.think_time_ms:
+                await asyncio.sleep(random.uniform(0, args.think_time_ms) / 1000)
+
+    try:
+        await asyncio.gather(*(_student(requests) for requests in sessions))
+    finally:
+        if client is not None:
+            await client.aclose()
+    return samples
+
+
+# ==========================================================
+# REPORTING
+# ==========================================================
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    # Nearest-rank percentile.
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return round(sorted_values[rank - 1], 2)
+
+
+def _summarize(values: List[float]) -> Dict[str, Any]:
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 2) if ordered else None,
+        "p50": _percentile(ordered, 50),
+        "p95": _percentile(ordered, 95),
+        "p99": _percentile(ordered, 99),
+        "max": round(ordered[-1], 2) if ordered else None,
+    }
+
+
+def build_report(samples: List[Dict[str, Any]], wall_s: float) -> Dict[str, Any]:
+    ok = [s for s in samples if "error" not in s]
+    errors = defaultdict(int)
+    for sample in samples:
+        if "error" in sample:
+            errors[sample["error"].split(":", 1)[0]] += 1
+
+    by_cache = defaultdict(list)
+    by_kind = defaultdict(list)
+    for sample in ok:
+        by_cache[sample.get("cache_status", "unknown")].append(sample["latency_ms"])
+        by_kind[sample["kind"]].append(sample["latency_ms"])
+
+    # Per-stage breakdown only exists for searches that computed a snapshot.
+    stage_values = defaultdict(list)
+    for sample in ok:
+        for stage in SNAPSHOT_STAGES + ("pagination_ms",):
+            if stage in sample:
+                stage_values[stage].append(sample[stage])
+
+    computed = [s for s in ok if "primary_query_ms" in s]
+    computed_total = sum(s["total_search_ms"] for s in computed) or 0.0
+    stages = {}
+    for stage, values in stage_values.items():
+        summary = _summarize(values)
+        if stage in SNAPSHOT_STAGES and computed_total:
+            summary["share_of_computed_total"] = round(sum(values) / computed_total, 4)
+        stages[stage] = summary
+
+    return {
+        "requests": len(samples),
+        "errors": dict(errors),
+        "wall_s": round(wall_s, 3),
+        "throughput_rps": round(len(ok) / wall_s, 2) if wall_s > 0 else None,
+        "latency_ms": _summarize([s["latency_ms"] for s in ok]),
+        "latency_by_cache_status": {status: _summarize(values) for status, values in sorted(by_cache.items())},
+        "latency_by_traffic_kind": {kind: _summarize(values) for kind, values in sorted(by_kind.items())},
+        "stages_ms": stages,
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=PROJECT_ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def compare_results(baseline_path: str, current_path: str, max_regression: float) -> int:
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    with open(current_path) as f:
+        current = json.load(f)["results"]
+
+    rows = [("overall", baseline["latency_ms"], current["latency_ms"])]
+    for status in sorted(set(baseline["latency_by_cache_status"]) & set(current["latency_by_cache_status"])):
+        rows.append((
+            f"cache:{status}",
+            baseline["latency_by_cache_status"][status],
+            current["latency_by_cache_status"][status],
+        ))
+    for stage in SNAPSHOT_STAGES:
+        if stage in baseline["stages_ms"] and stage in current["stages_ms"]:
+            rows.append((f"stage:{stage}", baseline["stages_ms"][stage], current["stages_ms"][stage]))
+
+    regressions = 0
+    print(f"{'series':<32} {'base p95':>10} {'curr p95':>10} {'delta':>8}")
+    for name, base, curr in rows:
+        base_p95 = base.get("p95") or 0
+        curr_p95 = curr.get("p95") or 0
+        delta = (curr_p95 - base_p95) / base_p95 if base_p95 else 0.0
+        flag = ""
+        # Stage rows are diagnostic; only end-to-end series gate the exit code.
+        if delta > max_regression and not name.startswith("stage:"):
+            regressions += 1
+            flag = "  <-- REGRESSION"
+        print(f"{name:<32} {base_p95:>10.2f} {curr_p95:>10.2f} {delta:>+7.1%}{flag}")
+
+    return 1 if regressions else 0
+
+
+def _require_scratch_db(args):
+    db_name = os.getenv("POSTGRES_DB", "")
+    if not args.force and not any(marker in db_name.lower() for marker in SCRATCH_DB_MARKERS):
+        print(f"❌ Refusing to run against database '{db_name}'. "
+              f"Use a scratch database (name containing {SCRATCH_DB_MARKERS}) or --force.")
+        sys.exit(2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derived Campus College-Filter Search Benchmark")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = subparsers.add_parser("seed")
+    seed_parser.add_argument("--paths", type=int, default=2)
+    seed_parser.add_argument("--colleges", type=int, default=300)
+    seed_parser.add_argument("--programs", type=int, default=12)
+    seed_parser.add_argument("--buckets", type=int, default=10)
+    seed_parser.add_argument("--chunk-size", type=int, default=5000)
+    seed_parser.add_argument("--seed", type=int, default=42)
+    seed_parser.add_argument("--create-schema", action="store_true", help="Create missing tables from the ORM models")
+    seed_parser.add_argument("--force", action="store_true", help="Allow a database name without a scratch marker")
+
+    for mode in ("direct", "http"):
+        sub = subparsers.add_parser(mode)
+        sub.add_argument("--students", type=int, default=50, help="Simulated students")
+        sub.add_argument("--searches-per-student", type=int, default=4)
+        sub.add_argument("--concurrency", type=int, default=16, help="Max in-flight searches")
+        sub.add_argument("--repeat-ratio", type=float, default=0.4, help="Chance a search is immediately repeated")
+        sub.add_argument("--page-ratio", type=float, default=0.5, help="Chance a search is followed by a page request")
+        sub.add_argument("--filter-probability", type=float, default=0.35, help="Chance each optional filter is set")
+        sub.add_argument("--page-size", type=int, default=10)
+        sub.add_argument("--think-time-ms", type=int, default=0)
+        sub.add_argument("--seed", type=int, default=7)
+        sub.add_argument("--flush-cache", action="store_true", help="Delete snapshot cache keys before the run")
+        sub.add_argument("--output", type=str, default="college_filter_search_benchmark.json")
+        if mode == "direct":
+            sub.add_argument("--force", action="store_true", help="Allow a database name without a scratch marker")
+        else:
+            sub.add_argument("--base-url", type=str, default="http://localhost:8000")
+            sub.add_argument("--token", type=str, default=os.getenv("BENCH_STUDENT_TOKEN"),
+                             help="Student bearer token (defaults to $BENCH_STUDENT_TOKEN)")
+            sub.add_argument("--timeout", type=float, default=30.0)
+
+    cmp_parser = subparsers.add_parser("compare")
+    cmp_parser.add_argument("baseline")
+    cmp_parser.add_argument("current")
+    cmp_parser.add_argument("--max-regression", type=float, default=0.15)
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(compare_results(args.baseline, args.current, args.max_regression))
+
+    if args.command == "seed":
+        _require_scratch_db(args)
+        if args.create_schema:
+            from app.database import Base, sync_engine
+            import app.models  # noqa: F401
+            Base.metadata.create_all(sync_engine)
+        logger.info(
+            f"▶ seed | {args.paths} paths x {args.colleges} colleges x "
+            f"{args.programs} programs x {args.buckets} buckets"
+        )
+        summary = seed_read_model(args)
+        print(f"✅ Seeded {summary['rows_written']} search_read_model rows in {summary['elapsed_s']}s")
+        return
+
+    if args.command == "direct":
+        _require_scratch_db(args)
+    elif not args.token:
+        print("❌ http mode needs a student bearer token (--token or $BENCH_STUDENT_TOKEN).")
+        sys.exit(2)
+
+    paths = load_bench_paths()
+    if not paths:
+        print("❌ No benchmark paths found. Run the 'seed' command first.")
+        sys.exit(2)
+
+    if args.flush_cache:
+        logger.info(f"🧹 Flushed {flush_snapshot_cache()} snapshot cache keys")
+
+    sessions = build_student_sessions(paths, args)
+    total_requests = sum(len(requests) for requests in sessions)
+    logger.info(
+        f"▶ {args.command} | {args.students} students | {total_requests} searches | "
+        f"concurrency={args.concurrency}"
+    )
+
+    started_at = perf_counter()
+    samples = asyncio.run(run_load(sessions, args))
+    results = build_report(samples, perf_counter() - started_at)
+
+    for status, summary in results["latency_by_cache_status"].items():
+        logger.info(f"  {status:<10} n={summary['count']} p50={summary['p50']} p95={summary['p95']} p99={summary['p99']} ms")
+    if results["errors"]:
+        logger.warning(f"  errors: {results['errors']}")
+
+    report = {
+        "meta": {
+            "git_revision": _git_revision(),
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "mode": args.command,
+            "cache_status_source": "service" if args.command == "direct" else "inferred_from_fingerprint",
+            "paths": [p["path_key"] for p in paths],
+            "config": {
+                key: getattr(args, key)
+                for key in (
+                    "students", "searches_per_student", "concurrency", "repeat_ratio", "page_ratio",
+                    "filter_probability", "page_size", "think_time_ms", "seed", "flush_cache",
+                )
+            },
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"✅ Wrote {len(samples)} samples to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,460 @@
+"""
+Offline Ingestion Benchmark.
+
+Runs cutoff plugins from PluginFactory against local fixture artifacts (or synthetic
+ones of configurable size) and writes machine-readable JSON so parser, ContextManager
+and fact-flush regressions can be compared across commits.
+
+Modes:
+  parse    Plugin parser only (no network, no database). Reports rows/sec, pages/sec,
+           parse time and peak RSS.
+  full     End-to-end ArtifactProcessor run against a local Postgres. Reports the
+           IngestionRun.stats flight-recorder data (per-stage timings, flush latency
+           histograms, cache hit rates) plus peak RSS.
+  compare  Diffs two result files and exits non-zero on a throughput regression.
+
+Fixtures:
+  <fixtures>/<exam_slug>/<name>.pdf|.html, with an optional <name>.json sidecar
+  ({"year": 2024, "round_number": 1, "round_name": "Round 1"}).
+  --synthetic-rows N additionally generates a JoSAA GridView HTML file and, when
+  reportlab is installed, a KCET-style PDF.
+
+Full mode writes to the configured database. Point it at a scratch database, e.g.:
+  docker compose up -d postgres
+  POSTGRES_DB=derived_bench python scripts/benchmark_ingestion.py full --create-schema \\
+      --fixtures ./bench_fixtures --output bench.json
+  python scripts/benchmark_ingestion.py compare baseline.json bench.json
+"""
+import sys
+import os
+import argparse
+import json
+import logging
+import platform
+import random
+import resource
+import subprocess
+import tempfile
+import uuid
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+# 1. Setup Paths (To allow importing from 'backend')
+CURRENT_SCRIPT_PATH = os.path.abspath(__file__)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(CURRENT_SCRIPT_PATH))
+sys.path.append(os.path.join(PROJECT_ROOT, "backend"))
+sys.path.append(PROJECT_ROOT)
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger("IngestionBenchmark")
+logger.setLevel(logging.INFO)
+
+FIXTURE_EXTENSIONS = (".pdf", ".html", ".htm")
+SCRATCH_DB_MARKERS = ("bench", "test", "scratch")
+
+
+# ==========================================================
+# FIXTURES
+# ==========================================================
+
+def discover_cases(fixtures_dir: Optional[str], exams: Optional[List[str]]) -> List[Dict[str, Any]]:
+    cases = []
+    if not fixtures_dir or not os.path.isdir(fixtures_dir):
+        return cases
+
+    for exam in sorted(os.listdir(fixtures_dir)):
+        exam_dir = os.path.join(fixtures_dir, exam)
+        if not os.path.isdir(exam_dir) or (exams and exam not in exams):
+            continue
+        for name in sorted(os.listdir(exam_dir)):
+            if not name.lower().endswith(FIXTURE_EXTENSIONS):
+                continue
+            path = os.path.join(exam_dir, name)
+            case = {"exam": exam, "path": path, "year": 2024, "round_number": 1, "round_name": "Round 1"}
+            sidecar = os.path.splitext(path)[0] + ".json"
+            if os.path.exists(sidecar):
+                with open(sidecar) as f:
+                    case.update(json.load(f))
+            cases.append(case)
+    return cases
+
+
+def generate_synthetic_cases(rows: int, output_dir: str, exams: Optional[List[str]]) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    cases = []
+
+    if not exams or "josaa" in exams:
+        path = os.path.join(output_dir, f"josaa_synthetic_{rows}.html")
+        _write_josaa_html(path, rows, rng)
+        cases.append({"exam": "josaa", "path": path, "year": 2024, "round_number": 1, "round_name": "Round 1"})
+
+    if not exams or "kcet" in exams:
+        path = os.path.join(output_dir, f"kcet_synthetic_{rows}.pdf")
+        if _write_kcet_pdf(path, rows, rng):
+            cases.append({"exam": "kcet", "path": path, "year": 2024, "round_number": 1, "round_name": "Round 1"})
+
+    return cases
+
+
+def _write_josaa_html(path: str, rows: int, rng: random.Random):
+    institutes = [
+        "Indian Institute of Technology Bombay",
+        "National Institute of Technology Karnataka, Surathkal",
+        "Indian Institute of Information Technology, Allahabad",
+        "Birla Institute of Technology, Mesra, Ranchi",
+    ]
+    programs = [
+        "Computer Science and Engineering (4 Years, Bachelor of Technology)",
+        "Electrical Engineering (4 Years, Bachelor of Technology)",
+        "Mechanical Engineering (4 Years, Bachelor of Technology)",
+    ]
+    seat_types = ["OPEN", "OBC-NCL", "SC", "ST", "EWS", "OPEN (PwD)"]
+    genders = ["Gender-Neutral", "Female-only (including Supernumerary)"]
+
+    with open(path, "w") as f:
+        f.write("<html><body><table id='ctl00_ContentPlaceHolder1_GridView1'>")
+        f.write("<tr><th>Institute</th><th>Academic Program Name</th><th>Quota</th><th>Seat Type</th>"
+                "<th>Gender</th><th>Opening Rank</th><th>Closing Rank</th></tr>")
+        for i in range(rows):
+            opening = rng.randint(1, 90000)
+            f.write(
+                f"<tr><td>{institutes[i % len(institutes)]} {i // 500}</td>"
+                f"<td>{programs[i % len(programs)]}</td><td>AI</td>"
+                f"<td>{seat_types[i % len(seat_types)]}</td><td>{genders[(i // 7) % 2]}</td>"
+                f"<td>{opening}</td><td>{opening + rng.randint(0, 5000)}</td></tr>"
+            )
+        f.write("</table></body></html>")
+
+
+def _write_kcet_pdf(path: str, rows: int, rng: random.Random) -> bool:
+    try:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    except ImportError:
+        logger.warning("reportlab is not installed; skipping synthetic KCET PDF.")
+        return False
+
+    styles = getSampleStyleSheet()
+    elements = []
+    categories = ["1G", "2AG", "GM", "SC"]
+    branches_per_college = 8
+    for college in range(max(1, rows // (branches_per_college * len(categories)))):
+        elements.append(Paragraph(f"College: E{100 + college:03d} Synthetic Engineering College {college}", styles["Normal"]))
+        elements.append(Spacer(1, 12))
+        data = [["Code", "Course Name"] + categories]
+        for branch in range(branches_per_college):
+            data.append([f"A{branch}", f"Branch {branch}"] + [
+                str(rng.randint(1, 90000)) if rng.random() > 0.2 else "--" for _ in categories
+            ])
+        table = Table(data)
+        table.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black)]))
+        elements.extend([table, Spacer(1, 20)])
+
+    SimpleDocTemplate(path, pagesize=A4).build(elements)
+    return True
+
+
+# ==========================================================
+# CASE EXECUTION (each case runs in a fresh spawned process)
+# ==========================================================
+
+def _peak_rss_mb() -> Dict[str, float]:
+    # ru_maxrss is KiB on Linux. Children covers page-extraction pool workers.
+    self_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return {"self": round(self_kb / 1024, 1), "children": round(children_kb / 1024, 1)}
+
+
+def _build_parser(plugin, path: str, artifact):
+    if hasattr(plugin, "get_parser_with_context"):
+        return plugin.get_parser_with_context(path, artifact)
+    return plugin.get_parser(path)
+
+
+def run_parse_case(case: Dict[str, Any]) -> Dict[str, Any]:
+    from ingestion.common.services.plugin_factory import PluginFactory
+    from ingestion.common.services.run_metrics import IngestionRunMetrics
+    from ingestion.cutoff_ingestion.core.page_extractor import EXTRACTION_COUNTERS
+
+    plugin = PluginFactory.get_plugin(case["exam"])
+    artifact = SimpleNamespace(
+        id=uuid.uuid4(), exam_code=case["exam"], pdf_path=case["path"],
+        year=case["year"], round_number=case["round_number"], round_name=case["round_name"],
+    )
+
+    metrics = IngestionRunMetrics(run_id="benchmark")
+    parser = _build_parser(plugin, case["path"], artifact)
+    for _ in metrics.timed_iter("parse", parser.parse()):
+        metrics.incr("rows")
+    metrics.incr("pages", EXTRACTION_COUNTERS["pages"])
+    metrics.finish()
+
+    stats = metrics.to_stats()
+    return {"ok": True, "rows": stats["counters"].get("rows", 0), "stats": stats}
+
+
+def run_full_case(case: Dict[str, Any], repeat: int, seed_passes: int) -> Dict[str, Any]:
+    from sqlalchemy import select, desc
+    from sqlalchemy.dialects.postgresql import insert
+
+    from app.database import SessionLocal
+    from app.models import (
+        CollegeCandidate, DiscoveredArtifact, ExamBranchRegistry, ExamConfiguration,
+        ExamCourseType, IngestionRun, SeatPolicyQuarantine,
+    )
+    from ingestion.common.process_artifacts import ArtifactProcessor
+    from ingestion.common.services.taxonomy_ingestion_service import TaxonomyIngestionEngine
+
+    with SessionLocal() as db:
+        db.execute(
+            insert(ExamConfiguration)
+            .values(exam_code=case["exam"], ingestion_mode="BOOTSTRAP")
+            .on_conflict_do_update(index_elements=["exam_code"], set_={"ingestion_mode": "BOOTSTRAP"})
+        )
+        db.execute(
+            insert(DiscoveredArtifact)
+            .values(
+                exam_code=case["exam"], pdf_path=case["path"], year=case["year"],
+                round_number=case["round_number"], round_name=case["round_name"],
+                detection_reason="benchmark fixture", pattern_classification="BENCHMARK",
+                detected_source="benchmark", status="APPROVED",
+            )
+            .on_conflict_do_nothing(constraint="uq_artifact_identity")
+        )
+        db.commit()
+
+        artifact = db.execute(
+            select(DiscoveredArtifact).where(
+                DiscoveredArtifact.exam_code == case["exam"],
+                DiscoveredArtifact.year == case["year"],
+                DiscoveredArtifact.pdf_path == case["path"],
+            )
+        ).scalar_one()
+
+        processor = ArtifactProcessor(db)
+
+        def _latest_run():
+            return db.execute(
+                select(IngestionRun).where(IngestionRun.artifact_id == artifact.id)
+                .order_by(desc(IngestionRun.started_at)).limit(1)
+            ).scalar_one_or_none()
+
+        # Warm-up passes promote unknown identities and taxonomy so measured runs reach the fact flush.
+        source_type = "josaa" if case["exam"] == "josaa" else case["exam"]
+        for _ in range(seed_passes):
+            processor._process_single_artifact(artifact, skip_rebuild=True)
+            run = _latest_run()
+            if not run:
+                break
+
+            for raw_name in set(db.scalars(
+                select(CollegeCandidate.raw_name).where(CollegeCandidate.ingestion_run_id == run.run_id)
+            ).all()):
+                normalized = processor.registry.normalize_name(raw_name, source_type=source_type)
+                if normalized:
+                    processor.registry.promote_candidate(db, raw_name, normalized, source_type)
+
+            for raw_row in db.scalars(
+                select(SeatPolicyQuarantine.raw_row).where(
+                    SeatPolicyQuarantine.ingestion_run_id == run.run_id,
+                    SeatPolicyQuarantine.violation_type == "UNKNOWN_TAXONOMY",
+                )
+            ).all():
+                branch = TaxonomyIngestionEngine._normalize_string((raw_row or {}).get("branch"))
+                course = TaxonomyIngestionEngine._normalize_string((raw_row or {}).get("course"))
+                try:
+                    with db.begin_nested():
+                        if branch:
+                            db.execute(insert(ExamBranchRegistry).values(
+                                exam_code=case["exam"], discipline=branch, normalized_name=branch
+                            ).on_conflict_do_nothing())
+                        if course:
+                            db.execute(insert(ExamCourseType).values(
+                                exam_code=case["exam"], canonical_name=course, normalized_name=course
+                            ).on_conflict_do_nothing())
+                except Exception as e:
+                    logger.debug(f"Taxonomy seed skipped ({branch!r}, {course!r}): {e}")
+            db.commit()
+
+        runs = []
+        for _ in range(repeat):
+            started_at = perf_counter()
+            ingested = processor._process_single_artifact(artifact, skip_rebuild=True)
+            wall = perf_counter() - started_at
+            run = _latest_run()
+            runs.append({
+                "ingested": ingested,
+                "wall_s": round(wall, 3),
+                "status": run.status if run else None,
+                "stats": dict(run.stats or {}) if run else {},
+            })
+
+    best = min(runs, key=lambda r: r["wall_s"]) if runs else {}
+    stats = best.get("stats", {})
+    return {
+        "ok": all(r["ingested"] for r in runs),
+        "rows": stats.get("counters", {}).get("rows", 0),
+        "stats": stats,
+        "runs": runs,
+    }
+
+
+def _execute_case(mode: str, case: Dict[str, Any], repeat: int, seed_passes: int) -> Dict[str, Any]:
+    started_at = perf_counter()
+    try:
+        if mode == "parse":
+            result = run_parse_case(case)
+        else:
+            result = run_full_case(case, repeat, seed_passes)
+    except Exception as e:
+        logger.exception(f"Benchmark case failed: {case['path']}")
+        result = {"ok": False, "error": str(e), "rows": 0, "stats": {}}
+
+    elapsed = perf_counter() - started_at
+    stats = result.get("stats", {})
+    measured_s = (stats.get("elapsed_ms") or elapsed * 1000) / 1000
+
+    result.update({
+        "exam": case["exam"],
+        "fixture": os.path.basename(case["path"]),
+        "fixture_bytes": os.path.getsize(case["path"]),
+        "mode": mode,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_sec": round(result["rows"] / measured_s, 2) if measured_s > 0 else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    })
+    return result
+
+
+# ==========================================================
+# REPORTING
+# ==========================================================
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=PROJECT_ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def _case_key(case: Dict[str, Any]) -> str:
+    return f"{case['mode']}:{case['exam']}:{case['fixture']}"
+
+
+def compare_results(baseline_path: str, current_path: str, max_regression: float) -> int:
+    with open(baseline_path) as f:
+        baseline = {_case_key(c): c for c in json.load(f)["cases"]}
+    with open(current_path) as f:
+        current = {_case_key(c): c for c in json.load(f)["cases"]}
+
+    regressions = 0
+    print(f"{'case':<60} {'base rows/s':>12} {'curr rows/s':>12} {'delta':>8}")
+    for key in sorted(set(baseline) & set(current)):
+        base_rps = baseline[key].get("rows_per_sec") or 0
+        curr_rps = current[key].get("rows_per_sec") or 0
+        delta = (curr_rps - base_rps) / base_rps if base_rps else 0.0
+        flag = ""
+        if delta < -max_regression:
+            regressions += 1
+            flag = "  <-- REGRESSION"
+        print(f"{key:<60} {base_rps:>12.1f} {curr_rps:>12.1f} {delta:>+7.1%}{flag}")
+
+    for key in sorted(set(baseline) ^ set(current)):
+        print(f"{key:<60} (only in {'baseline' if key in baseline else 'current'})")
+
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derived Campus Ingestion Benchmark")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for mode in ("parse", "full"):
+        sub = subparsers.add_parser(mode)
+        sub.add_argument("--fixtures", type=str, default=os.path.join(PROJECT_ROOT, "bench_fixtures"))
+        sub.add_argument("--exam", nargs="+", help="Restrict to these exam slugs")
+        sub.add_argument("--synthetic-rows", type=int, default=0, help="Generate synthetic fixtures of this size")
+        sub.add_argument("--output", type=str, default="ingestion_benchmark.json")
+        sub.add_argument("--page-cache", action="store_true", help="Keep the extracted page cache enabled")
+        if mode == "full":
+            sub.add_argument("--repeat", type=int, default=1, help="Measured runs per fixture (best is reported)")
+            sub.add_argument("--seed-passes", type=int, default=2, help="Warm-up passes that seed identities/taxonomy")
+            sub.add_argument("--create-schema", action="store_true", help="Create missing tables from the ORM models")
+            sub.add_argument("--force", action="store_true", help="Allow a database name without a scratch marker")
+
+    cmp_parser = subparsers.add_parser("compare")
+    cmp_parser.add_argument("baseline")
+    cmp_parser.add_argument("current")
+    cmp_parser.add_argument("--max-regression", type=float, default=0.15)
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(compare_results(args.baseline, args.current, args.max_regression))
+
+    # Child processes inherit the environment at spawn time.
+    if not args.page_cache:
+        os.environ["PDF_PAGE_CACHE_ENABLED"] = "false"
+
+    if args.command == "full":
+        db_name = os.getenv("POSTGRES_DB", "")
+        if not args.force and not any(marker in db_name.lower() for marker in SCRATCH_DB_MARKERS):
+            print(f"❌ Refusing to run full mode against database '{db_name}'. "
+                  f"Use a scratch database (name containing {SCRATCH_DB_MARKERS}) or --force.")
+            sys.exit(2)
+        if args.create_schema:
+            from app.database import Base, sync_engine
+            import app.models  # noqa: F401
+            Base.metadata.create_all(sync_engine)
+
+    with tempfile.TemporaryDirectory(prefix="ingestion_bench_") as synthetic_dir:
+        cases = discover_cases(args.fixtures, args.exam)
+        if args.synthetic_rows:
+            cases.extend(generate_synthetic_cases(args.synthetic_rows, synthetic_dir, args.exam))
+
+        if not cases:
+            print("❌ No fixtures found. Provide --fixtures or --synthetic-rows.")
+            sys.exit(2)
+
+        results = []
+        spawn = multiprocessing.get_context("spawn")
+        for case in cases:
+            logger.info(f"▶ {args.command} | {case['exam']} | {os.path.basename(case['path'])}")
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                result = pool.submit(
+                    _execute_case, args.command, case,
+                    getattr(args, "repeat", 1), getattr(args, "seed_passes", 0),
+                ).result()
+            results.append(result)
+            logger.info(
+                f"  rows={result['rows']} rows/s={result['rows_per_sec']} "
+                f"peak_rss={result['peak_rss_mb']['self']}MB ok={result['ok']}"
+            )
+
+    report = {
+        "meta": {
+            "git_revision": _git_revision(),
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "mode": args.command,
+            "page_cache": bool(args.page_cache),
+        },
+        "cases": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"✅ Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
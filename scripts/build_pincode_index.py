@@ -0,0 +1,58 @@
+"""
+Pincode Index Builder.
+
+Compiles ingestion/assets/pincodes.json into the memory-mapped pincodes.idx read by
+PincodeResolver (sorted fixed-width records + interned district / state tables).
+Run it as a deploy / image-build step so workers never compile on boot:
+  python scripts/build_pincode_index.py
+  python scripts/build_pincode_index.py --source /data/pincodes.json --output /data/pincodes.idx --verify
+"""
+import sys
+import os
+import argparse
+import time
+from pathlib import Path
+
+CURRENT_SCRIPT_PATH = os.path.abspath(__file__)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(CURRENT_SCRIPT_PATH))
+sys.path.append(PROJECT_ROOT)
+
+from ingestion.location_pipeline.core.pincode_index import PincodeIndex, build_pincode_index, iter_pincode_json
+from ingestion.location_pipeline.core.pincode_resolver import (
+    STATE_MAP_CONSTANT,
+    PINCODE_JSON_PATH,
+    PINCODE_INDEX_PATH,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derived Campus Pincode Index Builder")
+    parser.add_argument("--source", type=Path, default=PINCODE_JSON_PATH, help="pincodes.json array")
+    parser.add_argument("--output", type=Path, default=PINCODE_INDEX_PATH, help="Compiled index path")
+    parser.add_argument("--verify", action="store_true", help="Re-read the JSON and check every PIN against the index")
+    args = parser.parse_args()
+
+    if not args.source.exists():
+        print(f"❌ Source dataset not found: {args.source}")
+        sys.exit(1)
+
+    started_at = time.perf_counter()
+    count = build_pincode_index(iter_pincode_json(args.source, STATE_MAP_CONSTANT), args.output)
+    elapsed = time.perf_counter() - started_at
+    print(f"✅ Compiled {count} PIN codes -> {args.output} ({args.output.stat().st_size / 1024:.0f} KiB, {elapsed:.2f}s)")
+
+    if args.verify:
+        index = PincodeIndex(args.output)
+        expected = {}
+        for pin, district, state_code in iter_pincode_json(args.source, STATE_MAP_CONSTANT):
+            expected.setdefault(pin, {"district": district, "state_code": state_code})
+        mismatches = [pin for pin, row in expected.items() if index.lookup(pin) != row]
+        index.close()
+        if mismatches:
+            print(f"❌ {len(mismatches)} PIN(s) differ from the JSON dataset, e.g. {mismatches[:5]}")
+            sys.exit(1)
+        print(f"✅ Verified {len(expected)} PIN codes against the source.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Import-Time Budget Check.
+
+Imports each startup entry point (API app, Celery task modules, CLI dependencies,
+scan-only plugin resolution) in a fresh interpreter and fails when:
+  - a forbidden heavy module is loaded (the PDF stack must stay out of anything
+    that only scans or serves HTTP), or
+  - the cold import exceeds its wall-clock budget (--scale multiplies all budgets
+    for slow CI runners; --no-timing checks the module sets only).
+
+Run from the repo root (inside the backend container / venv):
+  python scripts/check_import_budget.py
+  python scripts/check_import_budget.py --only plugin_factory scan_plugins --verbose
+"""
+import sys
+import os
+import argparse
+import json
+import subprocess
+from typing import Any, Dict, List
+
+CURRENT_SCRIPT_PATH = os.path.abspath(__file__)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(CURRENT_SCRIPT_PATH))
+
+PDF_STACK = ("pdfplumber", "pdfminer", "pypdfium2", "fitz")
+PARSER_STACK = PDF_STACK + ("bs4", "lxml")
+
+# name -> code executed in a clean interpreter, top-level packages it must not load, budget (ms)
+CHECKS: Dict[str, Dict[str, Any]] = {
+    "plugin_factory": {
+        "code": "import ingestion.common.services.plugin_factory",
+        "forbidden": PARSER_STACK + ("httpx", "tenacity", "requests"),
+        "budget_ms": 150,
+    },
+    "plugin_registry_listing": {
+        "code": (
+            "from ingestion.common.services.plugin_factory import PluginFactory\n"
+            "PluginFactory.list_available_plugins()"
+        ),
+        "forbidden": PARSER_STACK + ("httpx", "tenacity", "requests"),
+        "budget_ms": 200,
+    },
+    "scan_plugins": {
+        # What a scan-only worker does: resolve each plugin and build its scanner.
+        "code": (
+            "from ingestion.common.services.plugin_factory import PluginFactory\n"
+            "for slug in PluginFactory.list_available_plugins():\n"
+            "    PluginFactory.get_plugin(slug).get_scanner()"
+        ),
+        "forbidden": PDF_STACK,
+        "budget_ms": 2500,
+    },
+    "celery_ingestion_tasks": {
+        "code": "import ingestion.tasks",
+        "forbidden": PDF_STACK,
+        "budget_ms": 3000,
+    },
+    "artifact_processor": {
+        "code": "import ingestion.common.process_artifacts",
+        "forbidden": PDF_STACK,
+        "budget_ms": 4000,
+    },
+    "backend_api": {
+        "code": "import app.main",
+        "forbidden": PDF_STACK,
+        "budget_ms": 6000,
+    },
+}
+
+CHILD_TEMPLATE = """
+import sys, json
+from time import perf_counter
+sys.path[:0] = {paths!r}
+started_at = perf_counter()
+exec(compile({code!r}, "<import-budget>", "exec"))
+elapsed_ms = (perf_counter() - started_at) * 1000
+forbidden = set({forbidden!r})
+loaded = sorted({{name for name in sys.modules if name.split(".")[0] in forbidden}})
+print("__BUDGET__" + json.dumps({{"elapsed_ms": round(elapsed_ms, 1), "loaded": loaded, "modules": len(sys.modules)}}))
+"""
+
+
+def run_check(name: str, check: Dict[str, Any]) -> Dict[str, Any]:
+    child = CHILD_TEMPLATE.format(
+        paths=[os.path.join(PROJECT_ROOT, "backend"), PROJECT_ROOT],
+        code=check["code"],
+        forbidden=tuple(check["forbidden"]),
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", child],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("__BUDGET__"):
+            return {"name": name, "ok": True, **json.loads(line[len("__BUDGET__"):])}
+    return {"name": name, "ok": False, "error": (proc.stderr or proc.stdout).strip().splitlines()[-1:]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derived Campus Import-Time Budget Check")
+    parser.add_argument("--only", nargs="+", choices=sorted(CHECKS), help="Run only these checks")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every time budget")
+    parser.add_argument("--no-timing", action="store_true", help="Only enforce forbidden modules")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for name in args.only or CHECKS:
+        check = CHECKS[name]
+        result = run_check(name, check)
+        budget_ms = check["budget_ms"] * args.scale
+
+        if not result["ok"]:
+            failures.append(f"{name}: import failed")
+            print(f"❌ {name:<26} import failed")
+            for line in result["error"]:
+                print(f"     - {line}")
+            continue
+
+        problems = []
+        if result["loaded"]:
+            problems.append(f"loaded forbidden modules {result['loaded'][:8]}")
+        if not args.no_timing and result["elapsed_ms"] > budget_ms:
+            problems.append(f"{result['elapsed_ms']}ms > budget {budget_ms:.0f}ms")
+
+        status = "❌" if problems else "✅"
+        print(f"{status} {name:<26} {result['elapsed_ms']:>8.1f}ms  ({result['modules']} modules)")
+        if args.verbose or problems:
+            for problem in problems:
+                print(f"     - {problem}")
+        failures.extend(f"{name}: {problem}" for problem in problems)
+
+    if failures:
+        print(f"\n{len(failures)} import budget violation(s).")
+        sys.exit(1)
+    print("\nAll import budgets respected.")
+
+
+if __name__ == "__main__":
+    main()